@@ -0,0 +1,172 @@
+import time
+import random
+from typing import List, Dict, Tuple, Optional, Sequence
+from bin_packing import BinPacking
+
+
+class ImprovementTrace:
+    """
+    Pencatat event perbaikan incumbent selama solver berjalan
+
+    Solver memanggil count(k) setiap mengevaluasi k solusi dan improve(score) setiap
+    punya skor baru; hanya skor yang lebih baik dari incumbent yang dicatat sebagai
+    event (waktu sejak start, jumlah evaluasi, skor incumbent).
+    Solver boleh menyertakan state-nya (improve(score, state)); state terbaik disimpan
+    di best_state (hanya referensi), jadi run yang dihentikan di tengah jalan
+    (SolveInterrupted) tetap punya solusi terbaiknya.
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.evaluations = 0
+        self.best_score = float('inf')
+        self.best_state = None
+        self.events: List[Tuple[float, int, float]] = []
+
+    def count(self, evaluations: int = 1):
+        self.evaluations += evaluations
+
+    def improve(self, score: float, state=None):
+        if score < self.best_score:
+            self.best_score = score
+            if state is not None:
+                self.best_state = state
+            self.events.append((time.perf_counter() - self.start, self.evaluations, score))
+
+    def incumbent_at(self, elapsed: float) -> float:
+        """Skor incumbent pada waktu elapsed (inf kalo belum ada solusi)"""
+        best = float('inf')
+        for event_time, _, score in self.events:
+            if event_time > elapsed:
+                break
+            best = score
+        return best
+
+    def time_to_target(self, target: float) -> float:
+        """Waktu pertama kali incumbent <= target (inf kalo tidak pernah tercapai)"""
+        for event_time, _, score in self.events:
+            if score <= target:
+                return event_time
+        return float('inf')
+
+
+class SolveInterrupted(Exception):
+    """Dilempar DeadlineTrace dari dalam solver saat run harus dihentikan"""
+
+
+class DeadlineTrace(ImprovementTrace):
+    """
+    ImprovementTrace yang sekalian mengecek deadline (waktu absolut time.time())
+    dan stop_event opsional setiap check_every evaluasi; kalo salah satunya
+    terpenuhi, SolveInterrupted dilempar sehingga run berhenti di tengah jalan
+    """
+
+    def __init__(self, deadline: float, stop_event=None, check_every: int = 256):
+        super().__init__()
+        self.deadline = deadline
+        self.stop_event = stop_event
+        self.check_every = check_every
+        self._next_check = check_every
+
+    def count(self, evaluations: int = 1):
+        super().count(evaluations)
+        if self.evaluations >= self._next_check:
+            self._next_check = self.evaluations + self.check_every
+            if time.time() >= self.deadline or (self.stop_event is not None and self.stop_event.is_set()):
+                raise SolveInterrupted()
+
+
+def ttt_ecdf(traces: Sequence[ImprovementTrace], target: float) -> Tuple[List[float], List[float]]:
+    """
+    ECDF time-to-target dari beberapa run (seed)
+
+    Returns:
+        waktu terurut (hanya run yang mencapai target), probabilitas kumulatif
+        (dibagi jumlah SEMUA run, jadi run yang gagal membuat kurva tidak mencapai 1)
+    """
+    times = sorted(t for t in (trace.time_to_target(target) for trace in traces) if t != float('inf'))
+    return times, [(i + 1) / len(traces) for i in range(len(times))]
+
+
+def anytime_profile(traces: Sequence[ImprovementTrace], grid: Sequence[float]) -> Dict[str, List[float]]:
+    """
+    Profil anytime: median dan kuartil skor incumbent antar run di setiap titik waktu grid
+    Titik di mana sebagian run belum punya solusi diisi inf
+    """
+    profile = {'time': list(grid), 'median': [], 'q25': [], 'q75': []}
+    for elapsed in grid:
+        values = sorted(trace.incumbent_at(elapsed) for trace in traces)
+        n = len(values)
+        profile['median'].append(values[n // 2])
+        profile['q25'].append(values[n // 4])
+        profile['q75'].append(values[min(n - 1, (3 * n) // 4)])
+    return profile
+
+
+def run_anytime_comparison(bp: BinPacking, seeds: Sequence[int]) -> Dict[str, List[ImprovementTrace]]:
+    """
+    Jalankan varian HC, SA dan GA pada instance yang sama untuk setiap seed,
+    masing-masing dengan ImprovementTrace sendiri
+    """
+    # import di sini supaya anytime bisa dipakai solver tanpa import melingkar
+    from hill_climbing import (steepest_ascent_hill_climbing, stochastic_hill_climbing,
+                               sideways_move_hill_climbing, random_restart_hill_climbing)
+    from simulated_annealing import simulated_annealing
+    from genetic_algorithm import genetic_algorithm
+
+    runners = {
+        'Steepest Ascent': lambda trace: steepest_ascent_hill_climbing(bp, bp.initial_state_random_worst(), max_iterations=500, trace=trace),
+        'Stochastic': lambda trace: stochastic_hill_climbing(bp, bp.initial_state_random_worst(), max_iterations=500, trace=trace),
+        'Sideways Move': lambda trace: sideways_move_hill_climbing(bp, bp.initial_state_random_worst(), max_iterations=500, trace=trace),
+        'Random Restart': lambda trace: random_restart_hill_climbing(bp, max_restarts=10, max_iterations_per_restart=100, trace=trace),
+        'Simulated Annealing': lambda trace: simulated_annealing(bp, bp.initial_state_random_worst(), trace=trace),
+        'Genetic Algorithm': lambda trace: genetic_algorithm(bp, trace=trace),
+    }
+
+    traces = {name: [] for name in runners}
+    for seed in seeds:
+        for name, runner in runners.items():
+            random.seed(seed)
+            trace = ImprovementTrace()
+            runner(trace)
+            traces[name].append(trace)
+
+    return traces
+
+
+def write_anytime_report(traces: Dict[str, List[ImprovementTrace]], filename: str = 'anytime_report',
+                         target: Optional[float] = None, grid_points: int = 200) -> Dict:
+    """
+    Bangun laporan time-to-target + profil anytime dan simpan plotnya
+
+    Args:
+        traces: nama algoritma -> list trace (satu per seed)
+        target: Skor target; default skor terbaik yang ditemukan semua algoritma
+        grid_points: Jumlah titik waktu untuk profil anytime
+
+    Returns:
+        Ringkasan per algoritma: tingkat keberhasilan, median TTT, ECDF dan profil
+    """
+    from visualizer import plot_time_to_target, plot_anytime_profiles
+
+    all_traces = [trace for runs in traces.values() for trace in runs]
+    if target is None:
+        target = min(trace.best_score for trace in all_traces)
+
+    horizon = max((trace.events[-1][0] for trace in all_traces if trace.events), default=0.0)
+    grid = [horizon * i / (grid_points - 1) for i in range(grid_points)]
+
+    report = {'target': target}
+    for name, runs in traces.items():
+        times, probabilities = ttt_ecdf(runs, target)
+        reached = sorted(trace.time_to_target(target) for trace in runs)
+        report[name] = {
+            'success_rate': len(times) / len(runs),
+            'median_ttt': reached[len(reached) // 2],
+            'ecdf': (times, probabilities),
+            'profile': anytime_profile(runs, grid),
+        }
+
+    plot_time_to_target({name: report[name]['ecdf'] for name in traces}, target, f'{filename}_ttt')
+    plot_anytime_profiles({name: report[name]['profile'] for name in traces}, f'{filename}_profile')
+    return report
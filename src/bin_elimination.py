@@ -0,0 +1,291 @@
+import time
+from bisect import bisect_left, insort
+from typing import List, Dict, Tuple, Optional
+from bin_packing import BinPacking
+from objective_function import calculate_objective
+from anytime import ImprovementTrace
+
+
+class BinEliminator:
+    """
+    Mesin eliminasi kontainer (ejection chain + subset fill ala Minimum Bin Slack)
+
+    Menghapus satu kontainer butuh rantai move yang masing-masing terlihat netral
+    atau lebih buruk di fungsi objektif, jadi HC/SA jarang berhasil. Di sini satu
+    percobaan eliminasi:
+    1. ambil kontainer dengan isi paling sedikit, keluarkan semua itemnya
+    2. masukkan item bebas (terbesar dulu) ke kontainer best fit lewat indeks sisa
+       kapasitas (bisect)
+    3. kalo tidak ada yang muat: ejection chain, tukar item bebas dengan item yang
+       lebih kecil di kontainer lain, item yang terlempar jadi item bebas baru
+    4. kalo budget ejection habis: isi kontainer dengan subset item bebas yang
+       paling mendekati sisa kapasitasnya (MBS, DFS terbatas)
+    Semua perpindahan dicatat di journal, jadi kalo gagal cukup dibalik (tanpa
+    menyalin state).
+
+    State dianggap valid (tanpa overflow); kontainer yang overflow tidak pernah
+    dipakai sebagai tujuan.
+    """
+
+    def __init__(self, bp: BinPacking, state: List[List[str]], max_ejections: int = 50,
+                 ejection_scan: int = 50, mbs_node_limit: int = 2000):
+        if bp.vector:
+            raise ValueError("eliminasi kontainer hanya mendukung instance 1 dimensi")
+        self.bp = bp
+        self.kapasitas = bp.kapasitas
+        self.max_ejections = max_ejections
+        self.ejection_scan = ejection_scan
+        self.mbs_node_limit = mbs_node_limit
+
+        self.bins = [list(bin_items) for bin_items in state if bin_items]
+        self.loads = [bp.get_bin_size(bin_items) for bin_items in self.bins]
+        self.location = {item: idx for idx, bin_items in enumerate(self.bins) for item in bin_items}
+        self._residual_index = sorted((self.kapasitas - load, idx) for idx, load in enumerate(self.loads))
+        self._excluded = None
+
+    # ------------------------------------------------------------------
+    # Operasi dasar (selalu menjaga indeks sisa kapasitas tetap konsisten)
+    # ------------------------------------------------------------------
+
+    def _index_remove(self, idx: int):
+        if idx != self._excluded:
+            entry = (self.kapasitas - self.loads[idx], idx)
+            del self._residual_index[bisect_left(self._residual_index, entry)]
+
+    def _index_add(self, idx: int):
+        if idx != self._excluded:
+            insort(self._residual_index, (self.kapasitas - self.loads[idx], idx))
+
+    def _move(self, item: str, src: int, dest: int):
+        size = self.bp.barang[item]
+        self._index_remove(src)
+        self._index_remove(dest)
+        self.bins[src].remove(item)
+        self.bins[dest].append(item)
+        self.loads[src] -= size
+        self.loads[dest] += size
+        self.location[item] = dest
+        self._index_add(src)
+        self._index_add(dest)
+
+    def _best_fit(self, size: int) -> Optional[int]:
+        """Kontainer dengan sisa kapasitas terkecil yang masih muat"""
+        pos = bisect_left(self._residual_index, (size, -1))
+        return self._residual_index[pos][1] if pos < len(self._residual_index) else None
+
+    # ------------------------------------------------------------------
+    # Langkah eliminasi
+    # ------------------------------------------------------------------
+
+    def _eject(self, item: str, placed: set) -> Optional[Tuple[int, str]]:
+        """
+        Cari kontainer di mana item bisa masuk dengan mengeluarkan satu item yang
+        lebih kecil (bukan item yang sudah ditempatkan di percobaan ini).
+        Dipilih yang menyisakan slack paling kecil.
+        """
+        size = self.bp.barang[item]
+        best = None
+        best_slack = None
+
+        # mulai dari kontainer dengan sisa terbesar (paling mungkin cukup setelah ejection)
+        for residual, idx in reversed(self._residual_index[-self.ejection_scan:]):
+            if residual < 0:
+                continue
+            for other in self.bins[idx]:
+                other_size = self.bp.barang[other]
+                if other in placed or other_size >= size:
+                    continue
+                slack = residual + other_size - size
+                if slack >= 0 and (best_slack is None or slack < best_slack):
+                    best, best_slack = (idx, other), slack
+                    if slack == 0:
+                        return best
+        return best
+
+    def _mbs_subset(self, residual: int, candidates: List[Tuple[int, str]]) -> List[str]:
+        """
+        Subset item bebas dengan total paling mendekati residual (tanpa melebihi)
+        DFS dengan candidates terurut menurun, dibatasi mbs_node_limit node
+        """
+        best_items: List[str] = []
+        best_sum = 0
+        chosen: List[str] = []
+        nodes = 0
+
+        def search(start: int, total: int):
+            nonlocal best_items, best_sum, nodes
+            if total > best_sum:
+                best_sum, best_items = total, list(chosen)
+            if best_sum == residual or nodes >= self.mbs_node_limit:
+                return
+            for pos in range(start, len(candidates)):
+                size, item = candidates[pos]
+                if total + size > residual:
+                    continue
+                nodes += 1
+                chosen.append(item)
+                search(pos + 1, total + size)
+                chosen.pop()
+                if best_sum == residual or nodes >= self.mbs_node_limit:
+                    return
+
+        search(0, 0)
+        return best_items
+
+    def try_eliminate(self, target: int) -> Tuple[bool, int]:
+        """
+        Coba kosongkan kontainer target
+
+        Returns:
+            berhasil, jumlah item yang dievaluasi (untuk trace)
+        """
+        barang = self.bp.barang
+        journal = []  # (item, asal, tujuan)
+
+        self._index_remove(target)
+        self._excluded = target
+        free = sorted(self.bins[target], key=lambda item: barang[item])  # terbesar di ujung
+        placed = set()
+        ejections = 0
+        evaluated = 0
+
+        while free:
+            item = free.pop()
+            evaluated += 1
+            dest = self._best_fit(barang[item])
+            if dest is not None:
+                self._move(item, self.location[item], dest)
+                journal.append((item, target, dest))
+                placed.add(item)
+                continue
+
+            if ejections < self.max_ejections:
+                found = self._eject(item, placed)
+                if found is not None:
+                    dest, ejected = found
+                    ejections += 1
+                    # item terlempar parkir di kontainer target (yang sedang dikosongkan)
+                    self._move(ejected, dest, target)
+                    journal.append((ejected, dest, target))
+                    self._move(item, target, dest)
+                    journal.append((item, target, dest))
+                    placed.add(item)
+                    free.insert(bisect_left([barang[f] for f in free], barang[ejected]), ejected)
+                    continue
+
+            # fallback MBS: isi kontainer dengan sisa terbesar pakai subset item bebas
+            free.append(item)
+            for residual, idx in reversed(list(self._residual_index)):
+                if not free or residual < min(barang[f] for f in free):
+                    break
+                candidates = sorted(((barang[f], f) for f in free), reverse=True)
+                subset = self._mbs_subset(residual, candidates)
+                evaluated += len(candidates)
+                for chosen in subset:
+                    self._move(chosen, target, idx)
+                    journal.append((chosen, target, idx))
+                    placed.add(chosen)
+                    free.remove(chosen)
+            break
+
+        if not free and not self.bins[target]:
+            self._excluded = None
+            self._remove_bin(target)
+            return True, evaluated
+
+        # gagal: balik semua perpindahan (target masih dikecualikan dari indeks)
+        for item, src, dest in reversed(journal):
+            self._move(item, dest, src)
+        self._excluded = None
+        self._index_add(target)
+        return False, evaluated
+
+    def _remove_bin(self, target: int):
+        """Hapus kontainer kosong (diganti kontainer terakhir supaya indeks lain tetap)"""
+        last = len(self.bins) - 1
+        if target != last:
+            self._index_remove(last)
+            self.bins[target], self.loads[target] = self.bins[last], self.loads[last]
+            for item in self.bins[target]:
+                self.location[item] = target
+            self.bins.pop()
+            self.loads.pop()
+            self._index_add(target)
+        else:
+            self.bins.pop()
+            self.loads.pop()
+
+    def state(self) -> List[List[str]]:
+        return [list(bin_items) for bin_items in self.bins]
+
+
+def eliminate_bins(
+    bp: BinPacking,
+    initial_state: List[List[str]],
+    max_attempts: Optional[int] = None,
+    max_ejections: int = 50,
+    mbs_node_limit: int = 2000,
+    time_limit: Optional[float] = None,
+    trace: Optional[ImprovementTrace] = None
+) -> Tuple[List[List[str]], float, List[float], int]:
+    """
+    Local search eliminasi kontainer (bisa standalone atau post-processing)
+
+    Kontainer dicoba dikosongkan mulai dari yang paling sedikit isinya. Setelah
+    eliminasi berhasil, semua kontainer boleh dicoba lagi; pencarian berhenti
+    kalo semua kontainer gagal sejak eliminasi terakhir, max_attempts tercapai,
+    atau time_limit habis.
+
+    Contoh post-processing:
+        state = simulated_annealing(bp, bp.initial_state_first_fit())[0]
+        state, score, _, _ = eliminate_bins(bp, state)
+
+    Args:
+        bp: Instance BinPacking
+        initial_state: State awal (valid)
+        max_attempts: Batas percobaan eliminasi (default tanpa batas)
+        max_ejections: Batas ejection per percobaan
+        mbs_node_limit: Batas node DFS subset fill per kontainer
+        time_limit: Batas waktu dalam detik
+        trace: ImprovementTrace opsional
+
+    Returns:
+        best_state, best_score, history (skor setiap eliminasi berhasil), eliminated
+    """
+    eliminator = BinEliminator(bp, initial_state, max_ejections=max_ejections, mbs_node_limit=mbs_node_limit)
+    score = calculate_objective(eliminator.bins, bp.kapasitas, bp.barang)
+    if trace is not None:
+        trace.count()
+        trace.improve(score)
+
+    history = [score]
+    eliminated = 0
+    attempts = 0
+    deadline = time.perf_counter() + time_limit if time_limit is not None else None
+    exhausted = False
+
+    # percobaan gagal di-rollback penuh, jadi di antara dua eliminasi berhasil state
+    # tidak berubah dan urutan kontainer (paling sedikit isinya dulu) cukup dihitung sekali
+    while not exhausted and len(eliminator.bins) > 1:
+        exhausted = True
+        for target in sorted(range(len(eliminator.bins)), key=lambda idx: eliminator.loads[idx]):
+            if (max_attempts is not None and attempts >= max_attempts) or \
+                    (deadline is not None and time.perf_counter() >= deadline):
+                break
+
+            success, evaluated = eliminator.try_eliminate(target)
+            attempts += 1
+            if trace is not None:
+                trace.count(evaluated)
+
+            if success:
+                eliminated += 1
+                score = calculate_objective(eliminator.bins, bp.kapasitas, bp.barang)
+                history.append(score)
+                if trace is not None:
+                    trace.improve(score)
+                exhausted = False
+                break
+
+    state = eliminator.state()
+    return state, calculate_objective(state, bp.kapasitas, bp.barang), history, eliminated
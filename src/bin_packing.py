@@ -1,8 +1,12 @@
 import random
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
 import copy
+from objective_function import calculate_objective
 
 class BinPacking:
+    # True untuk instance vektor (lihat vector_packing.VectorBinPacking)
+    vector = False
+
     def __init__(self, kapasitas: int, barang: Dict[str, int]):
         """
         Inisialisasi Bin Packing Problem
@@ -13,11 +17,12 @@ class BinPacking:
         self.kapasitas = kapasitas
         self.barang = barang
         self.item_ids = list(barang.keys())
+        self._size_index = None
     
     def initial_state_random(self) -> List[List[str]]:
         """Generate state awal secara random"""
         state = []
-        items = self.item_ids.copy()
+        items = list(self.item_ids)
         random.shuffle(items)
         
         for item in items:
@@ -86,7 +91,7 @@ class BinPacking:
         Ini memberi Hill Climbing lebih banyak ruang untuk improvement
         """
         state = []
-        items = self.item_ids.copy()
+        items = list(self.item_ids)
         random.shuffle(items)  # shuffle untuk randomness
         
         for item in items:
@@ -105,7 +110,7 @@ class BinPacking:
             return self.initial_state_worst()
         
         state = []
-        items = self.item_ids.copy()
+        items = list(self.item_ids)
         random.shuffle(items)
         
         for item in items:
@@ -127,6 +132,29 @@ class BinPacking:
         current_size = sum(self.barang[i] for i in bin_items)
         return current_size + self.barang[item] <= self.kapasitas
     
+    def fits(self, load) -> bool:
+        """Cek apakah total ukuran load masih dalam kapasitas"""
+        return load <= self.kapasitas
+    
+    def get_size_index(self) -> List[Tuple[int, str]]:
+        """
+        Daftar (ukuran, item_id) terurut berdasarkan ukuran
+        Ukuran item tidak pernah berubah, jadi cukup dibangun sekali lalu di-cache
+        """
+        if self._size_index is None:
+            self._size_index = sorted((self.barang[item], item) for item in self.item_ids)
+        return self._size_index
+    
+    def objective(self, state: List[List[str]]) -> float:
+        """Nilai objektif state (dipakai solver supaya juga jalan untuk instance vektor)"""
+        return calculate_objective(state, self.kapasitas, self.barang)
+    
+    def neighbor_sampler(self, state: List[List[str]]):
+        """NeighborSampler untuk state ini (subclass vektor mengembalikan versi NumPy)"""
+        # import di sini: neighbor_sampler meng-import bin_packing
+        from neighbor_sampler import NeighborSampler
+        return NeighborSampler(self, state)
+    
     def get_bin_size(self, bin_items: List[str]) -> int:
         """Dapatkan total ukuran item dalam bin"""
         return sum(self.barang[item] for item in bin_items)
@@ -243,4 +271,17 @@ class BinPacking:
                 return new_state
         
         # kalo tidak ada tetangga valid, return state asli
-        return copy.deepcopy(state)
\ No newline at end of file
+        return copy.deepcopy(state)
+
+
+def make_bin_packing(kapasitas, barang: Dict, dimensi: Optional[List[str]] = None) -> BinPacking:
+    """
+    Buat instance dari data JSON: BinPacking biasa kalo kapasitas berupa angka,
+    VectorBinPacking kalo kapasitas berupa list (satu nilai per dimensi, ukuran
+    barang juga list dengan panjang sama)
+    """
+    if isinstance(kapasitas, (list, tuple)):
+        # NumPy hanya di-load untuk instance vektor
+        from vector_packing import VectorBinPacking
+        return VectorBinPacking(kapasitas, barang, dimensi)
+    return BinPacking(kapasitas, barang)
@@ -0,0 +1,108 @@
+import sys
+import struct
+import numpy as np
+from typing import Optional, Sequence
+from utils import stream_load_data
+from shared_instance import BinPackingView
+
+# Layout file (.bpi, little-endian):
+#   header  : magic 'BPI1' | kapasitas int64 | jumlah item int64 | flag ids int64
+#   sizes   : int32[n]
+#   ids     : (opsional) offset int64[n+1] + string id UTF-8 yang digabung
+# Array sizes dan offset dibuka dengan numpy.memmap, jadi tidak ada yang dibaca
+# ke memori sampai benar-benar diakses.
+MAGIC = b'BPI1'
+HEADER = struct.Struct('<4sqqq')
+
+
+class BinaryInstance:
+    """Instance bin packing dari file biner yang dibuka dengan numpy.memmap"""
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            magic, kapasitas, num_items, has_ids = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} bukan file instance biner (magic {magic!r})")
+
+        self.path = path
+        self.kapasitas = int(kapasitas)
+        self.num_items = int(num_items)
+        self.sizes = np.memmap(path, dtype='<i4', mode='r', offset=HEADER.size, shape=(self.num_items,))
+
+        self._offsets = None
+        self._blob_offset = None
+        if has_ids:
+            offsets_offset = HEADER.size + 4 * self.num_items
+            self._offsets = np.memmap(path, dtype='<i8', mode='r', offset=offsets_offset, shape=(self.num_items + 1,))
+            self._blob_offset = offsets_offset + 8 * (self.num_items + 1)
+
+    def has_ids(self) -> bool:
+        return self._offsets is not None
+
+    def item_id(self, idx: int) -> str:
+        """Id asli item ke-idx (dibaca langsung dari file)"""
+        if self._offsets is None:
+            return str(idx)
+        start, end = int(self._offsets[idx]), int(self._offsets[idx + 1])
+        with open(self.path, 'rb') as f:
+            f.seek(self._blob_offset + start)
+            return f.read(end - start).decode('utf-8')
+
+    def item_ids(self) -> list:
+        """Semua id item (membaca tabel id sekaligus, hanya untuk output)"""
+        if self._offsets is None:
+            return [str(idx) for idx in range(self.num_items)]
+        offsets = np.asarray(self._offsets)
+        with open(self.path, 'rb') as f:
+            f.seek(self._blob_offset)
+            blob = f.read(int(offsets[-1]))
+        return [blob[offsets[idx]:offsets[idx + 1]].decode('utf-8') for idx in range(self.num_items)]
+
+    def to_bin_packing(self) -> BinPackingView:
+        """
+        BinPackingView zero-copy di atas memmap
+        barang[idx] lewat memoryview mengembalikan int Python biasa
+        """
+        return BinPackingView(self.kapasitas, memoryview(self.sizes))
+
+
+def save_binary_instance(path: str, kapasitas: int, sizes: Sequence[int], ids: Optional[Sequence[str]] = None):
+    """Tulis instance ke format biner"""
+    sizes_array = np.asarray(sizes, dtype=np.int64)
+    # sizes di file berupa int32; cast langsung akan wrap diam-diam
+    if len(sizes_array) > 0 and (sizes_array.min() <= 0 or sizes_array.max() > np.iinfo(np.int32).max):
+        raise ValueError(f"ukuran barang harus di rentang 1..{np.iinfo(np.int32).max} untuk format biner")
+    sizes_array = sizes_array.astype('<i4')
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, kapasitas, len(sizes_array), 1 if ids is not None else 0))
+        f.write(sizes_array.tobytes())
+
+        if ids is not None:
+            encoded = [str(item).encode('utf-8') for item in ids]
+            offsets = np.zeros(len(encoded) + 1, dtype='<i8')
+            np.cumsum([len(raw) for raw in encoded], out=offsets[1:])
+            f.write(offsets.tobytes())
+            f.write(b''.join(encoded))
+
+
+def load_binary_instance(path: str) -> BinaryInstance:
+    """Buka instance biner (zero-copy)"""
+    return BinaryInstance(path)
+
+
+def convert_json_to_binary(json_path: str, out_path: str, include_ids: bool = True):
+    """
+    Konversi instance JSON (kapasitas_kontainer/barang) ke format biner
+    JSON dibaca streaming, jadi instance yang lebih besar dari memori untuk
+    json.load tetap bisa dikonversi
+    """
+    kapasitas, sizes, ids = stream_load_data(json_path, include_ids=include_ids)
+    save_binary_instance(out_path, kapasitas, sizes, ids)
+
+
+if __name__ == "__main__":
+    # python src/binary_instance.py data/input.json data/input.bpi
+    if len(sys.argv) != 3:
+        print("Usage: python src/binary_instance.py <input.json> <output.bpi>")
+        sys.exit(1)
+    convert_json_to_binary(sys.argv[1], sys.argv[2])
@@ -0,0 +1,223 @@
+import math
+from typing import Dict, Optional, Type
+
+# Jadwal pendinginan simulated annealing
+#
+# Semua jadwal berbagi siklus yang sama:
+# - start(): temperatur awal, dikalibrasi dari sampel delta kalo T_initial=None
+# - update(delta, accepted) dipanggil SA setiap iterasi; temperatur baru turun
+#   setelah satu "level" selesai: equilibrium_length iterasi, atau lebih cepat
+#   kalo sudah max_accepted move diterima (fase panas tidak perlu selama fase dingin)
+# - frozen() kalo T <= T_min
+# Parameter laju (alpha, beta) yang tidak diisi diturunkan dari budget iterasi,
+# jadi T mencapai T_min tepat di akhir max_iterations, bukan setelah ~180 iterasi
+# seperti T_min=0.1, alpha=0.95 yang tetap.
+
+
+def calibrate_temperature(sampler, acceptance: float = 0.8, samples: int = 200, iterations: int = 20) -> Optional[float]:
+    """
+    Temperatur awal supaya rata-rata probabilitas menerima move yang memperburuk
+    sekitar `acceptance` (metode Ben-Ameur): mulai dari -mean(delta)/ln(acceptance)
+    lalu diperbaiki secara iteratif terhadap sampel delta positif.
+
+    Move diambil dari sampler (NeighborSampler) tanpa diterapkan.
+
+    Returns:
+        Temperatur awal, atau None kalo tidak ada move yang memperburuk di sampel
+    """
+    current = sampler.score()
+    deltas = []
+    for _ in range(samples):
+        move = sampler.sample()
+        if move is not None:
+            delta = sampler.evaluate(move) - current
+            if delta > 0:
+                deltas.append(delta)
+    if not deltas:
+        return None
+
+    T = -(sum(deltas) / len(deltas)) / math.log(acceptance)
+    for _ in range(iterations):
+        estimated = sum(math.exp(-delta / T) for delta in deltas) / len(deltas)
+        if abs(estimated - acceptance) < 1e-3 or estimated <= 0:
+            break
+        T *= math.log(estimated) / math.log(acceptance)
+    return T
+
+
+class CoolingSchedule:
+    """
+    Interface jadwal pendinginan (subclass cukup meng-override _next_temperature)
+
+    Args:
+        T_initial: Temperatur awal (None = kalibrasi otomatis lewat calibrate_temperature)
+        T_min: Temperatur minimum (kondisi berhenti)
+        equilibrium_length: Jumlah iterasi per level temperatur
+        max_accepted: Level selesai lebih cepat setelah sekian move diterima (None = tidak dipakai)
+        initial_acceptance: Target probabilitas menerima move memburuk saat kalibrasi
+        calibration_samples: Jumlah move yang disampel untuk kalibrasi
+    """
+
+    def __init__(self, T_initial: Optional[float] = None, T_min: float = 0.1, equilibrium_length: int = 1,
+                 max_accepted: Optional[int] = None, initial_acceptance: float = 0.8, calibration_samples: int = 200):
+        self.T_initial = T_initial
+        self.T_min = T_min
+        self.equilibrium_length = max(1, equilibrium_length)
+        self.max_accepted = max_accepted
+        self.initial_acceptance = initial_acceptance
+        self.calibration_samples = calibration_samples
+
+        self.T = T_initial
+        self.T0 = T_initial
+        self.level = 0
+        self.num_levels = 1
+
+    def start(self, sampler=None, max_iterations: int = 1000) -> float:
+        """Reset jadwal untuk satu run SA dan kembalikan temperatur awal"""
+        T0 = self.T_initial
+        if T0 is None:
+            T0 = calibrate_temperature(sampler, self.initial_acceptance, self.calibration_samples) if sampler is not None else None
+            if T0 is None:
+                # tidak ada move yang memperburuk: temperatur tidak berpengaruh
+                T0 = 1.0
+        self.T0 = self.T = T0
+        self.level = 0
+        self.num_levels = max(1, max_iterations // self.equilibrium_length)
+        self._reset_level()
+        self._prepare()
+        return self.T
+
+    def _reset_level(self):
+        self._level_iterations = 0
+        self._level_accepted = 0
+        self._uphill = 0
+        self._uphill_accepted = 0
+
+    def update(self, delta: float, accepted: bool) -> float:
+        """Dipanggil SA setiap iterasi; temperatur hanya berubah di akhir level"""
+        self._level_iterations += 1
+        if accepted:
+            self._level_accepted += 1
+        if delta > 0:
+            self._uphill += 1
+            if accepted:
+                self._uphill_accepted += 1
+
+        if self._level_iterations >= self.equilibrium_length or \
+                (self.max_accepted is not None and self._level_accepted >= self.max_accepted):
+            self.T = self._next_temperature()
+            self.level += 1
+            self._reset_level()
+        return self.T
+
+    def uphill_acceptance(self) -> Optional[float]:
+        """Rasio move memburuk yang diterima di level saat ini (None kalo belum ada)"""
+        return self._uphill_accepted / self._uphill if self._uphill else None
+
+    def reheat(self, factor: float) -> float:
+        """Naikkan temperatur (maksimal temperatur awal)"""
+        self.T = min(self.T * factor, self.T0)
+        return self.T
+
+    def frozen(self) -> bool:
+        return self.T <= self.T_min
+
+    def _prepare(self):
+        """Hitung parameter turunan setelah T0 dan jumlah level diketahui"""
+        pass
+
+    def _next_temperature(self) -> float:
+        raise NotImplementedError
+
+
+class GeometricCooling(CoolingSchedule):
+    """
+    T <- alpha * T setiap level
+    alpha=None: alpha = (T_min / T0)^(1 / jumlah level), T_min tercapai di akhir budget
+    """
+
+    def __init__(self, alpha: Optional[float] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.alpha = alpha
+        self._alpha = alpha
+
+    def _prepare(self):
+        if self.alpha is not None:
+            self._alpha = self.alpha
+        elif self.T0 > self.T_min:
+            self._alpha = (self.T_min / self.T0) ** (1.0 / self.num_levels)
+        else:
+            self._alpha = 1.0
+
+    def _next_temperature(self) -> float:
+        return self.T * self._alpha
+
+
+class LundyMeesCooling(CoolingSchedule):
+    """
+    Lundy & Mees: T <- T / (1 + beta * T) setiap level
+    Turun cepat saat panas dan sangat pelan saat dingin (lebih banyak iterasi di
+    rentang temperatur rendah tempat perbaikan terjadi).
+    beta=None: beta = (T0 - T_min) / (jumlah level * T0 * T_min), T_min tercapai di akhir budget
+    """
+
+    def __init__(self, beta: Optional[float] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.beta = beta
+        self._beta = beta
+
+    def _prepare(self):
+        if self.beta is not None:
+            self._beta = self.beta
+        elif self.T0 > self.T_min:
+            self._beta = (self.T0 - self.T_min) / (self.num_levels * self.T0 * self.T_min)
+        else:
+            self._beta = 0.0
+
+    def _next_temperature(self) -> float:
+        return self.T / (1.0 + self._beta * self.T)
+
+
+class AdaptiveCooling(CoolingSchedule):
+    """
+    Pendinginan berdasarkan target rasio penerimaan move memburuk
+
+    Target turun eksponensial dari target_start ke target_end sepanjang budget.
+    Di akhir tiap level rasio penerimaan move memburuk diukur: kalo di atas target
+    T diturunkan, kalo di bawah T dinaikkan, dengan faktor exp(gain * (target - rasio))
+    yang dibatasi ke [1/max_factor, max_factor]. Move netral (delta 0, misal swap)
+    tidak dihitung karena selalu diterima di temperatur berapapun.
+    """
+
+    def __init__(self, target_start: float = 0.5, target_end: float = 0.001, gain: float = 5.0,
+                 max_factor: float = 2.0, equilibrium_length: int = 50, **kwargs):
+        super().__init__(equilibrium_length=equilibrium_length, **kwargs)
+        self.target_start = target_start
+        self.target_end = target_end
+        self.gain = gain
+        self.max_factor = max_factor
+
+    def target(self) -> float:
+        progress = min(1.0, self.level / self.num_levels)
+        return self.target_start * (self.target_end / self.target_start) ** progress
+
+    def _next_temperature(self) -> float:
+        measured = self.uphill_acceptance()
+        if measured is None:
+            return self.T
+        factor = math.exp(self.gain * (self.target() - measured))
+        return self.T * min(self.max_factor, max(1.0 / self.max_factor, factor))
+
+
+SCHEDULES: Dict[str, Type[CoolingSchedule]] = {
+    'geometric': GeometricCooling,
+    'lundy_mees': LundyMeesCooling,
+    'adaptive': AdaptiveCooling,
+}
+
+
+def make_schedule(name: str, **kwargs) -> CoolingSchedule:
+    """Buat jadwal dari nama (misal dari parameter JSON solve.py/tuner)"""
+    if name not in SCHEDULES:
+        raise ValueError(f"jadwal pendinginan tidak dikenal: {name}")
+    return SCHEDULES[name](**kwargs)
@@ -0,0 +1,192 @@
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Tuple, Optional
+from bin_packing import BinPacking
+from objective_function import calculate_objective
+from hill_climbing import sampled_hill_climbing
+from simulated_annealing import simulated_annealing, simulated_annealing_with_reheating
+from genetic_algorithm import genetic_algorithm
+
+ALGORITHMS = ('sa', 'sa_reheat', 'hc', 'ga', 'ga_permutation')
+
+
+def decomposition_solver(
+    bp: BinPacking,
+    algorithm: str = 'sa',
+    num_chunks: Optional[int] = None,
+    n_workers: Optional[int] = None,
+    algorithm_params: Optional[Dict] = None,
+    repair_bins_per_chunk: int = 5,
+    repair_iterations: int = 5000,
+    iterations_per_item: int = 20,
+    seed: Optional[int] = None
+) -> Tuple[List[List[str]], float, List[int]]:
+    """
+    Solver dekomposisi untuk instance sangat besar (100k+ item)
+
+    Langkah:
+    1. Bagi item menjadi chunk yang seimbang ukurannya
+    2. Selesaikan tiap chunk secara paralel di worker process dengan algoritma yang dipilih
+    3. Gabungkan hasilnya, lalu perbaiki "batas" antar chunk: kontainer paling kosong
+       dari setiap chunk dikumpulkan dan dioptimasi ulang bersama dengan local search
+
+    Args:
+        bp: Instance BinPacking
+        algorithm: Algoritma per chunk ('sa', 'sa_reheat', 'hc', 'ga', 'ga_permutation')
+        num_chunks: Jumlah chunk (default: jumlah worker)
+        n_workers: Jumlah worker process (default: os.cpu_count()), 1 = tanpa pool
+        algorithm_params: Parameter tambahan untuk algoritma per chunk (menimpa default di bawah)
+        repair_bins_per_chunk: Jumlah kontainer paling kosong per chunk yang ikut diperbaiki
+        repair_iterations: Iterasi maksimum SA untuk tahap perbaikan batas
+        iterations_per_item: Budget iterasi SA/HC per chunk = iterations_per_item * jumlah item chunk
+            (SA default: T awal dikalibrasi dan alpha diturunkan dari budget, lihat cooling.py)
+        seed: Seed random; seed tiap chunk diturunkan dari random.Random(seed) lokal,
+            jadi RNG global pemanggil tidak diubah
+
+    Returns:
+        best_state, best_score, bins_per_chunk
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"algorithm tidak dikenal: {algorithm}")
+    if bp.vector:
+        # partisi mengurutkan ukuran skalar, perbaikan batas & skor juga 1 dimensi
+        raise ValueError("dekomposisi hanya mendukung instance 1 dimensi")
+
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    if num_chunks is None:
+        num_chunks = n_workers
+    num_chunks = max(1, min(num_chunks, len(bp.item_ids)))
+
+    rng = random.Random(seed)
+
+    # 1. Partisi
+    chunks = partition_items(bp, num_chunks)
+    tasks = [
+        (bp.kapasitas, {item: bp.barang[item] for item in chunk}, algorithm,
+         {**chunk_defaults(algorithm, len(chunk), iterations_per_item), **(algorithm_params or {})},
+         rng.randrange(2**31))
+        for chunk in chunks
+    ]
+
+    # solver memakai RNG global: di process ini state-nya disimpan lalu dikembalikan,
+    # jadi pemanggil tidak terpengaruh seed chunk
+    saved_random_state = random.getstate()
+    try:
+        # 2. Selesaikan tiap chunk (paralel)
+        if n_workers > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=min(n_workers, len(tasks))) as executor:
+                chunk_states = list(executor.map(_solve_chunk, tasks))
+        else:
+            chunk_states = [_solve_chunk(task) for task in tasks]
+
+        bins_per_chunk = [len(state) for state in chunk_states]
+
+        # 3. Gabungkan + perbaiki batas antar chunk
+        random.seed(rng.randrange(2**31))
+        merged = boundary_repair(bp, chunk_states, repair_bins_per_chunk, repair_iterations)
+    finally:
+        random.setstate(saved_random_state)
+    return merged, calculate_objective(merged, bp.kapasitas, bp.barang), bins_per_chunk
+
+
+def partition_items(bp: BinPacking, num_chunks: int) -> List[List[str]]:
+    """
+    Bagi item menjadi num_chunks chunk yang seimbang
+    Item diurutkan dari yang terbesar lalu dibagikan secara zig-zag (snake),
+    jadi tiap chunk punya total ukuran dan distribusi ukuran yang mirip
+    """
+    ordered = sorted(bp.item_ids, key=lambda item: bp.barang[item], reverse=True)
+    chunks = [[] for _ in range(num_chunks)]
+
+    for pos, item in enumerate(ordered):
+        round_idx, offset = divmod(pos, num_chunks)
+        chunk_idx = offset if round_idx % 2 == 0 else num_chunks - 1 - offset
+        chunks[chunk_idx].append(item)
+
+    return [chunk for chunk in chunks if len(chunk) > 0]
+
+
+def chunk_defaults(algorithm: str, num_items: int, iterations_per_item: int) -> Dict:
+    """
+    Parameter default per chunk
+    SA dengan T_min=0.1, alpha=0.95 tetap berhenti setelah ~180 iterasi berapapun
+    ukuran chunk, jadi budget iterasi dibuat sebanding dengan jumlah item dan jadwal
+    geometrik diturunkan dari budget tersebut (T_min tercapai di akhir budget)
+    """
+    budget = max(1000, iterations_per_item * num_items)
+    if algorithm in ('sa', 'sa_reheat'):
+        return {'max_iterations': budget, 'schedule': 'geometric'}
+    if algorithm == 'hc':
+        return {'max_iterations': budget}
+    return {}
+
+
+def _solve_chunk(task: Tuple) -> List[List[str]]:
+    """Worker: selesaikan satu chunk dengan algoritma yang dipilih"""
+    kapasitas, barang, algorithm, params, seed = task
+    random.seed(seed)
+    bp = BinPacking(kapasitas, barang)
+    return run_algorithm(bp, algorithm, params)
+
+
+def run_algorithm(bp: BinPacking, algorithm: str, params: Dict) -> List[List[str]]:
+    """Jalankan salah satu algoritma yang sudah ada dan kembalikan state terbaiknya"""
+    return run_algorithm_result(bp, algorithm, params)[0]
+
+
+def run_algorithm_result(bp: BinPacking, algorithm: str, params: Dict) -> Tuple:
+    """
+    Sama dengan run_algorithm tapi mengembalikan tuple hasil solver apa adanya
+    (state, skor, history, ...), misal untuk mencatat history ke results store
+    """
+    if algorithm == 'sa':
+        return simulated_annealing(bp, bp.initial_state_first_fit(), **params)
+    if algorithm == 'sa_reheat':
+        return simulated_annealing_with_reheating(bp, bp.initial_state_first_fit(), **params)
+    if algorithm == 'hc':
+        # get_neighbors membangun O(n^2) tetangga per iterasi, terlalu mahal untuk chunk besar
+        return sampled_hill_climbing(bp, bp.initial_state_first_fit(), **params)
+    if algorithm == 'ga':
+        return genetic_algorithm(bp, **params)
+    if algorithm == 'ga_permutation':
+        # NumPy hanya di-load kalo GA permutasi benar-benar dipakai
+        from permutation_ga import genetic_algorithm_permutation
+        return genetic_algorithm_permutation(bp, **params)
+    raise ValueError(f"algorithm tidak dikenal: {algorithm}")
+
+
+def boundary_repair(bp: BinPacking, chunk_states: List[List[List[str]]], bins_per_chunk: int, max_iterations: int) -> List[List[str]]:
+    """
+    Gabungkan hasil chunk lalu optimasi ulang kontainer paling kosong dari tiap chunk
+
+    Kontainer yang hampir kosong di chunk berbeda sering bisa digabung, tapi tiap
+    chunk tidak bisa melihatnya. Kontainer-kontainer tersebut dijadikan sub-problem
+    baru, diselesaikan dengan SA (mulai dari susunan saat ini), dan hasilnya hanya
+    dipakai kalo lebih baik.
+    """
+    kept = []
+    boundary = []
+
+    for state in chunk_states:
+        ordered = sorted(state, key=bp.get_bin_size)
+        boundary.extend(list(bin_items) for bin_items in ordered[:bins_per_chunk])
+        kept.extend(list(bin_items) for bin_items in ordered[bins_per_chunk:])
+
+    if len(boundary) < 2:
+        return kept + boundary
+
+    sub_barang = {item: bp.barang[item] for bin_items in boundary for item in bin_items}
+    sub_bp = BinPacking(bp.kapasitas, sub_barang)
+    before = calculate_objective(boundary, bp.kapasitas, sub_barang)
+
+    # alpha dipilih supaya T baru mencapai T_min di akhir budget iterasi
+    T_initial, T_min = 1000.0, 0.1
+    alpha = (T_min / T_initial) ** (1.0 / max(1, max_iterations))
+    repaired, score, _, _, _ = simulated_annealing(sub_bp, boundary, T_initial=T_initial, T_min=T_min, alpha=alpha, max_iterations=max_iterations)
+
+    if score < before:
+        boundary = repaired
+
+    return kept + boundary
@@ -0,0 +1,79 @@
+import numpy as np
+from typing import Sequence, Tuple
+
+
+def lttb_downsample(values: Sequence[float], num_out: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Downsampling Largest-Triangle-Three-Buckets (LTTB)
+
+    Titik pertama dan terakhir selalu dipertahankan. Sisanya dibagi menjadi
+    num_out - 2 bucket, dan dari tiap bucket dipilih titik yang membentuk
+    segitiga terbesar dengan titik terpilih sebelumnya dan rata-rata bucket
+    berikutnya. Titik ekstrem (lonjakan, titik terendah) dan plateau jadi tetap
+    terlihat walaupun jumlah titiknya jauh berkurang.
+
+    Luas segitiga dalam satu bucket dihitung vektorial dengan NumPy; loop Python
+    hanya sebanyak jumlah bucket, jadi biayanya tidak bergantung panjang riwayat
+    selain satu kali lewat data.
+
+    Returns:
+        x (indeks iterasi asli), y
+    """
+    y = np.asarray(values, dtype=float)
+    n = len(y)
+    x = np.arange(n, dtype=float)
+
+    if num_out >= n or num_out < 3:
+        return x, y
+
+    # batas bucket untuk titik 1..n-2
+    edges = np.linspace(1, n - 1, num_out - 1).astype(np.int64)
+    starts, ends = edges[:-1], edges[1:]
+
+    # rata-rata tiap bucket (dipakai sebagai titik C untuk bucket sebelumnya)
+    cumsum = np.concatenate(([0.0], np.cumsum(y)))
+    counts = np.maximum(ends - starts, 1)
+    avg_y = (cumsum[ends] - cumsum[starts]) / counts
+    avg_x = (starts + ends - 1) / 2.0
+    next_x = np.append(avg_x[1:], n - 1)
+    next_y = np.append(avg_y[1:], y[-1])
+
+    selected = np.empty(num_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    a = 0
+    for bucket in range(num_out - 2):
+        lo, hi = starts[bucket], max(ends[bucket], starts[bucket] + 1)
+        ax, ay = x[a], y[a]
+        area = np.abs((ax - next_x[bucket]) * (y[lo:hi] - ay) - (ax - x[lo:hi]) * (next_y[bucket] - ay))
+        a = lo + int(area.argmax())
+        selected[bucket + 1] = a
+
+    # pastikan minimum dan maksimum global ikut terpilih (ganti wakil bucket-nya)
+    for extreme in (int(y.argmin()), int(y.argmax())):
+        if 0 < extreme < n - 1:
+            bucket = int(np.searchsorted(starts, extreme, side='right')) - 1
+            selected[bucket + 1] = extreme
+
+    return x[selected], y[selected]
+
+
+def minmax_envelope(values: Sequence[float], num_buckets: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Envelope min/max per bucket (vektorial dengan reduceat)
+
+    Returns:
+        x (tengah bucket), nilai minimum, nilai maksimum
+    """
+    y = np.asarray(values, dtype=float)
+    n = len(y)
+    num_buckets = max(1, min(num_buckets, n))
+
+    starts = np.linspace(0, n, num_buckets, endpoint=False).astype(np.int64)
+    starts = np.unique(starts)
+    ends = np.append(starts[1:], n)
+
+    lower = np.minimum.reduceat(y, starts)
+    upper = np.maximum.reduceat(y, starts)
+    return (starts + ends - 1) / 2.0, lower, upper
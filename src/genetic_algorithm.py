@@ -1,8 +1,14 @@
+import math
 import random
-import copy
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
 from bin_packing import BinPacking
-from objective_function import calculate_objective, calculate_fitness
+from persistent_state import freeze, thaw
+from anytime import ImprovementTrace
+from progress import ProgressObserver
+from simulated_annealing import simulated_annealing
+from bin_elimination import eliminate_bins
+
+LOCAL_SEARCH_METHODS = ('hc', 'sa', 'elim')
 
 def genetic_algorithm(
     bp: BinPacking,
@@ -10,11 +16,26 @@ def genetic_algorithm(
     generations: int = 100,
     mutation_rate: float = 0.1,
     crossover_rate: float = 0.8,
-    elitism: int = 2
+    elitism: int = 2,
+    seed_states: Optional[List[List[List[str]]]] = None,
+    trace: Optional[ImprovementTrace] = None,
+    local_search_rate: float = 0.0,
+    local_search: str = 'sa',
+    local_search_iterations: int = 50,
+    lamarckian: bool = True,
+    n_workers: int = 1,
+    observer: Optional[ProgressObserver] = None
 ) -> Tuple[List[List[str]], float, List[float], List[float]]:
     """
     Algoritma: Genetika untuk Bin Packing
     
+    Mode memetic (local_search_rate > 0): setiap generasi sebagian keturunan
+    diperhalus dengan local search singkat ('hc' = first-improvement HC, 'sa' = SA
+    bertemperatur rendah, 'elim' = eliminasi kontainer). Lamarckian: hasil local
+    search menggantikan individu; Baldwinian: individu tetap, hanya skornya yang
+    memakai hasil local search. Dengan n_workers > 1 local search dijalankan di
+    process pool.
+    
     Args:
         bp: Instance BinPacking
         population_size: Jumlah individu dalam populasi
@@ -22,93 +43,221 @@ def genetic_algorithm(
         mutation_rate: Probabilitas mutasi
         crossover_rate: Probabilitas crossover
         elitism: Jumlah individu terbaik yang dipertahankan
+        seed_states: State awal (misal hasil warm start) yang dimasukkan ke populasi awal
+        trace: ImprovementTrace opsional untuk mencatat event perbaikan
+        local_search_rate: Fraksi keturunan per generasi yang diperhalus (0 = GA biasa)
+        local_search: Metode local search ('hc', 'sa', 'elim')
+        local_search_iterations: Budget iterasi local search per individu
+        lamarckian: True = Lamarckian, False = Baldwinian
+        n_workers: Jumlah worker process untuk local search (1 = tanpa pool)
+        observer: ProgressObserver opsional untuk event progres (per generasi)
     
     Returns:
         best_state, best_score, best_history, avg_history
     """
     # Inisialisasi populasi
-    population = [bp.initial_state_random() for _ in range(population_size)]
+    # Individu disimpan sebagai PersistentState (immutable), jadi seleksi dan
+    # elitisme cukup memakai referensi tanpa deepcopy
+    population = [freeze(state) for state in (seed_states or [])][:population_size]
+    while len(population) < population_size:
+        population.append(freeze(bp.initial_state_random()))
+    
+    if local_search not in LOCAL_SEARCH_METHODS:
+        raise ValueError(f"local_search tidak dikenal: {local_search}")
+    
+    # skor & state hasil local search (Baldwinian), sejajar dengan population; None = hitung biasa
+    learned_scores = [None] * len(population)
+    learned_states = [None] * len(population)
+    # hasil local search terbaik, supaya solusi Baldwinian tidak hilang
+    best_refined, best_refined_score = None, float('inf')
+    
+    executor = None
+    if local_search_rate > 0 and n_workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(max_workers=n_workers, initializer=_init_local_search_worker,
+                                       initargs=(bp,))
     
     best_history = []
     avg_history = []
+    if observer is not None:
+        observer.start('genetic_algorithm')
     
-    for generation in range(generations):
-        # Evaluasi fitness
-        fitness_scores = []
-        objective_scores = []
+    # pool local search selalu ditutup, juga kalo run dihentikan di tengah jalan
+    # (SolveInterrupted dari DeadlineTrace) atau ada exception lain
+    try:
+        for generation in range(generations):
+            # Evaluasi fitness
+            fitness_scores = []
+            objective_scores = []
         
-        for individual in population:
-            obj_score = calculate_objective(individual, bp.kapasitas, bp.barang)
-            fit_score = calculate_fitness(individual, bp.kapasitas, bp.barang)
-            objective_scores.append(obj_score)
-            fitness_scores.append(fit_score)
+            for individual, learned in zip(population, learned_scores):
+                # fitness = 1 / objektif (sama dengan calculate_fitness, tanpa menghitung objektif dua kali)
+                obj_score = learned if learned is not None else bp.objective(individual)
+                objective_scores.append(obj_score)
+                fitness_scores.append(1.0 / obj_score if obj_score != 0 else float('inf'))
         
-        # Lacak statistik
-        best_history.append(min(objective_scores))
-        avg_history.append(sum(objective_scores) / len(objective_scores))
+            # Lacak statistik
+            best_history.append(min(objective_scores))
+            if trace is not None:
+                trace.count(len(objective_scores))
+                best_idx = objective_scores.index(best_history[-1])
+                # skor Baldwinian milik hasil local search individu itu, bukan individunya
+                trace.improve(best_history[-1], population[best_idx] if learned_scores[best_idx] is None else learned_states[best_idx])
+            avg_history.append(sum(objective_scores) / len(objective_scores))
+            if observer is not None:
+                observer.update(generation, min(best_history), len(objective_scores), current=best_history[-1])
         
-        # Seleksi + Crossover + Mutasi
-        new_population = []
+            # Seleksi + Crossover + Mutasi
+            new_population = []
+            new_learned = []
+            new_learned_states = []
         
-        # Elitisme: pertahankan individu terbaik
-        if elitism > 0:
-            elite_indices = sorted(range(len(objective_scores)), 
-                                 key=lambda i: objective_scores[i])[:elitism]
-            for idx in elite_indices:
-                new_population.append(copy.deepcopy(population[idx]))
+            # Elitisme: pertahankan individu terbaik
+            if elitism > 0:
+                elite_indices = sorted(range(len(objective_scores)), 
+                                     key=lambda i: objective_scores[i])[:elitism]
+                for idx in elite_indices:
+                    new_population.append(population[idx])
+                    new_learned.append(learned_scores[idx])
+                    new_learned_states.append(learned_states[idx])
+            num_elites = len(new_population)
         
-        # Generate keturunan
-        while len(new_population) < population_size:
-            # Seleksi
-            parent1 = tournament_selection(population, fitness_scores)
-            parent2 = tournament_selection(population, fitness_scores)
+            # Generate keturunan
+            while len(new_population) < population_size:
+                # Seleksi
+                parent1 = tournament_selection(population, fitness_scores)
+                parent2 = tournament_selection(population, fitness_scores)
             
-            # Crossover
-            if random.random() < crossover_rate:
-                child1, child2 = crossover(parent1, parent2, bp)
-            else:
-                child1, child2 = copy.deepcopy(parent1), copy.deepcopy(parent2)
+                # Crossover
+                if random.random() < crossover_rate:
+                    child1, child2 = crossover(parent1, parent2, bp)
+                else:
+                    child1, child2 = parent1, parent2
             
-            # Mutasi
-            if random.random() < mutation_rate:
-                child1 = mutate(child1, bp)
-            if random.random() < mutation_rate:
-                child2 = mutate(child2, bp)
+                # Mutasi
+                if random.random() < mutation_rate:
+                    child1 = mutate(child1, bp)
+                if random.random() < mutation_rate:
+                    child2 = mutate(child2, bp)
             
-            new_population.append(child1)
-            if len(new_population) < population_size:
-                new_population.append(child2)
+                new_population.append(child1)
+                if len(new_population) < population_size:
+                    new_population.append(child2)
+        
+            population = new_population[:population_size]
+            learned_scores = new_learned + [None] * (len(population) - len(new_learned))
+            learned_states = new_learned_states + [None] * (len(population) - len(new_learned_states))
         
-        population = new_population[:population_size]
+            # Memetic: local search untuk sebagian keturunan (elite tidak disentuh)
+            offspring = list(range(num_elites, len(population)))
+            num_refined = min(len(offspring), math.ceil(local_search_rate * len(offspring))) if local_search_rate > 0 else 0
+            if num_refined > 0:
+                chosen = random.sample(offspring, num_refined)
+                tasks = [(population[idx], local_search, local_search_iterations, random.randrange(2**31)) for idx in chosen]
+                if executor is not None:
+                    refined = list(executor.map(_refine_task, tasks))
+                else:
+                    refined = [refine_individual(bp, state, method, iterations) for state, method, iterations, _ in tasks]
+            
+                for idx, (state, score) in zip(chosen, refined):
+                    if lamarckian:
+                        population[idx] = freeze(state)
+                    else:
+                        learned_scores[idx] = score
+                        learned_states[idx] = state
+                    if score < best_refined_score:
+                        best_refined, best_refined_score = state, score
+                if trace is not None:
+                    trace.count(num_refined * local_search_iterations)
+                    trace.improve(best_refined_score, best_refined)
+    
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
     
     # Kembalikan individu terbaik
-    final_scores = [calculate_objective(ind, bp.kapasitas, bp.barang) for ind in population]
+    final_scores = [bp.objective(ind) for ind in population]
     best_idx = final_scores.index(min(final_scores))
-    best_state = population[best_idx]
+    if trace is not None:
+        trace.count(len(final_scores))
+        trace.improve(final_scores[best_idx], population[best_idx])
+    best_state = thaw(population[best_idx])
     best_score = final_scores[best_idx]
     
+    if best_refined is not None and best_refined_score < best_score:
+        best_state, best_score = thaw(best_refined), best_refined_score
+    if observer is not None:
+        observer.finish(generations, best_score)
+    
     return best_state, best_score, best_history, avg_history
 
 
+# bp milik worker local search (di-set sekali oleh initializer pool)
+_LOCAL_SEARCH_BP = None
+
+
+def _init_local_search_worker(bp: BinPacking):
+    global _LOCAL_SEARCH_BP
+    _LOCAL_SEARCH_BP = bp
+
+
+def _refine_task(task: Tuple) -> Tuple[List[List[str]], float]:
+    """Worker: local search untuk satu individu dengan seed sendiri"""
+    state, method, iterations, seed = task
+    random.seed(seed)
+    return refine_individual(_LOCAL_SEARCH_BP, state, method, iterations)
+
+
+def refine_individual(bp: BinPacking, state: List[List[str]], method: str = 'sa', iterations: int = 50) -> Tuple[List[List[str]], float]:
+    """
+    Local search terbatas untuk satu individu (dipakai mode memetic)
+    
+    Returns:
+        state hasil, skor
+    """
+    if method == 'hc':
+        # first-improvement HC atas tetangga feasible hasil sampling (bukan
+        # stochastic_hill_climbing yang membangkitkan SEMUA tetangga tiap iterasi);
+        # move yang tidak memperburuk diterima supaya bisa berjalan di plateau
+        sampler = bp.neighbor_sampler(state)
+        for _ in range(iterations):
+            move = sampler.sample(move_prob=0.5, new_bin_prob=0.0)
+            if move is not None and sampler.evaluate(move) <= sampler.score():
+                sampler.apply(move)
+        return thaw(sampler.snapshot()), sampler.score()
+    elif method == 'sa':
+        # temperatur rendah: cukup untuk keluar dari plateau tanpa merusak individu
+        T_initial, T_min = 10.0, 0.1
+        alpha = (T_min / T_initial) ** (1.0 / max(1, iterations))
+        result = simulated_annealing(bp, thaw(state), T_initial=T_initial, T_min=T_min, alpha=alpha, max_iterations=iterations)
+    elif method == 'elim':
+        result = eliminate_bins(bp, thaw(state), max_attempts=iterations)
+    else:
+        raise ValueError(f"local_search tidak dikenal: {method}")
+    return result[0], result[1]
+
+
 def tournament_selection(population: List, fitness_scores: List[float], tournament_size: int = 3) -> List[List[str]]:
     """
     Seleksi Turnamen
     Pilih individu terbaik dari subset acak
+    Individu dikembalikan sebagai referensi (tanpa copy), jangan dimodifikasi in-place
     """
     tournament_indices = random.sample(range(len(population)), tournament_size)
     best_idx = max(tournament_indices, key=lambda i: fitness_scores[i])
-    return copy.deepcopy(population[best_idx])
+    return population[best_idx]
 
 
 def roulette_wheel_selection(population: List, fitness_scores: List[float]) -> List[List[str]]:
     """
     Seleksi Roulette Wheel
     Probabilitas proporsional terhadap fitness
+    Individu dikembalikan sebagai referensi (tanpa copy), jangan dimodifikasi in-place
     """
     total_fitness = sum(fitness_scores)
     
     if total_fitness == 0:
-        return copy.deepcopy(random.choice(population))
+        return random.choice(population)
     
     pick = random.uniform(0, total_fitness)
     current = 0
@@ -116,9 +265,9 @@ def roulette_wheel_selection(population: List, fitness_scores: List[float]) -> L
     for individual, fitness in zip(population, fitness_scores):
         current += fitness
         if current >= pick:
-            return copy.deepcopy(individual)
+            return individual
     
-    return copy.deepcopy(population[-1])
+    return population[-1]
 
 
 def crossover(parent1: List[List[str]], parent2: List[List[str]], bp: BinPacking) -> Tuple[List[List[str]], List[List[str]]]:
@@ -127,7 +276,7 @@ def crossover(parent1: List[List[str]], parent2: List[List[str]], bp: BinPacking
     Pisahkan kontainer dan gabungkan
     """
     if len(parent1) == 0 or len(parent2) == 0:
-        return copy.deepcopy(parent1), copy.deepcopy(parent2)
+        return parent1, parent2
     
     # One-point crossover
     cut1 = random.randint(0, len(parent1))
@@ -138,8 +287,8 @@ def crossover(parent1: List[List[str]], parent2: List[List[str]], bp: BinPacking
     child2_bins = parent2[:cut2] + parent1[cut1:]
     
     # Perbaiki: pastikan semua item ada tepat satu kali
-    child1 = repair_solution(child1_bins, bp)
-    child2 = repair_solution(child2_bins, bp)
+    child1 = freeze(repair_solution(child1_bins, bp))
+    child2 = freeze(repair_solution(child2_bins, bp))
     
     return child1, child2
 
@@ -170,17 +319,21 @@ def repair_solution(bins: List[List[str]], bp: BinPacking) -> List[List[str]]:
             cleaned_bins.append(cleaned_bin)
     
     # Tambahkan item yang hilang menggunakan First Fit
+    # load kontainer di-cache supaya tidak dijumlah ulang untuk setiap item
+    loads = [bp.get_bin_size(bin_items) for bin_items in cleaned_bins]
     for item in missing_items:
+        size = bp.barang[item]
         placed = False
-        for bin_items in cleaned_bins:
-            bin_size = sum(bp.barang[i] for i in bin_items)
-            if bin_size + bp.barang[item] <= bp.kapasitas:
+        for idx, bin_items in enumerate(cleaned_bins):
+            if bp.fits(loads[idx] + size):
                 bin_items.append(item)
+                loads[idx] = loads[idx] + size
                 placed = True
                 break
         
         if not placed:
             cleaned_bins.append([item])
+            loads.append(size)
     
     return cleaned_bins
 
@@ -188,48 +341,18 @@ def repair_solution(bins: List[List[str]], bp: BinPacking) -> List[List[str]]:
 def mutate(individual: List[List[str]], bp: BinPacking) -> List[List[str]]:
     """
     Mutasi: pindahkan atau tukar item secara acak
+    Move/swap dipilih langsung dari yang feasible (NeighborSampler),
+    jadi hasilnya selalu valid tanpa perlu repair. Hasilnya PersistentState baru
+    yang berbagi kontainer yang tidak tersentuh dengan individu asal
     """
-    mutated = copy.deepcopy(individual)
-    
-    if len(mutated) == 0:
-        return mutated
-    
-    # Pilih tipe mutasi
-    mutation_type = random.choice(['move', 'swap'])
-    
-    if mutation_type == 'move' and len(mutated) > 0:
-        # Pindahkan item acak ke kontainer acak
-        source_bin_idx = random.randint(0, len(mutated) - 1)
-        if len(mutated[source_bin_idx]) > 0:
-            item = random.choice(mutated[source_bin_idx])
-            mutated[source_bin_idx].remove(item)
-            
-            # Tambahkan ke kontainer acak atau kontainer baru
-            if random.random() < 0.5 and len(mutated) > 1:
-                dest_bin_idx = random.randint(0, len(mutated) - 1)
-                mutated[dest_bin_idx].append(item)
-            else:
-                mutated.append([item])
-    
-    elif mutation_type == 'swap' and len(mutated) >= 2:
-        # Tukar item antara dua kontainer acak
-        bin1_idx = random.randint(0, len(mutated) - 1)
-        bin2_idx = random.randint(0, len(mutated) - 1)
-        
-        if bin1_idx != bin2_idx and len(mutated[bin1_idx]) > 0 and len(mutated[bin2_idx]) > 0:
-            item1 = random.choice(mutated[bin1_idx])
-            item2 = random.choice(mutated[bin2_idx])
-            
-            mutated[bin1_idx].remove(item1)
-            mutated[bin1_idx].append(item2)
-            mutated[bin2_idx].remove(item2)
-            mutated[bin2_idx].append(item1)
+    if len(individual) == 0:
+        return freeze(individual)
     
-    # Hapus kontainer kosong
-    mutated = [b for b in mutated if len(b) > 0]
+    sampler = bp.neighbor_sampler(individual)
     
-    # Pastikan valid
-    if not bp.is_valid(mutated):
-        mutated = repair_solution(mutated, bp)
+    # 50% move, 50% swap; move ke kontainer baru dengan peluang 50%
+    move = sampler.sample(move_prob=0.5, new_bin_prob=0.5)
+    if move is not None:
+        sampler.apply(move)
     
-    return mutated
\ No newline at end of file
+    return sampler.snapshot()
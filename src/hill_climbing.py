@@ -1,10 +1,12 @@
 import random
 import copy
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
 from bin_packing import BinPacking
-from objective_function import calculate_objective
+from anytime import ImprovementTrace
+from progress import ProgressObserver
+from persistent_state import thaw
 
-def steepest_ascent_hill_climbing(bp: BinPacking, initial_state: List[List[str]], max_iterations: int = 1000) -> Tuple[List[List[str]], float, List[float], int]:
+def steepest_ascent_hill_climbing(bp: BinPacking, initial_state: List[List[str]], max_iterations: int = 1000, trace: Optional[ImprovementTrace] = None, observer: Optional[ProgressObserver] = None) -> Tuple[List[List[str]], float, List[float], int]:
     """
     Steepest Ascent Hill Climbing
     Selalu pilih tetangga TERBAIK
@@ -13,7 +15,12 @@ def steepest_ascent_hill_climbing(bp: BinPacking, initial_state: List[List[str]]
         best_state, best_score, history, iterations
     """
     current_state = copy.deepcopy(initial_state)
-    current_score = calculate_objective(current_state, bp.kapasitas, bp.barang)
+    current_score = bp.objective(current_state)
+    if trace is not None:
+        trace.count()
+        trace.improve(current_score, current_state)
+    if observer is not None:
+        observer.start('steepest_ascent')
     
     history = [current_score]
     iteration = 0
@@ -21,6 +28,8 @@ def steepest_ascent_hill_climbing(bp: BinPacking, initial_state: List[List[str]]
     while iteration < max_iterations:
         # dapatin semua tetangga
         neighbors = bp.get_neighbors(current_state)
+        if trace is not None:
+            trace.count(len(neighbors))
         
         if len(neighbors) == 0:
             # ga ada tetangga, catat skor dan berhenti
@@ -32,7 +41,7 @@ def steepest_ascent_hill_climbing(bp: BinPacking, initial_state: List[List[str]]
         best_neighbor_score = current_score
         
         for neighbor in neighbors:
-            score = calculate_objective(neighbor, bp.kapasitas, bp.barang)
+            score = bp.objective(neighbor)
             if score < best_neighbor_score:  # Minimisasi
                 best_neighbor_score = score
                 best_neighbor = neighbor
@@ -44,13 +53,19 @@ def steepest_ascent_hill_climbing(bp: BinPacking, initial_state: List[List[str]]
         
         current_state = best_neighbor
         current_score = best_neighbor_score
+        if trace is not None:
+            trace.improve(current_score, current_state)
         history.append(current_score)
         iteration += 1
+        if observer is not None:
+            observer.update(iteration, current_score, len(neighbors), current=current_score)
     
+    if observer is not None:
+        observer.finish(iteration, current_score)
     return current_state, current_score, history, iteration
 
 
-def stochastic_hill_climbing(bp: BinPacking, initial_state: List[List[str]], max_iterations: int = 1000) -> Tuple[List[List[str]], float, List[float], int]:
+def stochastic_hill_climbing(bp: BinPacking, initial_state: List[List[str]], max_iterations: int = 1000, trace: Optional[ImprovementTrace] = None, observer: Optional[ProgressObserver] = None) -> Tuple[List[List[str]], float, List[float], int]:
     """
     Stochastic Hill Climbing
     Pilih tetangga yang lebih baik secara RANDOM
@@ -59,7 +74,12 @@ def stochastic_hill_climbing(bp: BinPacking, initial_state: List[List[str]], max
         best_state, best_score, history, iterations
     """
     current_state = copy.deepcopy(initial_state)
-    current_score = calculate_objective(current_state, bp.kapasitas, bp.barang)
+    current_score = bp.objective(current_state)
+    if trace is not None:
+        trace.count()
+        trace.improve(current_score, current_state)
+    if observer is not None:
+        observer.start('stochastic')
     
     history = [current_score]
     iteration = 0
@@ -67,6 +87,8 @@ def stochastic_hill_climbing(bp: BinPacking, initial_state: List[List[str]], max
     while iteration < max_iterations:
         # dapatin semua tetangga
         neighbors = bp.get_neighbors(current_state)
+        if trace is not None:
+            trace.count(len(neighbors))
         
         if len(neighbors) == 0:
             # gaada tetangga, catat skor dan berhenti
@@ -76,7 +98,7 @@ def stochastic_hill_climbing(bp: BinPacking, initial_state: List[List[str]], max
         # cari semua tetangga yang lebih baik
         better_neighbors = []
         for neighbor in neighbors:
-            score = calculate_objective(neighbor, bp.kapasitas, bp.barang)
+            score = bp.objective(neighbor)
             if score < current_score:
                 better_neighbors.append((neighbor, score))
         
@@ -87,13 +109,19 @@ def stochastic_hill_climbing(bp: BinPacking, initial_state: List[List[str]], max
         
         # pilih tetangga yang lebih baik secara random
         current_state, current_score = random.choice(better_neighbors)
+        if trace is not None:
+            trace.improve(current_score, current_state)
         history.append(current_score)
         iteration += 1
+        if observer is not None:
+            observer.update(iteration, current_score, len(neighbors), current=current_score)
     
+    if observer is not None:
+        observer.finish(iteration, current_score)
     return current_state, current_score, history, iteration
 
 
-def sideways_move_hill_climbing(bp: BinPacking, initial_state: List[List[str]], max_iterations: int = 1000, max_sideways: int = 100) -> Tuple[List[List[str]], float, List[float], int]:
+def sideways_move_hill_climbing(bp: BinPacking, initial_state: List[List[str]], max_iterations: int = 1000, max_sideways: int = 100, trace: Optional[ImprovementTrace] = None, observer: Optional[ProgressObserver] = None) -> Tuple[List[List[str]], float, List[float], int]:
     """
     Hill Climbing with Sideways Move
     Izinin perpindahan ke tetangga dengan skor SAMA (maksimal max_sideways kali)
@@ -102,7 +130,12 @@ def sideways_move_hill_climbing(bp: BinPacking, initial_state: List[List[str]],
         best_state, best_score, history, iterations
     """
     current_state = copy.deepcopy(initial_state)
-    current_score = calculate_objective(current_state, bp.kapasitas, bp.barang)
+    current_score = bp.objective(current_state)
+    if trace is not None:
+        trace.count()
+        trace.improve(current_score, current_state)
+    if observer is not None:
+        observer.start('sideways_move')
     
     history = [current_score]
     iteration = 0
@@ -110,6 +143,8 @@ def sideways_move_hill_climbing(bp: BinPacking, initial_state: List[List[str]],
     
     while iteration < max_iterations and sideways_count < max_sideways:
         neighbors = bp.get_neighbors(current_state)
+        if trace is not None:
+            trace.count(len(neighbors))
         
         if len(neighbors) == 0:
             # ga ada tetangga, catat skor dan berhenti
@@ -120,7 +155,7 @@ def sideways_move_hill_climbing(bp: BinPacking, initial_state: List[List[str]],
         best_neighbor_score = current_score
         
         for neighbor in neighbors:
-            score = calculate_objective(neighbor, bp.kapasitas, bp.barang)
+            score = bp.objective(neighbor)
             if score < best_neighbor_score:
                 best_neighbor_score = score
                 best_neighbor = neighbor
@@ -129,7 +164,7 @@ def sideways_move_hill_climbing(bp: BinPacking, initial_state: List[List[str]],
         if best_neighbor is None:
             # coba sideways move
             sideways_neighbors = [n for n in neighbors 
-                                if calculate_objective(n, bp.kapasitas, bp.barang) == current_score]
+                                if bp.objective(n) == current_score]
             
             if len(sideways_neighbors) > 0:
                 best_neighbor = random.choice(sideways_neighbors)
@@ -144,13 +179,69 @@ def sideways_move_hill_climbing(bp: BinPacking, initial_state: List[List[str]],
         
         current_state = best_neighbor
         current_score = best_neighbor_score
+        if trace is not None:
+            trace.improve(current_score, current_state)
         history.append(current_score)
         iteration += 1
+        if observer is not None:
+            observer.update(iteration, current_score, len(neighbors), current=current_score)
     
+    if observer is not None:
+        observer.finish(iteration, current_score)
     return current_state, current_score, history, iteration
 
 
-def random_restart_hill_climbing(bp: BinPacking, max_restarts: int = 10, max_iterations_per_restart: int = 100) -> Tuple[List[List[str]], float, List[float], int, List[int]]:
+def sampled_hill_climbing(bp: BinPacking, initial_state: List[List[str]], max_iterations: int = 1000, max_stuck: Optional[int] = None, trace: Optional[ImprovementTrace] = None, observer: Optional[ProgressObserver] = None) -> Tuple[List[List[str]], float, List[float], int]:
+    """
+    Hill Climbing berbasis NeighborSampler (untuk instance besar)
+    Tiap iterasi sampel SATU move feasible dan terapkan kalo memperbaiki: skor turun,
+    atau skor sama dan jumlah kuadrat load naik (swap feasible selalu netral).
+    Tidak membangun semua tetangga seperti get_neighbors, jadi satu iterasi O(1)-an.
+    Berhenti setelah max_iterations sampel, atau max_stuck sampel berturut-turut
+    tanpa perbaikan (None = tidak dipakai)
+
+    Returns:
+        best_state, best_score, history, iterations
+    """
+    sampler = bp.neighbor_sampler(initial_state)
+    current_score = sampler.score()
+    if trace is not None:
+        trace.count()
+        trace.improve(current_score, sampler.snapshot())
+    if observer is not None:
+        observer.start('sampled')
+
+    history = [current_score]
+    iteration = 0
+    stuck = 0
+
+    while iteration < max_iterations and (max_stuck is None or stuck < max_stuck):
+        move = sampler.sample()
+        iteration += 1
+        if trace is not None:
+            trace.count()
+
+        improved = False
+        if move is not None:
+            score = sampler.evaluate(move)
+            if score < current_score or (score == current_score and sampler.balance_delta(move) > 0):
+                sampler.apply(move)
+                if score < current_score and trace is not None:
+                    trace.improve(score, sampler.snapshot())
+                current_score = score
+                history.append(current_score)
+                improved = True
+
+        stuck = 0 if improved else stuck + 1
+        if observer is not None:
+            observer.update(iteration, current_score, current=current_score, accepted=improved)
+
+    if observer is not None:
+        observer.finish(iteration, current_score)
+    return thaw(sampler.snapshot()), current_score, history, iteration
+
+
+def random_restart_hill_climbing(bp: BinPacking, max_restarts: int = 10, max_iterations_per_restart: int = 100, trace: Optional[ImprovementTrace] = None, observer: Optional[ProgressObserver] = None) -> Tuple[List[List[str]], float, List[float], int, List[int]]:
     """
     Random Restart Hill Climbing
     Jalanin steepest ascent berkali-kali dengan initial state berbeda
@@ -163,13 +254,15 @@ def random_restart_hill_climbing(bp: BinPacking, max_restarts: int = 10, max_ite
     global_history = []
     total_iterations = 0
     iterations_per_restart = []
+    if observer is not None:
+        observer.start('random_restart')
     
     for restart in range(max_restarts):
         # generate state awal random baru
         initial_state = bp.initial_state_random()
         
         # jalanin steepest ascent
-        state, score, history, iterations = steepest_ascent_hill_climbing(bp, initial_state, max_iterations_per_restart)
+        state, score, history, iterations = steepest_ascent_hill_climbing(bp, initial_state, max_iterations_per_restart, trace=trace)
         
         iterations_per_restart.append(iterations)
         total_iterations += iterations
@@ -179,5 +272,11 @@ def random_restart_hill_climbing(bp: BinPacking, max_restarts: int = 10, max_ite
         if score < global_best_score:
             global_best_score = score
             global_best_state = state
+        
+        # satu update per restart (tiap restart memanggil steepest ascent tanpa observer)
+        if observer is not None:
+            observer.update(restart + 1, global_best_score, iterations, current=score)
     
+    if observer is not None:
+        observer.finish(max_restarts, global_best_score)
     return global_best_state, global_best_score, global_history, total_iterations, iterations_per_restart
\ No newline at end of file
@@ -0,0 +1,110 @@
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+from statistics import median
+from typing import Dict, List, Optional, Tuple
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Jalur solve headless: modul yang di-load src/solve.py untuk solver berbasis state
+HEADLESS_IMPORTS = 'import solve, utils, bin_packing, hill_climbing, simulated_annealing, genetic_algorithm'
+
+# Modul berat yang tidak boleh ikut ter-load di jalur headless
+FORBIDDEN_MODULES = ('matplotlib', 'numpy')
+
+
+def parse_importtime(stderr: str) -> Dict[str, Tuple[int, int, int]]:
+    """
+    Parse output -X importtime
+
+    Returns:
+        nama modul -> (self us, cumulative us, kedalaman)
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip(' '))) // 2
+        modules[name.strip()] = (int(self_us), int(cumulative_us), depth)
+    return modules
+
+
+def measure(statement: str, repeats: int = 7) -> Dict:
+    """
+    Jalankan interpreter baru `repeats` kali dengan -X importtime
+
+    Returns:
+        median total import (ms), median wall-clock proses (ms), modul per run terakhir
+    """
+    import_totals = []
+    wall_times = []
+    modules = {}
+    env = {**os.environ, 'PYTHONPATH': SRC_DIR + os.pathsep + os.environ.get('PYTHONPATH', '')}
+
+    for _ in range(repeats):
+        start = time.perf_counter()
+        completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                                   capture_output=True, text=True, env=env, cwd=SRC_DIR)
+        wall_times.append((time.perf_counter() - start) * 1000)
+        if completed.returncode != 0:
+            raise RuntimeError(f"Gagal menjalankan {statement!r}:\n{completed.stderr}")
+
+        modules = parse_importtime(completed.stderr)
+        import_totals.append(sum(cumulative for _, cumulative, depth in modules.values() if depth == 0) / 1000)
+
+    return {
+        'statement': statement,
+        'import_ms': median(import_totals),
+        'wall_ms': median(wall_times),
+        'modules': modules,
+    }
+
+
+def top_modules(modules: Dict[str, Tuple[int, int, int]], n: int = 10) -> List[Tuple[str, float]]:
+    """Modul dengan waktu import sendiri (self) terbesar, dalam ms"""
+    ranked = sorted(modules.items(), key=lambda entry: entry[1][0], reverse=True)
+    return [(name, self_us / 1000) for name, (self_us, _, _) in ranked[:n]]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark waktu start (import) jalur solve headless")
+    parser.add_argument('--statement', default=HEADLESS_IMPORTS, help="Statement Python yang diukur")
+    parser.add_argument('--repeats', type=int, default=7)
+    parser.add_argument('--budget-ms', type=float, help="Gagal (exit 1) kalo median total import melebihi batas ini")
+    parser.add_argument('--output', help="Tambahkan hasil (JSON per baris) ke berkas ini untuk dilacak dari waktu ke waktu")
+    args = parser.parse_args(argv)
+
+    result = measure(args.statement, args.repeats)
+    heavy = sorted({name.split('.')[0] for name in result['modules']} & set(FORBIDDEN_MODULES))
+
+    print(f"Statement : {result['statement']}")
+    print(f"Import    : {result['import_ms']:.1f} ms (median {args.repeats} run)")
+    print(f"Proses    : {result['wall_ms']:.1f} ms (termasuk start interpreter)")
+    print("Modul terberat (self):")
+    for name, ms in top_modules(result['modules']):
+        print(f"  {ms:8.2f} ms  {name}")
+
+    failed = False
+    if heavy and args.statement == HEADLESS_IMPORTS:
+        print(f"GAGAL: modul berat ikut ter-load di jalur headless: {', '.join(heavy)}")
+        failed = True
+    if args.budget_ms is not None and result['import_ms'] > args.budget_ms:
+        print(f"GAGAL: {result['import_ms']:.1f} ms melebihi budget {args.budget_ms:.1f} ms")
+        failed = True
+
+    if args.output:
+        record = {'time': time.time(), 'statement': result['statement'], 'import_ms': result['import_ms'],
+                  'wall_ms': result['wall_ms'], 'python': sys.version.split()[0]}
+        with open(args.output, 'a') as f:
+            f.write(json.dumps(record) + '\n')
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    # python src/import_benchmark.py --budget-ms 50
+    sys.exit(main())
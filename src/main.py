@@ -5,9 +5,14 @@ from objective_function import calculate_objective, get_num_bins
 from hill_climbing import (steepest_ascent_hill_climbing, stochastic_hill_climbing, sideways_move_hill_climbing, random_restart_hill_climbing)
 from simulated_annealing import simulated_annealing
 from genetic_algorithm import genetic_algorithm
-from visualizer import (plot_convergence, visualize_bins, plot_sa_probability, plot_ga_convergence, plot_hc_comparison, print_state_detailed)
+from results_store import ResultsStore, DEFAULT_PATH, format_summary
+from solution_cache import instance_fingerprint
 
 def main():
+    # visualizer (matplotlib + NumPy) di-load di sini, bukan saat modul di-import;
+    # untuk solve tanpa plot pakai src/solve.py
+    from visualizer import (plot_convergence, visualize_bins, plot_sa_probability, plot_ga_convergence, plot_hc_comparison, print_state_detailed, plot_store_summary)
+    
     print("BIN PACKING PROBLEM SOLVER - LOCAL SEARCH ALGORITHMS")
     
     # Memuat data
@@ -151,6 +156,25 @@ def main():
     visualize_bins(ga_state, kapasitas, barang, "Genetic Algorithm - Final State", "ga_final_state")
     print_state_detailed(ga_state, kapasitas, barang, "Genetic Algorithm - Final State")
     
+    # Catat semua run (plus history) ke results store; agregat lintas eksekusi dibaca dari situ
+    fingerprint = instance_fingerprint(kapasitas, barang)
+    runs = [
+        ('hc', {'max_iterations': 500}, hc_results['Steepest Ascent'], hc1_history),
+        ('hc_stochastic', {'max_iterations': 500}, hc_results['Stochastic'], hc2_history),
+        ('hc_sideways', {'max_iterations': 500, 'max_sideways': 100}, hc_results['Sideways Move'], hc3_history),
+        ('hc_restart', {'max_restarts': 10, 'max_iterations_per_restart': 100}, hc_results['Random Restart'], hc4_history),
+        ('sa', {'T_initial': 1000, 'T_min': 0.1, 'alpha': 0.95, 'max_iterations': 1000},
+         {'score': sa_score, 'bins': get_num_bins(sa_state), 'time': sa_time}, sa_history),
+        ('ga', {'population_size': 50, 'generations': 100, 'mutation_rate': 0.1, 'crossover_rate': 0.8},
+         {'score': ga_score, 'bins': get_num_bins(ga_state), 'time': ga_time}, ga_best_hist),
+    ]
+    with ResultsStore(DEFAULT_PATH) as store:
+        store.add_instance(fingerprint, 'data/input.json', len(barang), kapasitas)
+        for algorithm, params, result, history in runs:
+            store.add_run(fingerprint, algorithm, params, None, result['score'], result['bins'], result['time'], history)
+        stored_summary = store.summary(fingerprint)
+        plot_store_summary(store, "store_summary", fingerprint)
+    
     # Ringkasan
     print("SUMMARY")
     print("="*70)
@@ -171,6 +195,11 @@ def main():
     print(f"{'Genetic Algorithm':<30} {get_num_bins(ga_state):<10} {ga_score:<15.2f} {ga_time:<10.3f}")
     print("="*70)
     
+    # Agregat semua eksekusi yang tersimpan untuk instance ini
+    print(f"\nSemua run tersimpan di {DEFAULT_PATH}:")
+    for line in format_summary(stored_summary):
+        print(line)
+    
     print("\n>> All visualizations saved to experiments/results/")
     print(">> Program completed successfully!")
 
@@ -0,0 +1,321 @@
+import random
+from bisect import bisect_left, insort
+from typing import List, Optional, Tuple
+from bin_packing import BinPacking
+from objective_function import objective_from_totals
+from persistent_state import PersistentState, add_item, remove_item
+
+# Tujuan move berupa kontainer baru
+NEW_BIN = -1
+
+
+class NeighborSampler:
+    """
+    Sampler tetangga random yang langsung memilih move/swap yang FEASIBLE
+
+    Berbeda dengan BinPacking.get_random_neighbor (rejection sampling + deepcopy
+    + is_valid tiap percobaan), sampler ini menyimpan state secara mutable beserta
+    indeks-indeksnya:
+    - indeks sisa kapasitas: list (sisa, bin_idx) terurut, untuk memilih kontainer
+      tujuan yang pasti muat untuk ukuran item tertentu
+    - indeks ukuran: list (ukuran, item_id) terurut (dari bp.get_size_index),
+      untuk memilih pasangan swap dalam rentang delta ukuran yang diizinkan
+
+    Pencarian kandidat memakai bisect (O(log n)) dan move dievaluasi secara
+    inkremental tanpa menyalin state. Kontainer disimpan sebagai tuple immutable
+    (lihat persistent_state), jadi move hanya membangun ulang kontainer yang
+    tersentuh dan snapshot berbagi kontainer dengan state lain.
+
+    Move direpresentasikan sebagai tuple:
+        ('move', item, bin_asal, bin_tujuan)   # bin_tujuan == NEW_BIN untuk kontainer baru
+        ('swap', item1, bin1, item2, bin2)
+        ('exchange', items1, bin1, items2, bin2)   # tuple items1 pindah ke bin2, items2 ke bin1
+    """
+
+    def __init__(self, bp: BinPacking, state: List[List[str]], max_swap_attempts: int = 8):
+        self.bp = bp
+        self.kapasitas = bp.kapasitas
+        self.max_swap_attempts = max_swap_attempts
+
+        # tuple(t) untuk t yang sudah tuple tidak menyalin apa-apa
+        self.bins = [tuple(bin_items) for bin_items in state]
+        self.loads = [bp.get_bin_size(bin_items) for bin_items in self.bins]
+        self.location = {}
+        for idx, bin_items in enumerate(self.bins):
+            for item in bin_items:
+                self.location[item] = idx
+        self.items = list(self.location)
+
+        self._residual_index = sorted((self.kapasitas - load, idx) for idx, load in enumerate(self.loads))
+
+        # agregat untuk objektif inkremental
+        self.total_overflow = 0
+        self.wasted_space = 0
+        for load in self.loads:
+            overflow, wasted = self._load_terms(load)
+            self.total_overflow += overflow
+            self.wasted_space += wasted
+
+    def _load_terms(self, load: int) -> Tuple[int, int]:
+        """(overflow, ruang terbuang) untuk satu kontainer dengan total ukuran load"""
+        if load > self.kapasitas:
+            return load - self.kapasitas, 0
+        return 0, self.kapasitas - load
+
+    def score(self) -> float:
+        """Nilai objektif state saat ini (sama dengan calculate_objective)"""
+        if len(self.bins) == 0:
+            return float('inf')
+        return objective_from_totals(len(self.bins), self.total_overflow, self.wasted_space)
+
+    def snapshot(self) -> PersistentState:
+        """
+        Snapshot state saat ini sebagai PersistentState
+        Menyalin tuple pointer kontainer, O(jumlah kontainer); item di dalamnya tidak disalin
+        """
+        return tuple(self.bins)
+
+    # ------------------------------------------------------------------
+    # Sampling
+    # ------------------------------------------------------------------
+
+    def sample(self, move_prob: float = 0.7, new_bin_prob: float = 0.2) -> Optional[Tuple]:
+        """
+        Ambil satu move feasible secara random
+
+        Args:
+            move_prob: Probabilitas memilih operasi move (sisanya swap)
+            new_bin_prob: Probabilitas move ke kontainer baru
+
+        Returns:
+            Tuple move, atau None kalo tidak ada move feasible yang ketemu
+        """
+        if len(self.items) == 0:
+            return None
+
+        if random.random() < move_prob:
+            move = self._sample_move(new_bin_prob)
+            if move is None:
+                move = self._sample_swap()
+        else:
+            move = self._sample_swap()
+            if move is None:
+                move = self._sample_move(new_bin_prob)
+
+        return move
+
+    def _sample_move(self, new_bin_prob: float) -> Optional[Tuple]:
+        item = random.choice(self.items)
+        src = self.location[item]
+        size = self.bp.barang[item]
+
+        # pindah ke kontainer baru cuma masuk akal kalo kontainer asal ga jadi kosong
+        can_open = len(self.bins[src]) > 1
+
+        if can_open and random.random() < new_bin_prob:
+            return ('move', item, src, NEW_BIN)
+
+        dest = self._sample_dest_bin(size, src)
+        if dest is not None:
+            return ('move', item, src, dest)
+
+        if can_open:
+            return ('move', item, src, NEW_BIN)
+
+        return None
+
+    def _sample_dest_bin(self, size: int, exclude: int) -> Optional[int]:
+        """Pilih random kontainer (selain exclude) yang sisa kapasitasnya >= size"""
+        index = self._residual_index
+        lo = bisect_left(index, (size, -1))
+
+        own_residual = self.kapasitas - self.loads[exclude]
+        own_in_range = own_residual >= size
+        num_choices = len(index) - lo - (1 if own_in_range else 0)
+        if num_choices <= 0:
+            return None
+
+        pos = lo + random.randrange(num_choices)
+
+        # lewati entry kontainer asal
+        if own_in_range and pos >= bisect_left(index, (own_residual, exclude)):
+            pos += 1
+
+        return index[pos][1]
+
+    def _sample_swap(self) -> Optional[Tuple]:
+        if len(self.bins) < 2:
+            return None
+
+        size_index = self.bp.get_size_index()
+        barang = self.bp.barang
+        max_residual = self._residual_index[-1][0]
+
+        for _ in range(self.max_swap_attempts):
+            item1 = random.choice(self.items)
+            bin1 = self.location[item1]
+            size1 = barang[item1]
+            residual1 = self.kapasitas - self.loads[bin1]
+
+            # ukuran pasangan harus di [size1 - sisa bin2, size1 + sisa bin1]
+            # sisa bin2 belum diketahui, jadi batas bawah pakai sisa terbesar
+            lo = bisect_left(size_index, (size1 - max_residual,))
+            hi = bisect_left(size_index, (size1 + residual1 + 1,))
+            if hi - lo <= 1:
+                continue
+
+            item2 = size_index[random.randrange(lo, hi)][1]
+            bin2 = self.location[item2]
+            if bin2 == bin1:
+                continue
+
+            size2 = barang[item2]
+            if size2 - size1 <= residual1 and size1 - size2 <= self.kapasitas - self.loads[bin2]:
+                return ('swap', item1, bin1, item2, bin2)
+
+        return None
+
+    # ------------------------------------------------------------------
+    # Evaluasi dan penerapan move
+    # ------------------------------------------------------------------
+
+    def _load_changes(self, move: Tuple) -> List[Tuple[int, int, int]]:
+        """List (bin_idx, load_lama, load_baru) untuk kontainer yang tersentuh move"""
+        barang = self.bp.barang
+
+        if move[0] == 'move':
+            _, item, src, dest = move
+            size = barang[item]
+            changes = [(src, self.loads[src], self.loads[src] - size)]
+            if dest == NEW_BIN:
+                changes.append((NEW_BIN, 0, size))
+            else:
+                changes.append((dest, self.loads[dest], self.loads[dest] + size))
+            return changes
+
+        _, item1, bin1, item2, bin2 = move
+        if move[0] == 'exchange':
+            diff = sum(barang[item] for item in item2) - sum(barang[item] for item in item1)
+        else:
+            diff = barang[item2] - barang[item1]
+        return [
+            (bin1, self.loads[bin1], self.loads[bin1] + diff),
+            (bin2, self.loads[bin2], self.loads[bin2] - diff),
+        ]
+
+    def evaluate(self, move: Tuple) -> float:
+        """Nilai objektif kalo move diterapkan, tanpa mengubah state"""
+        num_bins = len(self.bins)
+        total_overflow = self.total_overflow
+        wasted_space = self.wasted_space
+
+        for idx, old_load, new_load in self._load_changes(move):
+            if idx != NEW_BIN:
+                overflow, wasted = self._load_terms(old_load)
+                total_overflow -= overflow
+                wasted_space -= wasted
+            else:
+                num_bins += 1
+
+            if self._bin_emptied(move, idx):
+                num_bins -= 1
+            else:
+                overflow, wasted = self._load_terms(new_load)
+                total_overflow += overflow
+                wasted_space += wasted
+
+        return objective_from_totals(num_bins, total_overflow, wasted_space)
+
+    def balance_delta(self, move: Tuple) -> int:
+        """
+        Perubahan jumlah kuadrat load kalo move diterapkan
+
+        Swap/exchange yang feasible tidak mengubah objektif (jumlah kontainer dan
+        ruang terbuang tetap), tapi menaikkan jumlah kuadrat load berarti kontainer
+        yang penuh makin penuh dan yang longgar makin kosong, jadi dipakai sebagai
+        tie-breaker menuju eliminasi kontainer.
+        """
+        return sum(new_load * new_load - old_load * old_load for _, old_load, new_load in self._load_changes(move))
+
+    def _bin_emptied(self, move: Tuple, idx: int) -> bool:
+        return move[0] == 'move' and idx == move[2] and len(self.bins[idx]) == 1
+
+    def apply(self, move: Tuple):
+        """Terapkan move ke state dan perbarui semua indeks"""
+        if move[0] == 'move':
+            _, item, src, dest = move
+            if dest == NEW_BIN:
+                dest = self._open_bin()
+            self._remove_item(src, item)
+            self._add_item(dest, item)
+            if len(self.bins[src]) == 0:
+                self._close_bin(src)
+        elif move[0] == 'exchange':
+            _, items1, bin1, items2, bin2 = move
+            for item in items1:
+                self._remove_item(bin1, item)
+            for item in items2:
+                self._remove_item(bin2, item)
+            for item in items2:
+                self._add_item(bin1, item)
+            for item in items1:
+                self._add_item(bin2, item)
+        else:
+            _, item1, bin1, item2, bin2 = move
+            self._remove_item(bin1, item1)
+            self._remove_item(bin2, item2)
+            self._add_item(bin1, item2)
+            self._add_item(bin2, item1)
+
+    def _set_load(self, idx: int, new_load: int):
+        old_load = self.loads[idx]
+
+        overflow, wasted = self._load_terms(old_load)
+        self.total_overflow -= overflow
+        self.wasted_space -= wasted
+        overflow, wasted = self._load_terms(new_load)
+        self.total_overflow += overflow
+        self.wasted_space += wasted
+
+        index = self._residual_index
+        del index[bisect_left(index, (self.kapasitas - old_load, idx))]
+        insort(index, (self.kapasitas - new_load, idx))
+        self.loads[idx] = new_load
+
+    def _remove_item(self, idx: int, item: str):
+        self.bins[idx] = remove_item(self.bins[idx], item)
+        self._set_load(idx, self.loads[idx] - self.bp.barang[item])
+
+    def _add_item(self, idx: int, item: str):
+        self.bins[idx] = add_item(self.bins[idx], item)
+        self.location[item] = idx
+        self._set_load(idx, self.loads[idx] + self.bp.barang[item])
+
+    def _open_bin(self) -> int:
+        idx = len(self.bins)
+        self.bins.append(())
+        self.loads.append(0)
+        self.wasted_space += self.kapasitas
+        insort(self._residual_index, (self.kapasitas, idx))
+        return idx
+
+    def _close_bin(self, idx: int):
+        """Hapus kontainer kosong idx dengan menukarnya dengan kontainer terakhir (O(1) index shift)"""
+        index = self._residual_index
+        last = len(self.bins) - 1
+
+        self.wasted_space -= self.kapasitas - self.loads[idx]
+        del index[bisect_left(index, (self.kapasitas - self.loads[idx], idx))]
+
+        if idx != last:
+            last_load = self.loads[last]
+            del index[bisect_left(index, (self.kapasitas - last_load, last))]
+            insort(index, (self.kapasitas - last_load, idx))
+
+            self.bins[idx] = self.bins[last]
+            self.loads[idx] = last_load
+            for item in self.bins[idx]:
+                self.location[item] = idx
+
+        self.bins.pop()
+        self.loads.pop()
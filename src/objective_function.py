@@ -1,4 +1,4 @@
-from typing import List, Dict
+from typing import List, Dict, Iterable
 
 def calculate_objective(state: List[List[str]], kapasitas: int, barang: Dict[str, int]) -> float:
     """
@@ -21,39 +21,52 @@ def calculate_objective(state: List[List[str]], kapasitas: int, barang: Dict[str
     if len(state) == 0:
         return float('inf')
     
-    score = 0.0
-    
-    # 1. PENALTI OVERFLOW (sangat besar!)
-    # Ini memastikan solusi akhir VALID
-    overflow_penalty = 0
+    total_overflow = 0
+    wasted_space = 0
     for bin_items in state:
         bin_size = sum(barang[item] for item in bin_items)
         if bin_size > kapasitas:
-            overflow = bin_size - kapasitas
-            overflow_penalty += 10000 * overflow  # PENALTI SANGAT BESAR
+            total_overflow += bin_size - kapasitas
+        else:
+            wasted_space += kapasitas - bin_size
+    
+    return objective_from_totals(len(state), total_overflow, wasted_space)
+
+
+def objective_from_totals(num_bins: int, total_overflow: int, wasted_space: int) -> float:
+    """
+    Menghitung nilai objektif dari agregat state (jumlah kontainer, total overflow,
+    total ruang terbuang). Dipakai calculate_objective dan evaluasi delta inkremental,
+    jadi hasilnya identik (bit-per-bit) dengan perhitungan penuh.
+    """
+    score = 0.0
     
-    score += overflow_penalty
+    # 1. PENALTI OVERFLOW (sangat besar!)
+    # Ini memastikan solusi akhir VALID
+    score += 10000 * total_overflow  # PENALTI SANGAT BESAR
     
     # 2. JUMLAH KONTAINER (objektif utama)
     # Semakin sedikit kontainer, semakin baik
-    num_bins = len(state)
     score += num_bins * 100
     
     # 3. PENALTI RUANG TERBUANG
-    # Mendorong kontainer yang lebih penuh
-    wasted_space = 0
-    for bin_items in state:
-        bin_size = sum(barang[item] for item in bin_items)
-        if bin_size <= kapasitas:
-            wasted = kapasitas - bin_size
-            wasted_space += wasted
-    
-    # Penalti kecil untuk ruang terbuang
+    # Penalti kecil untuk ruang terbuang, mendorong kontainer yang lebih penuh
     score += wasted_space * 0.1
     
     return score
 
 
+def lower_bound_score(kapasitas: int, sizes: Iterable[int]) -> float:
+    """
+    Batas bawah nilai objektif: jumlah kontainer minimal ceil(total ukuran / kapasitas)
+    tanpa overflow. Solusi valid dengan k kontainer selalu punya ruang terbuang
+    k * kapasitas - total, jadi tidak ada solusi yang skornya di bawah nilai ini.
+    """
+    total = sum(sizes)
+    num_bins = max(1, -(-total // kapasitas))
+    return objective_from_totals(num_bins, 0, num_bins * kapasitas - total)
+
+
 def calculate_fitness(state: List[List[str]], kapasitas: int, barang: Dict[str, int]) -> float:
     """
     Menghitung fitness untuk Algoritma Genetika (SEMAKIN TINGGI SEMAKIN BAIK)
@@ -0,0 +1,208 @@
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+from statistics import median
+from typing import Callable, Dict, List, Optional, Tuple
+from bin_packing import BinPacking
+from objective_function import calculate_objective
+from simulated_annealing import simulated_annealing
+from genetic_algorithm import genetic_algorithm, repair_solution, mutate
+from persistent_state import freeze
+from neighbor_sampler import NeighborSampler
+
+DEFAULT_BASELINE = 'results/perf_baseline.json'
+
+# Ukuran instance per benchmark
+SIZES = {'small': 50, 'medium': 200, 'large': 1000}
+# get_neighbors membangun O(n^2) tetangga (~9 detik per panggilan di 'medium'),
+# GA penuh juga berat, jadi keduanya hanya diukur di ukuran yang lebih kecil
+NEIGHBORS_MAX_ITEMS = SIZES['small']
+GA_MAX_ITEMS = SIZES['medium']
+
+
+def make_instance(num_items: int, seed: int = 0) -> BinPacking:
+    """Instance sintetis deterministik (kapasitas 100, ukuran 5..70)"""
+    rng = random.Random(seed)
+    return BinPacking(100, {f'I{i}': rng.randint(5, 70) for i in range(num_items)})
+
+
+def build_benchmarks() -> Dict[str, Callable[[], None]]:
+    """
+    nama -> fungsi tanpa argumen yang menjalankan satu operasi
+    Semua input disiapkan di sini (di luar pengukuran) dengan seed tetap
+    """
+    benchmarks = {}
+    for size_name, num_items in SIZES.items():
+        bp = make_instance(num_items)
+        random.seed(1)
+        state = bp.initial_state_first_fit()
+        random_state = bp.initial_state_random()
+        other_state = bp.initial_state_random()
+        child_bins = state[:len(state) // 2] + other_state[len(other_state) // 2:]
+        frozen = freeze(random_state)
+
+        benchmarks[f'calculate_objective/{size_name}'] = \
+            lambda bp=bp, state=state: calculate_objective(state, bp.kapasitas, bp.barang)
+        benchmarks[f'neighbor_sampler_step/{size_name}'] = lambda sampler=NeighborSampler(bp, random_state): _sampler_step(sampler)
+        benchmarks[f'repair_solution/{size_name}'] = lambda bp=bp, bins=child_bins: repair_solution(bins, bp)
+        benchmarks[f'mutate/{size_name}'] = lambda bp=bp, individual=frozen: mutate(individual, bp)
+        if num_items <= NEIGHBORS_MAX_ITEMS:
+            benchmarks[f'get_neighbors/{size_name}'] = lambda bp=bp, state=state: bp.get_neighbors(state)
+        if num_items <= GA_MAX_ITEMS:
+            benchmarks[f'ga_run/{size_name}'] = \
+                lambda bp=bp: genetic_algorithm(bp, population_size=20, generations=10)
+        benchmarks[f'sa_run/{size_name}'] = \
+            lambda bp=bp, state=random_state: simulated_annealing(bp, state, alpha=0.999, max_iterations=2000)
+    return benchmarks
+
+
+def _sampler_step(sampler: NeighborSampler):
+    """Satu langkah SA/mutasi GA: sample move feasible, evaluasi delta, terapkan"""
+    move = sampler.sample()
+    if move is not None:
+        sampler.evaluate(move)
+        sampler.apply(move)
+
+
+def measure(func: Callable[[], None], repeats: int = 7, min_time: float = 0.05) -> Dict:
+    """
+    Ukur waktu per operasi: jumlah loop dikalibrasi supaya satu sampel >= min_time,
+    lalu diambil `repeats` sampel. Seed random di-reset sebelum tiap sampel.
+
+    Returns:
+        median dan MAD (median absolute deviation) waktu per operasi dalam detik
+    """
+    loops = 1
+    while True:
+        random.seed(12345)
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or loops >= 1 << 20:
+            break
+        loops *= 2 if elapsed == 0 else max(2, min(10, int(min_time / elapsed) + 1))
+
+    samples = []
+    for _ in range(repeats):
+        random.seed(12345)
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        samples.append((time.perf_counter() - start) / loops)
+
+    center = median(samples)
+    return {'median': center, 'mad': median(abs(sample - center) for sample in samples), 'loops': loops}
+
+
+def compare(baseline: Dict, current: Dict, threshold: float = 0.10, noise_factor: float = 3.0) -> List[Tuple]:
+    """
+    Bandingkan hasil dengan baseline
+
+    Regresi kalo median sekarang lebih lambat dari baseline melebihi
+    max(threshold * baseline, noise_factor * sqrt(MAD_baseline^2 + MAD_sekarang^2)),
+    jadi benchmark yang berisik butuh selisih lebih besar sebelum dianggap regresi.
+
+    Returns:
+        List (nama, baseline, sekarang, perubahan relatif, status)
+    """
+    rows = []
+    for name in sorted(set(baseline) | set(current)):
+        if name not in baseline:
+            rows.append((name, None, current[name]['median'], None, 'baru'))
+            continue
+        if name not in current:
+            rows.append((name, baseline[name]['median'], None, None, 'hilang'))
+            continue
+
+        base, now = baseline[name], current[name]
+        delta = now['median'] - base['median']
+        allowed = max(threshold * base['median'], noise_factor * (base['mad'] ** 2 + now['mad'] ** 2) ** 0.5)
+        if delta > allowed:
+            status = 'REGRESI'
+        elif -delta > allowed:
+            status = 'lebih cepat'
+        else:
+            status = 'ok'
+        rows.append((name, base['median'], now['median'], delta / base['median'], status))
+    return rows
+
+
+def format_rows(rows: List[Tuple]) -> str:
+    def fmt_time(seconds: Optional[float]) -> str:
+        if seconds is None:
+            return '-'
+        for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+            if seconds >= scale:
+                return f'{seconds / scale:.2f} {unit}'
+        return f'{seconds / 1e-9:.0f} ns'
+
+    lines = [f"{'Benchmark':<32} {'Baseline':>12} {'Sekarang':>12} {'Perubahan':>10}  Status", '-' * 80]
+    for name, base, now, change, status in rows:
+        change_text = f'{change * 100:+.1f}%' if change is not None else '-'
+        lines.append(f'{name:<32} {fmt_time(base):>12} {fmt_time(now):>12} {change_text:>10}  {status}')
+    return '\n'.join(lines)
+
+
+def machine_info() -> Dict:
+    return {'python': platform.python_version(), 'machine': platform.machine(), 'node': platform.node()}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Gate regresi performa (microbenchmark vs baseline JSON)")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="Berkas baseline JSON")
+    parser.add_argument('--update', action='store_true',
+                        help="Tulis hasil sekarang ke baseline (dengan --filter hanya benchmark yang cocok yang diganti)")
+    parser.add_argument('--repeats', type=int, default=7)
+    parser.add_argument('--threshold', type=float, default=0.10, help="Batas perlambatan relatif (default 10%%)")
+    parser.add_argument('--filter', default='', help="Hanya jalankan benchmark yang namanya mengandung teks ini")
+    args = parser.parse_args(argv)
+
+    benchmarks = {name: func for name, func in build_benchmarks().items() if args.filter in name}
+    current = {}
+    for name, func in benchmarks.items():
+        current[name] = measure(func, args.repeats)
+        print(f'  {name:<32} {current[name]["median"] * 1e3:10.3f} ms (MAD {current[name]["mad"] * 1e3:.3f})', flush=True)
+
+    stored = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            stored = json.load(f)
+
+    if args.update:
+        # hasil yang difilter digabung ke baseline lama, benchmark lain tidak hilang
+        results = dict(stored['results']) if stored is not None else {}
+        results.update(current)
+        os.makedirs(os.path.dirname(args.baseline) or '.', exist_ok=True)
+        with open(args.baseline, 'w') as f:
+            json.dump({'machine': machine_info(), 'results': dict(sorted(results.items()))}, f, indent=2)
+        print(f"\nBaseline disimpan ke {args.baseline} ({len(current)} dari {len(results)} benchmark diperbarui)")
+        return 0
+
+    if stored is None:
+        # tanpa baseline gate tidak bisa membandingkan apa-apa: gagal, jangan lolos diam-diam
+        print(f"\nGAGAL: baseline {args.baseline} tidak ada (buat dengan --update)")
+        return 2
+    if stored.get('machine') != machine_info():
+        print(f"\nPeringatan: baseline dibuat di mesin/Python lain ({stored.get('machine')})")
+
+    baseline = {name: result for name, result in stored['results'].items() if args.filter in name}
+    rows = compare(baseline, current, args.threshold)
+    print('\n' + format_rows(rows))
+
+    regressions = [row for row in rows if row[4] == 'REGRESI']
+    if regressions:
+        print(f"\nGAGAL: {len(regressions)} benchmark melambat melebihi batas")
+        return 1
+    print("\nOK: tidak ada regresi")
+    return 0
+
+
+if __name__ == "__main__":
+    # python src/perf_gate.py            (bandingkan dengan baseline, gagal kalo baseline belum ada)
+    # python src/perf_gate.py --update   (perbarui baseline)
+    sys.exit(main())
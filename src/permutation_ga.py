@@ -0,0 +1,235 @@
+import random
+import numpy as np
+from typing import List, Tuple, Optional
+from bin_packing import BinPacking
+from objective_function import objective_from_totals
+from anytime import ImprovementTrace
+
+
+def genetic_algorithm_permutation(
+    bp: BinPacking,
+    population_size: int = 50,
+    generations: int = 100,
+    mutation_rate: float = 0.1,
+    crossover_rate: float = 0.8,
+    elitism: int = 2,
+    crossover_type: str = 'ox',
+    trace: Optional[ImprovementTrace] = None
+) -> Tuple[List[List[str]], float, List[float], List[float]]:
+    """
+    Algoritma Genetika dengan representasi PERMUTASI
+
+    Kromosom berupa array int (urutan indeks item di bp.item_ids) yang di-decode
+    dengan First Fit di atas array sisa kapasitas. Semua operator bekerja pada
+    array int datar, jadi tidak perlu deepcopy maupun repair: setiap permutasi
+    selalu menghasilkan solusi valid.
+
+    Args:
+        bp: Instance BinPacking
+        population_size: Jumlah individu dalam populasi
+        generations: Jumlah generasi
+        mutation_rate: Probabilitas mutasi
+        crossover_rate: Probabilitas crossover
+        elitism: Jumlah individu terbaik yang dipertahankan
+        crossover_type: 'ox' (order crossover) atau 'pmx' (partially mapped crossover)
+        trace: ImprovementTrace opsional untuk mencatat event perbaikan
+
+    Returns:
+        best_state, best_score, best_history, avg_history
+        (format sama dengan genetic_algorithm, jadi plot_ga_convergence bisa langsung dipakai)
+    """
+    if crossover_type == 'ox':
+        crossover_fn = order_crossover
+    elif crossover_type == 'pmx':
+        crossover_fn = pmx_crossover
+    else:
+        raise ValueError(f"crossover_type tidak dikenal: {crossover_type}")
+    if bp.vector:
+        raise ValueError("GA permutasi hanya mendukung instance 1 dimensi")
+
+    sizes = np.array([bp.barang[item] for item in bp.item_ids], dtype=np.int64)
+    n = len(sizes)
+
+    # Inisialisasi populasi
+    population = [np.array(random.sample(range(n), n), dtype=np.int64) for _ in range(population_size)]
+
+    best_history = []
+    avg_history = []
+
+    for generation in range(generations):
+        # Evaluasi (tanpa membangun state list of list)
+        objective_scores = [evaluate_permutation(perm, sizes, bp.kapasitas) for perm in population]
+
+        # Lacak statistik
+        best_history.append(min(objective_scores))
+        if trace is not None:
+            trace.count(len(objective_scores))
+            if best_history[-1] < trace.best_score:
+                # decode hanya saat incumbent trace benar-benar membaik
+                best_idx = objective_scores.index(best_history[-1])
+                trace.improve(best_history[-1], permutation_to_state(population[best_idx], sizes, bp))
+        avg_history.append(sum(objective_scores) / len(objective_scores))
+
+        new_population = []
+
+        # Elitisme: cukup simpan referensi, array elit tidak pernah dimodifikasi in-place
+        if elitism > 0:
+            elite_indices = sorted(range(len(objective_scores)),
+                                   key=lambda i: objective_scores[i])[:elitism]
+            for idx in elite_indices:
+                new_population.append(population[idx])
+
+        # Generate keturunan
+        while len(new_population) < population_size:
+            # Seleksi (indeks, bukan salinan)
+            parent1 = population[permutation_tournament(objective_scores)]
+            parent2 = population[permutation_tournament(objective_scores)]
+
+            # Crossover
+            if random.random() < crossover_rate:
+                child1 = crossover_fn(parent1, parent2)
+                child2 = crossover_fn(parent2, parent1)
+            else:
+                child1, child2 = parent1.copy(), parent2.copy()
+
+            # Mutasi (in-place pada array anak)
+            if random.random() < mutation_rate:
+                mutate_permutation(child1)
+            if random.random() < mutation_rate:
+                mutate_permutation(child2)
+
+            new_population.append(child1)
+            if len(new_population) < population_size:
+                new_population.append(child2)
+
+        population = new_population[:population_size]
+
+    # Kembalikan individu terbaik
+    final_scores = [evaluate_permutation(perm, sizes, bp.kapasitas) for perm in population]
+    best_idx = final_scores.index(min(final_scores))
+    best_state = permutation_to_state(population[best_idx], sizes, bp)
+    if trace is not None:
+        trace.count(len(final_scores))
+        trace.improve(final_scores[best_idx], best_state)
+
+    return best_state, final_scores[best_idx], best_history, avg_history
+
+
+def first_fit_decode(perm: np.ndarray, sizes: np.ndarray, kapasitas: int) -> Tuple[np.ndarray, int]:
+    """
+    Decode permutasi dengan First Fit di atas array sisa kapasitas
+
+    Returns:
+        assignment (indeks kontainer untuk tiap posisi di perm), jumlah kontainer
+    """
+    n = len(perm)
+    residual = np.full(n, kapasitas, dtype=np.int64)
+    assignment = np.empty(n, dtype=np.int64)
+    num_bins = 0
+
+    for pos in range(n):
+        size = sizes[perm[pos]]
+        # kontainer pertama yang masih muat (dicari vektorial)
+        fits = residual[:num_bins] >= size
+        bin_idx = int(fits.argmax()) if num_bins > 0 and fits.any() else num_bins
+        if bin_idx == num_bins:
+            num_bins += 1
+        residual[bin_idx] -= size
+        assignment[pos] = bin_idx
+
+    return assignment, num_bins
+
+
+def evaluate_permutation(perm: np.ndarray, sizes: np.ndarray, kapasitas: int) -> float:
+    """Nilai objektif dari hasil decode First Fit (sama dengan calculate_objective)"""
+    _, num_bins = first_fit_decode(perm, sizes, kapasitas)
+    if num_bins == 0:
+        return float('inf')
+
+    # First Fit tidak pernah overflow (kecuali item lebih besar dari kapasitas)
+    total = int(sizes.sum())
+    overflow = int(np.maximum(sizes - kapasitas, 0).sum())
+    wasted_space = num_bins * kapasitas - total + overflow
+    return objective_from_totals(num_bins, overflow, wasted_space)
+
+
+def permutation_to_state(perm: np.ndarray, sizes: np.ndarray, bp: BinPacking) -> List[List[str]]:
+    """Ubah permutasi menjadi state list of list (hanya untuk hasil akhir)"""
+    assignment, num_bins = first_fit_decode(perm, sizes, bp.kapasitas)
+    state = [[] for _ in range(num_bins)]
+    for pos, bin_idx in enumerate(assignment.tolist()):
+        state[bin_idx].append(bp.item_ids[perm[pos]])
+    return state
+
+
+def permutation_tournament(objective_scores: List[float], tournament_size: int = 3) -> int:
+    """Seleksi turnamen, mengembalikan indeks individu terbaik (objektif minimum)"""
+    tournament_indices = random.sample(range(len(objective_scores)), tournament_size)
+    return min(tournament_indices, key=lambda i: objective_scores[i])
+
+
+def order_crossover(parent1: np.ndarray, parent2: np.ndarray) -> np.ndarray:
+    """
+    Order Crossover (OX)
+    Segmen dari parent1 dipertahankan, sisanya diisi sesuai urutan di parent2
+    """
+    n = len(parent1)
+    a, b = sorted(random.sample(range(n + 1), 2)) if n > 1 else (0, n)
+
+    taken = np.zeros(n, dtype=bool)
+    taken[parent1[a:b]] = True
+    rest = parent2[~taken[parent2]]
+
+    child = np.empty_like(parent1)
+    child[a:b] = parent1[a:b]
+    child[:a] = rest[:a]
+    child[b:] = rest[a:]
+    return child
+
+
+def pmx_crossover(parent1: np.ndarray, parent2: np.ndarray) -> np.ndarray:
+    """
+    Partially Mapped Crossover (PMX)
+    Segmen dari parent1 disalin, konflik di luar segmen diselesaikan lewat mapping segmen
+    """
+    n = len(parent1)
+    a, b = sorted(random.sample(range(n + 1), 2)) if n > 1 else (0, n)
+
+    child = parent2.copy()
+    child[a:b] = parent1[a:b]
+
+    # posisi tiap gen di parent1, untuk mengikuti rantai mapping
+    pos_in_parent1 = np.empty(n, dtype=np.int64)
+    pos_in_parent1[parent1] = np.arange(n)
+
+    in_segment = np.zeros(n, dtype=bool)
+    in_segment[parent1[a:b]] = True
+
+    outside = np.concatenate((np.arange(a), np.arange(b, n)))
+    conflicts = outside[in_segment[child[outside]]]
+    for pos in conflicts.tolist():
+        gene = child[pos]
+        while in_segment[gene]:
+            gene = parent2[pos_in_parent1[gene]]
+        child[pos] = gene
+
+    return child
+
+
+def mutate_permutation(perm: np.ndarray):
+    """Mutasi in-place: swap dua posisi atau insertion (pindahkan satu gen ke posisi lain)"""
+    n = len(perm)
+    if n < 2:
+        return
+
+    i, j = random.sample(range(n), 2)
+
+    if random.random() < 0.5:
+        perm[i], perm[j] = perm[j], perm[i]
+    else:
+        gene = perm[i]
+        if i < j:
+            perm[i:j] = perm[i + 1:j + 1].copy()
+        else:
+            perm[j + 1:i + 1] = perm[j:i].copy()
+        perm[j] = gene
@@ -0,0 +1,36 @@
+from typing import List, Sequence, Tuple
+
+# State immutable: tuple of kontainer, tiap kontainer tuple of item_id.
+# Move hanya membangun ulang kontainer yang tersentuh, kontainer lain dipakai
+# bersama (structural sharing) oleh state lama dan baru. Karena tidak pernah
+# dimodifikasi, state persistent bisa disimpan sebagai referensi tanpa copy; snapshot
+# dari struktur yang bisa berubah (misal list kontainer di NeighborSampler) cukup
+# menyalin tuple luarnya, O(jumlah kontainer) pointer, item tidak ikut disalin.
+Bin = Tuple[str, ...]
+PersistentState = Tuple[Bin, ...]
+
+
+def freeze(state: Sequence[Sequence[str]]) -> PersistentState:
+    """
+    Ubah state (list of list) menjadi PersistentState
+    Kontainer yang sudah berupa tuple dipakai ulang tanpa disalin
+    """
+    if isinstance(state, tuple) and all(isinstance(bin_items, tuple) for bin_items in state):
+        return state
+    return tuple(tuple(bin_items) for bin_items in state)
+
+
+def thaw(state: Sequence[Sequence[str]]) -> List[List[str]]:
+    """Ubah PersistentState kembali menjadi list of list yang bisa dimodifikasi"""
+    return [list(bin_items) for bin_items in state]
+
+
+def remove_item(bin_items: Bin, item: str) -> Bin:
+    """Kontainer baru tanpa item (kontainer lama tidak berubah)"""
+    pos = bin_items.index(item)
+    return bin_items[:pos] + bin_items[pos + 1:]
+
+
+def add_item(bin_items: Bin, item: str) -> Bin:
+    """Kontainer baru dengan item ditambahkan (kontainer lama tidak berubah)"""
+    return bin_items + (item,)
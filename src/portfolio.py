@@ -0,0 +1,298 @@
+import os
+import sys
+import json
+import time
+import queue
+import random
+import multiprocessing as mp
+from typing import List, Dict, Tuple, Optional
+from bin_packing import BinPacking
+from objective_function import calculate_objective, lower_bound_score
+from anytime import ImprovementTrace, DeadlineTrace, SolveInterrupted
+from hill_climbing import steepest_ascent_hill_climbing
+from simulated_annealing import simulated_annealing, simulated_annealing_with_reheating
+from genetic_algorithm import genetic_algorithm
+
+# Portfolio default: (algoritma, parameter), dibagikan bergiliran ke worker
+# (steepest ascent HC tidak dimasukkan: satu iterasinya membangkitkan semua tetangga,
+# jadi di instance besar worker baru bisa merespon sinyal berhenti setelah lama)
+DEFAULT_PORTFOLIO = [
+    ('sa', {'alpha': 0.995, 'max_iterations': 2000}),
+    ('ga', {'population_size': 30, 'generations': 30}),
+    ('sa_reheat', {'alpha': 0.995, 'max_iterations': 2000}),
+    ('ga_permutation', {'population_size': 30, 'generations': 30}),
+]
+
+
+class _Incumbent:
+    """
+    Incumbent global di shared memory: skor, versi, dan kontainer tiap item (int32)
+    Semua akses lewat satu lock
+    """
+
+    def __init__(self, ctx, num_items: int):
+        self.lock = ctx.Lock()
+        self.score = ctx.Value('d', float('inf'), lock=False)
+        self.version = ctx.Value('i', 0, lock=False)
+        self.assignment = ctx.Array('i', max(1, num_items), lock=False)
+
+    def publish(self, state: List[List[str]], score: float, position: Dict[str, int]) -> bool:
+        """Tulis state kalo lebih baik dari incumbent sekarang"""
+        with self.lock:
+            if score >= self.score.value:
+                return False
+            for bin_idx, bin_items in enumerate(state):
+                for item in bin_items:
+                    self.assignment[position[item]] = bin_idx
+            self.score.value = score
+            self.version.value += 1
+            return True
+
+    def read(self, item_ids: List[str], timeout: Optional[float] = None) -> Tuple[Optional[List[List[str]]], Optional[float], int]:
+        """
+        Salin incumbent (None kalo belum ada)
+        Dengan timeout: kalo lock tidak didapat (worker dihentikan paksa di dalam publish),
+        array dibaca tanpa lock dan skor dikembalikan None. Array bisa campuran dua publish,
+        tapi tetap partisi lengkap (tiap item punya kontainer), jadi skornya cukup dihitung ulang.
+        """
+        if not self.lock.acquire(timeout=-1 if timeout is None else timeout):
+            if self.version.value == 0:
+                return None, float('inf'), 0
+            return decode_assignment(self.assignment[:len(item_ids)], item_ids), None, self.version.value
+        try:
+            if self.version.value == 0:
+                return None, float('inf'), 0
+            assignment = self.assignment[:len(item_ids)]
+            score, version = self.score.value, self.version.value
+        finally:
+            self.lock.release()
+        return decode_assignment(assignment, item_ids), score, version
+
+
+def decode_assignment(assignment: List[int], item_ids: List[str]) -> List[List[str]]:
+    """Ubah array kontainer-per-item kembali menjadi state"""
+    state = [[] for _ in range(max(assignment) + 1 if assignment else 0)]
+    for item, bin_idx in zip(item_ids, assignment):
+        state[bin_idx].append(item)
+    return [bin_items for bin_items in state if bin_items]
+
+
+def run_with_incumbent(bp: BinPacking, algorithm: str, params: Dict,
+                       incumbent: Optional[List[List[str]]], trace: ImprovementTrace) -> List[List[str]]:
+    """
+    Satu kali run algoritma; kalo incumbent diberikan, SA/HC mulai dari incumbent
+    dan GA memasukkannya ke populasi awal (ga_permutation selalu mulai acak)
+    """
+    start = incumbent if incumbent is not None else bp.initial_state_first_fit()
+    if algorithm == 'sa':
+        return simulated_annealing(bp, start, trace=trace, **params)[0]
+    if algorithm == 'sa_reheat':
+        return simulated_annealing_with_reheating(bp, start, trace=trace, **params)[0]
+    if algorithm == 'hc':
+        return steepest_ascent_hill_climbing(bp, start, trace=trace, **params)[0]
+    if algorithm == 'ga':
+        return genetic_algorithm(bp, seed_states=[incumbent] if incumbent is not None else None, trace=trace, **params)[0]
+    if algorithm == 'ga_permutation':
+        # NumPy hanya di-load kalo GA permutasi benar-benar dipakai
+        from permutation_ga import genetic_algorithm_permutation
+        return genetic_algorithm_permutation(bp, trace=trace, **params)[0]
+    raise ValueError(f"algorithm tidak dikenal: {algorithm}")
+
+
+def _portfolio_worker(worker_id: int, kapasitas: int, barang: Dict[str, int], item_ids: List[str],
+                      algorithm: str, params: Dict, inject: bool, seed: int, deadline: float,
+                      lower_bound: float, incumbent: _Incumbent, stop_event, reports):
+    """
+    Worker: restart algoritmanya berulang kali sampai deadline / sinyal berhenti
+    Setiap hasil yang lebih baik dipublikasikan ke incumbent global (juga state terbaik
+    run yang terpotong deadline, lewat trace.best_state); kalo incumbent berubah sejak
+    restart terakhir dan inject=True, restart berikutnya mulai dari situ.
+    """
+    random.seed(seed)
+    bp = BinPacking(kapasitas, barang)
+    position = {item: idx for idx, item in enumerate(item_ids)}
+    restarts = 0
+    improvements = 0
+    seen_version = 0
+
+    while not stop_event.is_set() and time.time() < deadline:
+        start_state = None
+        if inject:
+            state, _, version = incumbent.read(item_ids)
+            if version != seen_version:
+                start_state, seen_version = state, version
+
+        trace = DeadlineTrace(deadline, stop_event)
+        interrupted = False
+        try:
+            result = run_with_incumbent(bp, algorithm, params, start_state, trace)
+            restarts += 1
+        except SolveInterrupted:
+            # run terpotong deadline: solusi terbaiknya sejauh ini disimpan trace
+            result, interrupted = trace.best_state, True
+
+        if result is not None:
+            score = calculate_objective(result, kapasitas, barang)
+            if incumbent.publish(result, score, position):
+                improvements += 1
+                reports.put(('improve', worker_id, algorithm, time.time(), score))
+                if score <= lower_bound:
+                    stop_event.set()
+        if interrupted:
+            break
+
+    reports.put(('done', worker_id, algorithm, restarts, improvements))
+
+
+def portfolio_solver(
+    bp: BinPacking,
+    portfolio: Optional[List[Tuple[str, Dict]]] = None,
+    n_workers: Optional[int] = None,
+    time_limit: float = 10.0,
+    inject_incumbent: bool = True,
+    seed: Optional[int] = None,
+    shutdown_grace: float = 2.0
+) -> Tuple[List[List[str]], float, Dict]:
+    """
+    Portfolio kooperatif: HC/SA/GA jalan bersamaan di worker process dan berbagi incumbent
+
+    Tiap worker menjalankan satu algoritma dari portfolio (bergiliran kalo worker
+    lebih banyak dari algoritma) dengan restart berulang. Solusi yang lebih baik
+    ditulis ke incumbent global di shared memory; dengan inject_incumbent=True
+    restart SA/HC dimulai dari incumbent dan GA memasukkannya ke populasi awal.
+    Semua worker berhenti begitu incumbent mencapai lower bound atau time_limit habis.
+
+    Args:
+        bp: Instance BinPacking
+        portfolio: List (algoritma, parameter), default DEFAULT_PORTFOLIO
+        n_workers: Jumlah worker process (default: os.cpu_count())
+        time_limit: Batas waktu dalam detik
+        inject_incumbent: Bagikan incumbent ke restart worker lain
+        seed: Seed random (tiap worker memakai seed + indeks worker)
+        shutdown_grace: Waktu (detik) menunggu worker berhenti sendiri setelah sinyal stop,
+            sesudahnya worker yang masih jalan di-terminate
+
+    Returns:
+        best_state, best_score, info (lower_bound, reached_lower_bound, elapsed,
+        improvements [(detik, algoritma, skor)], workers [(algoritma, restarts, improvements)])
+    """
+    if bp.vector:
+        # lower bound, skor incumbent dan worker (BinPacking dari kapasitas/barang) 1 dimensi
+        raise ValueError("portfolio hanya mendukung instance 1 dimensi")
+    portfolio = portfolio or DEFAULT_PORTFOLIO
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    n_workers = max(1, n_workers)
+
+    if seed is not None:
+        random.seed(seed)
+    base_seed = seed if seed is not None else random.randrange(2**31)
+
+    item_ids = list(bp.item_ids)
+    barang = {item: bp.barang[item] for item in item_ids}
+    lower_bound = lower_bound_score(bp.kapasitas, barang.values())
+
+    ctx = mp.get_context()
+    incumbent = _Incumbent(ctx, len(item_ids))
+    stop_event = ctx.Event()
+    reports = ctx.Queue()
+
+    # incumbent awal dari first fit, jadi selalu ada solusi walaupun deadline sangat pendek
+    first_fit = bp.initial_state_first_fit()
+    first_fit_score = calculate_objective(first_fit, bp.kapasitas, barang)
+    incumbent.publish(first_fit, first_fit_score, {item: idx for idx, item in enumerate(item_ids)})
+
+    started = time.time()
+    if first_fit_score <= lower_bound:
+        return first_fit, first_fit_score, {
+            'lower_bound': lower_bound, 'reached_lower_bound': True, 'elapsed': 0.0,
+            'improvements': [], 'workers': [],
+        }
+
+    deadline = started + time_limit
+    workers = []
+    for worker_id in range(n_workers):
+        algorithm, params = portfolio[worker_id % len(portfolio)]
+        process = ctx.Process(
+            target=_portfolio_worker,
+            args=(worker_id, bp.kapasitas, barang, item_ids, algorithm, params, inject_incumbent,
+                  base_seed + worker_id, deadline, lower_bound, incumbent, stop_event, reports),
+            daemon=True
+        )
+        process.start()
+        workers.append(process)
+
+    # kumpulkan laporan sampai semua worker selesai
+    improvements = []
+    worker_info = {}
+    while len(worker_info) < n_workers:
+        try:
+            message = reports.get(timeout=max(0.1, deadline - time.time() + 5.0))
+        except queue.Empty:
+            # worker macet (misal satu run sangat panjang tanpa evaluasi): hentikan paksa
+            break
+        if message[0] == 'improve':
+            _, _, algorithm, timestamp, score = message
+            improvements.append((timestamp - started, algorithm, score))
+        else:
+            _, worker_id, algorithm, restarts, count = message
+            worker_info[worker_id] = (algorithm, restarts, count)
+
+    # berhenti kooperatif: worker mengecek stop_event lewat DeadlineTrace lalu keluar sendiri;
+    # terminate hanya untuk worker yang masih macet setelah masa tenggang
+    stop_event.set()
+    grace_end = time.time() + shutdown_grace
+    for process in workers:
+        process.join(timeout=max(0.0, grace_end - time.time()))
+    for process in workers:
+        if process.is_alive():
+            process.terminate()
+            process.join()
+
+    # worker yang di-terminate bisa mati sambil memegang lock incumbent
+    best_state, best_score, _ = incumbent.read(item_ids, timeout=1.0)
+    if best_score is None:
+        best_score = calculate_objective(best_state, bp.kapasitas, barang)
+        if best_score > first_fit_score:
+            best_state, best_score = first_fit, first_fit_score
+    info = {
+        'lower_bound': lower_bound,
+        'reached_lower_bound': best_score <= lower_bound,
+        'elapsed': time.time() - started,
+        'improvements': improvements,
+        'workers': [worker_info.get(idx, (portfolio[idx % len(portfolio)][0], 0, 0)) for idx in range(n_workers)],
+    }
+    return best_state, best_score, info
+
+
+def self_check(n_workers: int = 1, time_limit: float = 1.0) -> Dict:
+    """
+    Check run yang terpotong deadline: SA dengan budget iterasi jauh melebihi
+    time_limit di instance besar (urutan ukuran naik, first fit jelek) harus
+    tetap mempublikasikan state terbaiknya, jadi hasil portfolio lebih baik
+    dari incumbent awal first fit
+    """
+    rng = random.Random(0)
+    sizes = sorted(rng.randint(5, 70) for _ in range(3000))
+    bp = BinPacking(100, {f'I{i}': size for i, size in enumerate(sizes)})
+    first_fit_score = calculate_objective(bp.initial_state_first_fit(), bp.kapasitas, bp.barang)
+
+    long_sa = [('sa', {'T_initial': 5.0, 'alpha': 0.999999, 'max_iterations': 10**8})]
+    state, score, info = portfolio_solver(bp, long_sa, n_workers=n_workers, time_limit=time_limit, seed=0)
+    return {
+        'first_fit_score': first_fit_score,
+        'score': score,
+        'valid_ok': bp.is_valid(state),
+        'cutoff_ok': score < first_fit_score,
+        'workers': info['workers'],
+    }
+
+
+if __name__ == "__main__":
+    # python src/portfolio.py selfcheck
+    if len(sys.argv) < 2 or sys.argv[1] != 'selfcheck':
+        print("Usage: python src/portfolio.py selfcheck")
+        sys.exit(1)
+    result = self_check()
+    print(json.dumps(result, indent=2))
+    sys.exit(0 if all(value for key, value in result.items() if key.endswith('_ok')) else 1)
@@ -0,0 +1,167 @@
+import json
+import time
+import socket
+from typing import Callable, Dict, Optional
+
+
+class ProgressObserver:
+    """
+    Observer progres solver dengan event yang di-throttle
+
+    Solver memanggil update() setiap iterasi; observer hanya membangun dan
+    mengirim event paling sering sekali per min_interval detik. Supaya update()
+    tetap murah, jam (perf_counter) tidak dibaca tiap panggilan: hanya setiap
+    `stride` panggilan, dan stride disesuaikan otomatis sehingga jam dibaca
+    sekitar 10x per interval.
+
+    Event berupa dict:
+        algorithm, iteration, elapsed, incumbent (skor terbaik), current,
+        temperature (SA), evaluations, evals_per_sec, acceptance_rate, done
+
+    Subclass cukup meng-override emit(event).
+    """
+
+    def __init__(self, min_interval: float = 0.5):
+        self.min_interval = min_interval
+        self.algorithm = None
+        self._start = 0.0
+        self._last_emit = 0.0
+        self._last_check = 0.0
+        self._stride = 1
+        self._countdown = 1
+        self._calls_since_check = 0
+        self.evaluations = 0
+        self._evaluations_at_emit = 0
+        self._proposed = 0
+        self._accepted = 0
+
+    def start(self, algorithm: str):
+        """Dipanggil solver sekali di awal run"""
+        self.algorithm = algorithm
+        self._start = self._last_emit = self._last_check = time.perf_counter()
+        self._stride = self._countdown = 1
+        self._calls_since_check = 0
+        self.evaluations = self._evaluations_at_emit = 0
+        self._proposed = self._accepted = 0
+
+    def update(self, iteration: int, incumbent: float, evaluations: int = 1, current: Optional[float] = None,
+               temperature: Optional[float] = None, accepted: Optional[bool] = None):
+        """Dipanggil solver setiap iterasi (jalur cepat: beberapa penjumlahan)"""
+        self.evaluations += evaluations
+        if accepted is not None:
+            self._proposed += 1
+            if accepted:
+                self._accepted += 1
+
+        self._countdown -= 1
+        if self._countdown > 0:
+            return
+        self._check(iteration, incumbent, current, temperature)
+
+    def _check(self, iteration, incumbent, current, temperature):
+        now = time.perf_counter()
+        # sesuaikan stride supaya jam dibaca ~10x per min_interval
+        since_check = now - self._last_check
+        target = self.min_interval / 10
+        if since_check > 0:
+            self._stride = max(1, min(self._stride * 4, int(self._stride * target / since_check) or 1))
+        self._countdown = self._stride
+        self._last_check = now
+
+        if now - self._last_emit >= self.min_interval:
+            self.emit(self._event(now, iteration, incumbent, current, temperature, done=False))
+
+    def finish(self, iteration: int, incumbent: float, current: Optional[float] = None, temperature: Optional[float] = None):
+        """Dipanggil solver sekali di akhir run (selalu mengirim event terakhir)"""
+        self.emit(self._event(time.perf_counter(), iteration, incumbent, current, temperature, done=True))
+
+    def _event(self, now, iteration, incumbent, current, temperature, done) -> Dict:
+        window = now - self._last_emit
+        rate = (self.evaluations - self._evaluations_at_emit) / window if window > 0 else 0.0
+        event = {
+            'algorithm': self.algorithm,
+            'iteration': iteration,
+            'elapsed': now - self._start,
+            'incumbent': incumbent,
+            'current': current,
+            'temperature': temperature,
+            'evaluations': self.evaluations,
+            'evals_per_sec': rate,
+            'acceptance_rate': self._accepted / self._proposed if self._proposed else None,
+            'done': done,
+        }
+        self._last_emit = now
+        self._evaluations_at_emit = self.evaluations
+        self._proposed = self._accepted = 0
+        return event
+
+    def emit(self, event: Dict):
+        pass
+
+
+class CallbackObserver(ProgressObserver):
+    """Observer yang meneruskan setiap event ke callback(event)"""
+
+    def __init__(self, callback: Callable[[Dict], None], min_interval: float = 0.5):
+        super().__init__(min_interval)
+        self.callback = callback
+
+    def emit(self, event: Dict):
+        self.callback(event)
+
+
+class NDJSONSink(ProgressObserver):
+    """
+    Observer yang menulis event sebagai JSON per baris (newline-delimited) untuk
+    dashboard live
+
+    target:
+        - path berkas (di-append)
+        - 'tcp:host:port' atau 'unix:/path/socket' untuk dikirim lewat socket
+    Kalo koneksi socket putus, event berikutnya dibuang (solver tidak ikut gagal).
+
+    Contoh:
+        with NDJSONSink('results/progress.ndjson') as sink:
+            simulated_annealing(bp, state, observer=sink)
+    """
+
+    def __init__(self, target: str, min_interval: float = 0.5):
+        super().__init__(min_interval)
+        self.target = target
+        self._file = None
+        self._sock = None
+
+        if target.startswith('tcp:'):
+            host, port = target[len('tcp:'):].rsplit(':', 1)
+            self._sock = socket.create_connection((host, int(port)))
+        elif target.startswith('unix:'):
+            self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._sock.connect(target[len('unix:'):])
+        else:
+            self._file = open(target, 'a')
+
+    def emit(self, event: Dict):
+        line = json.dumps(event) + '\n'
+        if self._file is not None:
+            self._file.write(line)
+            self._file.flush()
+        elif self._sock is not None:
+            try:
+                self._sock.sendall(line.encode('utf-8'))
+            except OSError:
+                self._sock.close()
+                self._sock = None
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,305 @@
+import os
+import sys
+import json
+import time
+import zlib
+import sqlite3
+import argparse
+from array import array
+from typing import Dict, Iterator, List, Optional, Sequence
+
+DEFAULT_PATH = 'results/results.db'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    algorithm TEXT NOT NULL,
+    params TEXT NOT NULL,
+    seed INTEGER,
+    score REAL NOT NULL,
+    num_bins INTEGER,
+    time REAL,
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_instance_algorithm ON runs (fingerprint, algorithm, score);
+CREATE INDEX IF NOT EXISTS idx_runs_algorithm ON runs (algorithm, score);
+CREATE TABLE IF NOT EXISTS histories (
+    run_id INTEGER PRIMARY KEY REFERENCES runs (id),
+    data BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS instances (
+    fingerprint TEXT PRIMARY KEY,
+    name TEXT,
+    num_items INTEGER,
+    kapasitas TEXT
+);
+"""
+
+# Kolom yang boleh dipakai untuk filter / group by (nama kolom tidak bisa di-bind sebagai parameter SQL)
+GROUP_COLUMNS = ('fingerprint', 'algorithm', 'params', 'seed')
+RUN_COLUMNS = ('id', 'fingerprint', 'algorithm', 'params', 'seed', 'score', 'num_bins', 'time', 'created')
+
+
+def encode_history(history: Sequence[float]) -> bytes:
+    """History skor -> blob (array double terkompresi zlib)"""
+    return zlib.compress(array('d', history).tobytes())
+
+
+def decode_history(blob: bytes) -> List[float]:
+    values = array('d')
+    values.frombytes(zlib.decompress(blob))
+    return values.tolist()
+
+
+def canonical_params(params: Optional[Dict]) -> str:
+    """JSON parameter dengan key terurut, supaya konfigurasi yang sama selalu sama persis"""
+    return json.dumps(params or {}, sort_keys=True, separators=(',', ':'), default=str)
+
+
+class ResultsStore:
+    """
+    Penyimpanan hasil eksperimen di SQLite (satu berkas, mode WAL)
+
+    - add_run() hanya menambah ke buffer; buffer ditulis dalam satu transaksi
+      (executemany) setiap batch_size run, saat flush() atau close()
+    - WAL: pembaca (laporan/plot) tidak memblokir penulis dan sebaliknya; beberapa
+      proses penulis antre lewat timeout
+    - history skor (opsional) disimpan terkompresi di tabel terpisah, jadi agregasi
+      atas tabel runs tidak ikut membaca blob
+    - query memakai indeks (fingerprint, algorithm, score) dan (algorithm, score);
+      agregat dihitung di SQLite dan iterator membaca baris per baris, jadi tidak
+      perlu me-load semua run ke memori
+
+    Contoh:
+        with ResultsStore('results/results.db') as store:
+            store.add_run(fingerprint, 'sa', params, seed, score, num_bins, elapsed, history)
+            for row in store.summary(fingerprint):
+                print(row['algorithm'], row['mean'])
+    """
+
+    def __init__(self, path: str = DEFAULT_PATH, batch_size: int = 1000, timeout: float = 30.0):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.batch_size = batch_size
+        # autocommit: transaksi diatur sendiri di flush()
+        self.conn = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        # NORMAL cukup aman di mode WAL (commit bisa hilang saat listrik mati, database tetap konsisten)
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA)
+        self._pending = []
+
+    # ------------------------------------------------------------------
+    # Penulisan
+    # ------------------------------------------------------------------
+
+    def add_run(self, fingerprint: str, algorithm: str, params: Optional[Dict], seed: Optional[int], score: float,
+                num_bins: Optional[int] = None, elapsed: Optional[float] = None,
+                history: Optional[Sequence[float]] = None):
+        """Tambah satu run ke buffer (ditulis per batch)"""
+        self._pending.append((fingerprint, algorithm, canonical_params(params), seed, score, num_bins, elapsed,
+                              time.time(), encode_history(history) if history is not None else None))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def add_instance(self, fingerprint: str, name: Optional[str] = None, num_items: Optional[int] = None,
+                     kapasitas=None):
+        """Catat metadata instance (sekali per fingerprint, entry yang ada tidak ditimpa)"""
+        self.conn.execute('INSERT OR IGNORE INTO instances VALUES (?, ?, ?, ?)',
+                          (fingerprint, name, num_items, json.dumps(kapasitas) if kapasitas is not None else None))
+
+    def flush(self):
+        """Tulis semua run di buffer dalam satu transaksi"""
+        if not self._pending:
+            return
+
+        # BEGIN IMMEDIATE mengambil lock tulis di awal, jadi id bisa dibagikan
+        # sendiri (dibutuhkan untuk tabel histories) tanpa bentrok dengan proses lain.
+        # Kalo gagal (database sibuk melewati timeout) buffer masih utuh untuk flush berikutnya
+        self.conn.execute('BEGIN IMMEDIATE')
+        pending = self._pending
+        try:
+            next_id = self.conn.execute('SELECT COALESCE(MAX(id), 0) + 1 FROM runs').fetchone()[0]
+            self.conn.executemany(
+                'INSERT INTO runs (id, fingerprint, algorithm, params, seed, score, num_bins, time, created) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                [(next_id + offset,) + row[:8] for offset, row in enumerate(pending)])
+            self.conn.executemany(
+                'INSERT INTO histories (run_id, data) VALUES (?, ?)',
+                [(next_id + offset, row[8]) for offset, row in enumerate(pending) if row[8] is not None])
+            self.conn.execute('COMMIT')
+        except BaseException:
+            # run tetap di buffer, dicoba lagi di flush berikutnya
+            if self.conn.in_transaction:
+                self.conn.execute('ROLLBACK')
+            raise
+        self._pending = []
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Query
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _where(filters: Dict) -> tuple:
+        clauses = []
+        values = []
+        for column, value in filters.items():
+            if value is None:
+                continue
+            if column not in GROUP_COLUMNS:
+                raise ValueError(f"kolom filter tidak dikenal: {column}")
+            if column == 'params' and not isinstance(value, str):
+                value = canonical_params(value)
+            clauses.append(f'{column} = ?')
+            values.append(value)
+        return (' WHERE ' + ' AND '.join(clauses) if clauses else ''), values
+
+    def runs(self, fingerprint: Optional[str] = None, algorithm: Optional[str] = None, params=None,
+             with_history: bool = False, order_by_score: bool = False, limit: Optional[int] = None) -> Iterator[Dict]:
+        """Iterasi run (dict per baris) dengan filter opsional, dibaca bertahap dari cursor"""
+        self.flush()
+        where, values = self._where({'fingerprint': fingerprint, 'algorithm': algorithm, 'params': params})
+        columns = ', '.join(f'runs.{column}' for column in RUN_COLUMNS)
+        query = f'SELECT {columns}'
+        if with_history:
+            query += ', histories.data AS history FROM runs LEFT JOIN histories ON histories.run_id = runs.id'
+        else:
+            query += ' FROM runs'
+        query += where
+        if order_by_score:
+            query += ' ORDER BY runs.score'
+        if limit is not None:
+            query += f' LIMIT {int(limit)}'
+
+        for row in self.conn.execute(query, values):
+            run = {column: row[column] for column in RUN_COLUMNS}
+            run['params'] = json.loads(run['params'])
+            if with_history:
+                run['history'] = decode_history(row['history']) if row['history'] is not None else None
+            yield run
+
+    def scores(self, fingerprint: Optional[str] = None, algorithm: Optional[str] = None, params=None,
+               chunk_size: int = 10000) -> Iterator[List[float]]:
+        """Skor run dalam potongan list (untuk agregator streaming, misal StreamingStatistics.update)"""
+        self.flush()
+        where, values = self._where({'fingerprint': fingerprint, 'algorithm': algorithm, 'params': params})
+        cursor = self.conn.execute(f'SELECT score FROM runs{where}', values)
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield [row[0] for row in rows]
+
+    def statistics(self, fingerprint: Optional[str] = None, algorithm: Optional[str] = None, params=None, **kwargs):
+        """StreamingStatistics (kuantil, CI bootstrap) dari skor yang cocok dengan filter"""
+        # NumPy hanya dibutuhkan di sini
+        from streaming_stats import StreamingStatistics
+        stats = StreamingStatistics(**kwargs)
+        for chunk in self.scores(fingerprint, algorithm, params):
+            stats.update(chunk)
+        return stats
+
+    def summary(self, fingerprint: Optional[str] = None, algorithm: Optional[str] = None,
+                group_by: Sequence[str] = ('algorithm',)) -> List[Dict]:
+        """
+        Agregat per grup, dihitung di SQLite
+
+        Returns:
+            List dict: kolom group_by + count, mean, min, max, std (populasi, sama
+            dengan calculate_statistics), mean_bins, mean_time
+        """
+        self.flush()
+        for column in group_by:
+            if column not in GROUP_COLUMNS:
+                raise ValueError(f"kolom group_by tidak dikenal: {column}")
+        where, values = self._where({'fingerprint': fingerprint, 'algorithm': algorithm})
+        groups = ', '.join(group_by)
+        select_groups = groups + ', ' if groups else ''
+        query = (f'SELECT {select_groups}COUNT(*) AS count, AVG(score) AS mean, MIN(score) AS min, MAX(score) AS max, '
+                 f'AVG(score * score) AS mean_sq, AVG(num_bins) AS mean_bins, AVG(time) AS mean_time FROM runs{where}')
+        if groups:
+            query += f' GROUP BY {groups} ORDER BY {groups}'
+
+        result = []
+        for row in self.conn.execute(query, values):
+            entry = {column: row[column] for column in group_by}
+            if row['count'] == 0:
+                continue
+            entry.update(count=row['count'], mean=row['mean'], min=row['min'], max=row['max'],
+                         std=max(0.0, row['mean_sq'] - row['mean'] ** 2) ** 0.5,
+                         mean_bins=row['mean_bins'], mean_time=row['mean_time'])
+            result.append(entry)
+        return result
+
+    def best(self, fingerprint: Optional[str] = None, algorithm: Optional[str] = None) -> Optional[Dict]:
+        """Run dengan skor terbaik (terkecil)"""
+        return next(self.runs(fingerprint, algorithm, with_history=True, order_by_score=True, limit=1), None)
+
+    def history(self, run_id: int) -> Optional[List[float]]:
+        row = self.conn.execute('SELECT data FROM histories WHERE run_id = ?', (run_id,)).fetchone()
+        return decode_history(row[0]) if row is not None else None
+
+    def instances(self) -> List[Dict]:
+        """Semua fingerprint yang punya run, beserta metadata instance kalo dicatat"""
+        self.flush()
+        query = ('SELECT runs.fingerprint AS fingerprint, instances.name AS name, instances.num_items AS num_items, '
+                 'COUNT(*) AS runs FROM runs LEFT JOIN instances ON instances.fingerprint = runs.fingerprint '
+                 'GROUP BY runs.fingerprint ORDER BY runs.fingerprint')
+        return [dict(row) for row in self.conn.execute(query)]
+
+
+def format_summary(rows: List[Dict], group_by: Sequence[str] = ('algorithm',)) -> List[str]:
+    """Baris tabel teks dari hasil ResultsStore.summary (header, garis, satu baris per grup)"""
+    header = ' | '.join(list(group_by) + ['runs', 'mean', 'std', 'min', 'max', 'bins', 'time (s)'])
+    lines = [header, '-' * len(header)]
+    for row in rows:
+        groups = [str(row[column])[:16] for column in group_by]
+        lines.append(' | '.join(groups + [str(row['count']), f"{row['mean']:.2f}", f"{row['std']:.2f}", f"{row['min']:.2f}",
+                                          f"{row['max']:.2f}", f"{row['mean_bins'] or 0:.2f}", f"{row['mean_time'] or 0:.4f}"]))
+    return lines
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Ringkasan hasil eksperimen dari results store SQLite")
+    parser.add_argument('path', nargs='?', default=DEFAULT_PATH)
+    parser.add_argument('--fingerprint', help="Filter instance (fingerprint)")
+    parser.add_argument('--algorithm', help="Filter algoritma")
+    parser.add_argument('--group-by', default='algorithm', help="Kolom grup dipisah koma (fingerprint,algorithm,params,seed)")
+    parser.add_argument('--plot', metavar='NAMA',
+                        help="Simpan plot agregat per algoritma (skor/kontainer/waktu + konvergensi run terbaik) ke results/NAMA.png")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.path):
+        print(f"Berkas tidak ditemukan: {args.path}")
+        return 1
+
+    group_by = [column for column in args.group_by.split(',') if column]
+    with ResultsStore(args.path) as store:
+        rows = store.summary(args.fingerprint, args.algorithm, group_by)
+        print('\n'.join(format_summary(rows, group_by)))
+
+        if args.plot:
+            # matplotlib hanya di-load kalo plot diminta
+            from visualizer import plot_store_summary
+            plot_store_summary(store, args.plot, args.fingerprint)
+            print(f"Plot disimpan ke results/{args.plot}.png")
+    return 0
+
+
+if __name__ == "__main__":
+    # python src/results_store.py results/results.db --group-by fingerprint,algorithm
+    # python src/results_store.py results/results.db --plot store_summary
+    sys.exit(main())
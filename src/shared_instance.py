@@ -0,0 +1,201 @@
+import os
+import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Dict, Tuple, Optional, Sequence
+from bin_packing import BinPacking
+from objective_function import calculate_objective
+from decomposition import run_algorithm
+
+# Item size disimpan sebagai int64 native ('q')
+_ITEMSIZE = 8
+
+
+class BinPackingView(BinPacking):
+    """
+    BinPacking ringan di atas array ukuran (bukan dict)
+
+    Item direpresentasikan sebagai indeks int 0..n-1, jadi barang[item] langsung
+    membaca array ukuran (misal memoryview ke shared memory) tanpa membangun dict,
+    dan item_ids cukup berupa range (tidak ada objek Python per item).
+    Semua method BinPacking dan algoritma yang sudah ada tetap bisa dipakai.
+    """
+
+    def __init__(self, kapasitas: int, sizes: Sequence[int], item_names: Optional[Sequence[str]] = None):
+        self.kapasitas = kapasitas
+        self.barang = sizes
+        self.item_ids = range(len(sizes))
+        self.item_names = item_names
+        self._size_index = None
+
+
+class SharedInstance:
+    """
+    Instance bin packing yang disimpan di multiprocessing.shared_memory
+
+    Blok 'sizes' berisi ukuran item (int64). Kalo include_ids=True, blok 'ids'
+    berisi tabel offset (int64, n+1) diikuti string id UTF-8 yang digabung,
+    sehingga worker bisa memetakan indeks item ke id aslinya.
+
+    Pembuat instance (owner) bertanggung jawab memanggil unlink() setelah selesai.
+    """
+
+    def __init__(self, sizes_name: str, num_items: int, kapasitas: int, ids_name: Optional[str] = None, owner: bool = False):
+        self.kapasitas = kapasitas
+        self.num_items = num_items
+        self.owner = owner
+
+        self._sizes_shm = shared_memory.SharedMemory(name=sizes_name)
+        self.sizes = self._sizes_shm.buf[:num_items * _ITEMSIZE].cast('q')
+
+        self._ids_shm = None
+        self._offsets = None
+        if ids_name is not None:
+            self._ids_shm = shared_memory.SharedMemory(name=ids_name)
+            self._offsets = self._ids_shm.buf[:(num_items + 1) * _ITEMSIZE].cast('q')
+
+    @classmethod
+    def create(cls, bp: BinPacking, include_ids: bool = False) -> 'SharedInstance':
+        """Salin ukuran item (dan opsional id) dari bp ke shared memory baru"""
+        n = len(bp.item_ids)
+        sizes = array('q', (bp.barang[item] for item in bp.item_ids))
+        sizes_shm = shared_memory.SharedMemory(create=True, size=max(1, n * _ITEMSIZE))
+        sizes_shm.buf[:n * _ITEMSIZE] = sizes.tobytes()
+
+        ids_name = None
+        if include_ids:
+            encoded = [str(item).encode('utf-8') for item in bp.item_ids]
+            offsets = array('q', [0])
+            for raw in encoded:
+                offsets.append(offsets[-1] + len(raw))
+            header = (n + 1) * _ITEMSIZE
+            ids_shm = shared_memory.SharedMemory(create=True, size=max(1, header + offsets[-1]))
+            ids_shm.buf[:header] = offsets.tobytes()
+            ids_shm.buf[header:header + offsets[-1]] = b''.join(encoded)
+            ids_name = ids_shm.name
+            ids_shm.close()
+
+        name = sizes_shm.name
+        sizes_shm.close()
+        return cls(name, n, bp.kapasitas, ids_name, owner=True)
+
+    def handle(self) -> Tuple[str, int, int, Optional[str]]:
+        """Data kecil yang cukup dikirim ke worker untuk attach ulang"""
+        ids_name = self._ids_shm.name if self._ids_shm is not None else None
+        return (self._sizes_shm.name, self.num_items, self.kapasitas, ids_name)
+
+    def item_name(self, idx: int) -> str:
+        """Id asli item ke-idx (butuh include_ids=True)"""
+        if self._offsets is None:
+            raise ValueError("Instance dibuat tanpa tabel id (include_ids=False)")
+        header = (self.num_items + 1) * _ITEMSIZE
+        start, end = self._offsets[idx], self._offsets[idx + 1]
+        return bytes(self._ids_shm.buf[header + start:header + end]).decode('utf-8')
+
+    def view(self) -> BinPackingView:
+        """BinPackingView zero-copy di atas shared memory"""
+        names = None
+        if self._offsets is not None:
+            names = [self.item_name(idx) for idx in range(self.num_items)]
+        return BinPackingView(self.kapasitas, self.sizes, names)
+
+    def close(self):
+        """Lepas view lalu tutup akses ke shared memory (tanpa menghapus)"""
+        self.sizes.release()
+        self._sizes_shm.close()
+        if self._ids_shm is not None:
+            self._offsets.release()
+            self._ids_shm.close()
+
+    def unlink(self):
+        """Hapus blok shared memory (hanya oleh owner)"""
+        self._sizes_shm.unlink()
+        if self._ids_shm is not None:
+            self._ids_shm.unlink()
+
+
+# State per worker process, diisi sekali oleh initializer
+_worker_instance = None
+_worker_view = None
+
+
+def _attach_worker(handle: Tuple[str, int, int, Optional[str]]):
+    global _worker_instance, _worker_view
+    _worker_instance = SharedInstance(*handle)
+    _worker_view = BinPackingView(_worker_instance.kapasitas, _worker_instance.sizes)
+
+
+def _run_restart(task: Tuple[str, Dict, int]) -> Tuple[int, float, bytes]:
+    """Worker: jalankan satu restart dan kembalikan hasil ringkas (seed, skor, assignment int32)"""
+    algorithm, params, seed = task
+    random.seed(seed)
+    state = run_algorithm(_worker_view, algorithm, params)
+
+    assignment = array('i', bytes(4 * _worker_instance.num_items))
+    for bin_idx, bin_items in enumerate(state):
+        for item in bin_items:
+            assignment[item] = bin_idx
+
+    score = calculate_objective(state, _worker_view.kapasitas, _worker_view.barang)
+    return seed, score, assignment.tobytes()
+
+
+class SharedInstancePool:
+    """
+    Process pool yang berbagi satu instance lewat shared memory
+
+    Worker attach sekali saat start; payload tiap task hanya (algoritma, parameter, seed)
+    dan hasilnya berupa array assignment int32, bukan state berisi string id.
+
+    Contoh:
+        with SharedInstancePool(bp, n_workers=4) as pool:
+            results = pool.run('sa', {'max_iterations': 5000}, seeds=range(32))
+    """
+
+    def __init__(self, bp: BinPacking, n_workers: Optional[int] = None, include_ids: bool = False):
+        self.bp = bp
+        self.instance = SharedInstance.create(bp, include_ids=include_ids)
+        self.executor = ProcessPoolExecutor(
+            max_workers=n_workers or os.cpu_count() or 1,
+            initializer=_attach_worker,
+            initargs=(self.instance.handle(),)
+        )
+
+    def run(self, algorithm: str, params: Dict, seeds: Sequence[int]) -> List[Tuple[List[List[str]], float, int]]:
+        """
+        Jalankan satu restart per seed secara paralel
+
+        Returns:
+            List (state, score, seed) dengan state memakai id item asli
+        """
+        tasks = [(algorithm, params, seed) for seed in seeds]
+        results = []
+        for seed, score, raw in self.executor.map(_run_restart, tasks):
+            assignment = array('i')
+            assignment.frombytes(raw)
+            results.append((self.decode(assignment), score, seed))
+        return results
+
+    def best_of(self, algorithm: str, params: Dict, seeds: Sequence[int]) -> Tuple[List[List[str]], float, int]:
+        """Hasil terbaik dari beberapa restart paralel"""
+        return min(self.run(algorithm, params, seeds), key=lambda result: result[1])
+
+    def decode(self, assignment: Sequence[int]) -> List[List[str]]:
+        """Ubah array assignment (indeks kontainer per item) menjadi state dengan id asli"""
+        num_bins = max(assignment) + 1 if len(assignment) > 0 else 0
+        state = [[] for _ in range(num_bins)]
+        for idx, bin_idx in enumerate(assignment):
+            state[bin_idx].append(self.bp.item_ids[idx])
+        return state
+
+    def close(self):
+        self.executor.shutdown()
+        self.instance.close()
+        self.instance.unlink()
+
+    def __enter__(self) -> 'SharedInstancePool':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
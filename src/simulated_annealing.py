@@ -1,9 +1,12 @@
 import random
 import math
-import copy
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional, Union
 from bin_packing import BinPacking
-from objective_function import calculate_objective
+from objective_function import objective_from_totals
+from persistent_state import thaw
+from anytime import ImprovementTrace
+from progress import ProgressObserver
+from cooling import CoolingSchedule, GeometricCooling, make_schedule
 
 def simulated_annealing(
     bp: BinPacking,
@@ -11,7 +14,10 @@ def simulated_annealing(
     T_initial: float = 1000.0,
     T_min: float = 0.1,
     alpha: float = 0.95,
-    max_iterations: int = 1000
+    max_iterations: int = 1000,
+    schedule: Union[CoolingSchedule, str, None] = None,
+    trace: Optional[ImprovementTrace] = None,
+    observer: Optional[ProgressObserver] = None
 ) -> Tuple[List[List[str]], float, List[float], List[float], int]:
     """
     Algoritma: Simulated Annealing
@@ -23,40 +29,58 @@ def simulated_annealing(
         T_min: Temperatur minimum (kondisi berhenti)
         alpha: Laju pendinginan (0 < alpha < 1)
         max_iterations: Iterasi maksimum
+        schedule: Jadwal pendinginan (lihat cooling.py), objek atau nama ('geometric',
+            'lundy_mees', 'adaptive'; dari nama: T awal dikalibrasi dan laju diturunkan
+            dari max_iterations). Default: geometrik T_initial/alpha seperti biasa
+        trace: ImprovementTrace opsional untuk mencatat event perbaikan
+        observer: ProgressObserver opsional untuk event progres (di-throttle)
     
     Returns:
         best_state, best_score, score_history, probability_history, stuck_count
     """
-    current_state = copy.deepcopy(initial_state)
-    current_score = calculate_objective(current_state, bp.kapasitas, bp.barang)
+    # Sampler menyimpan state saat ini dan hanya menghasilkan move feasible
+    # Snapshot solusi terbaik berupa PersistentState (tanpa deepcopy)
+    sampler = bp.neighbor_sampler(initial_state)
+    current_score = sampler.score()
     
-    best_state = copy.deepcopy(current_state)
+    best_state = sampler.snapshot()
     best_score = current_score
+    if trace is not None:
+        trace.count()
+        trace.improve(best_score, best_state)
+    if observer is not None:
+        observer.start('simulated_annealing')
     
-    T = T_initial
+    schedule = _resolve_schedule(schedule, T_initial, T_min, alpha)
+    T = schedule.start(sampler, max_iterations)
     score_history = [current_score]
     probability_history = []  # Untuk plotting e^(ΔE/T)
     stuck_count = 0
     iteration = 0
     
-    while T > T_min and iteration < max_iterations:
-        # Dapatkan tetangga random
-        neighbor = bp.get_random_neighbor(current_state)
-        neighbor_score = calculate_objective(neighbor, bp.kapasitas, bp.barang)
+    while not schedule.frozen() and iteration < max_iterations:
+        # Dapatkan tetangga random (kalo ga ada move feasible, tetangga = state saat ini)
+        move = sampler.sample()
+        neighbor_score = sampler.evaluate(move) if move is not None else current_score
+        if trace is not None:
+            trace.count()
         
         # Hitung delta E nya
         delta_E = neighbor_score - current_score
         
         # Putuskan apakah menerima tetangga
+        accepted = True
         if delta_E < 0:
             # Solusi lebih baik - selalu terima
-            current_state = neighbor
+            sampler.apply(move)
             current_score = neighbor_score
             
             # Perbaruin solusi terbaik
             if current_score < best_score:
-                best_state = copy.deepcopy(current_state)
+                best_state = sampler.snapshot()
                 best_score = current_score
+                if trace is not None:
+                    trace.improve(best_score, best_state)
             
             probability_history.append(1.0)
         else:
@@ -65,19 +89,35 @@ def simulated_annealing(
             probability_history.append(probability)
             
             if random.random() < probability:
-                current_state = neighbor
+                if move is not None:
+                    sampler.apply(move)
                 current_score = neighbor_score
             else:
                 stuck_count += 1
+                accepted = False
         
         # Catat skor saat ini setelah keputusan
         score_history.append(current_score)
         
-        # Turunin temperatur
-        T *= alpha
+        # Turunin temperatur (sesuai jadwal)
+        if observer is not None:
+            observer.update(iteration, best_score, current=current_score, temperature=T, accepted=accepted)
+        T = schedule.update(delta_E, accepted)
         iteration += 1
     
-    return best_state, best_score, score_history, probability_history, stuck_count
+    if observer is not None:
+        observer.finish(iteration, best_score, current=current_score, temperature=T)
+    return thaw(best_state), best_score, score_history, probability_history, stuck_count
+
+
+def _resolve_schedule(schedule: Union[CoolingSchedule, str, None], T_initial: float, T_min: float,
+                      alpha: float) -> CoolingSchedule:
+    """Jadwal default = geometrik dengan parameter lama (perilaku sama persis dengan T *= alpha)"""
+    if schedule is None:
+        return GeometricCooling(alpha=alpha, T_initial=T_initial, T_min=T_min)
+    if isinstance(schedule, str):
+        return make_schedule(schedule, T_min=T_min)
+    return schedule
 
 
 def simulated_annealing_with_reheating(
@@ -88,39 +128,54 @@ def simulated_annealing_with_reheating(
     alpha: float = 0.95,
     reheat_threshold: int = 50,
     reheat_factor: float = 2.0,
-    max_iterations: int = 1000
+    max_iterations: int = 1000,
+    schedule: Union[CoolingSchedule, str, None] = None,
+    trace: Optional[ImprovementTrace] = None,
+    observer: Optional[ProgressObserver] = None
 ) -> Tuple[List[List[str]], float, List[float], List[float], int]:
     """
     Simulated Annealing dengan Pemanasan Ulang
-    Panaskan kembali ketika terlalu lama stuck
+    Panaskan kembali ketika terlalu lama stuck (T dikali reheat_factor, maksimal
+    temperatur awal); schedule sama seperti di simulated_annealing
     """
-    current_state = copy.deepcopy(initial_state)
-    current_score = calculate_objective(current_state, bp.kapasitas, bp.barang)
+    sampler = bp.neighbor_sampler(initial_state)
+    current_score = sampler.score()
     
-    best_state = copy.deepcopy(current_state)
+    best_state = sampler.snapshot()
     best_score = current_score
+    if trace is not None:
+        trace.count()
+        trace.improve(best_score, best_state)
+    if observer is not None:
+        observer.start('sa_reheat')
     
-    T = T_initial
+    schedule = _resolve_schedule(schedule, T_initial, T_min, alpha)
+    T = schedule.start(sampler, max_iterations)
     score_history = [current_score]
     probability_history = []
     stuck_count = 0
     no_improvement_count = 0
     iteration = 0
     
-    while T > T_min and iteration < max_iterations:
-        neighbor = bp.get_random_neighbor(current_state)
-        neighbor_score = calculate_objective(neighbor, bp.kapasitas, bp.barang)
+    while not schedule.frozen() and iteration < max_iterations:
+        move = sampler.sample()
+        neighbor_score = sampler.evaluate(move) if move is not None else current_score
+        if trace is not None:
+            trace.count()
         
         delta_E = neighbor_score - current_score
         
+        accepted = True
         if delta_E < 0:
-            current_state = neighbor
+            sampler.apply(move)
             current_score = neighbor_score
             no_improvement_count = 0
             
             if current_score < best_score:
-                best_state = copy.deepcopy(current_state)
+                best_state = sampler.snapshot()
                 best_score = current_score
+                if trace is not None:
+                    trace.improve(best_score, best_state)
             
             probability_history.append(1.0)
         else:
@@ -128,21 +183,212 @@ def simulated_annealing_with_reheating(
             probability_history.append(probability)
             
             if random.random() < probability:
-                current_state = neighbor
+                if move is not None:
+                    sampler.apply(move)
                 current_score = neighbor_score
                 no_improvement_count += 1
             else:
                 stuck_count += 1
                 no_improvement_count += 1
+                accepted = False
         
         # Pemanasan ulang kalau stuck
         if no_improvement_count >= reheat_threshold:
-            T = min(T * reheat_factor, T_initial)
+            T = schedule.reheat(reheat_factor)
             no_improvement_count = 0
         
         # Catat skor saat ini setelah keputusan
         score_history.append(current_score)
+        if observer is not None:
+            observer.update(iteration, best_score, current=current_score, temperature=T, accepted=accepted)
+        T = schedule.update(delta_E, accepted)
+        iteration += 1
+    
+    if observer is not None:
+        observer.finish(iteration, best_score, current=current_score, temperature=T)
+    return thaw(best_state), best_score, score_history, probability_history, stuck_count
+
+def simulated_annealing_batched(
+    bp: BinPacking,
+    initial_state: List[List[str]],
+    T_initial: float = 1000.0,
+    T_min: float = 0.1,
+    alpha: float = 0.95,
+    max_iterations: int = 1000,
+    batch_size: int = 32,
+    new_bin_prob: float = 0.2,
+    rejection_free: bool = False,
+    trace: Optional[ImprovementTrace] = None,
+    observer: Optional[ProgressObserver] = None
+) -> Tuple[List[List[str]], float, List[float], List[float], int]:
+    """
+    Simulated Annealing dengan langkah batch (B kandidat per iterasi)
+    
+    State disimpan sebagai array NumPy (kontainer tiap item + load tiap kontainer).
+    Tiap iterasi mengambil batch_size kandidat move sekaligus, menghitung delta E
+    semuanya dari array load dalam satu operasi vektor, lalu:
+    - default: B bilangan uniform diambil sekaligus dan move PERTAMA yang lolos
+      kriteria Metropolis diterapkan
+    - rejection_free=True: satu move dipilih dengan bobot sebanding probabilitas
+      penerimaannya (selalu ada move yang diterapkan)
+    Overhead Python dibagi ke B evaluasi, jadi throughput naik seiring lebar batch.
+    Kandidat berupa operasi move (ke kontainer lain atau kontainer baru); move yang
+    membuat overflow langsung dibuang.
+    
+    Args:
+        batch_size: Jumlah kandidat per iterasi (B)
+        new_bin_prob: Probabilitas kandidat berupa move ke kontainer baru
+        rejection_free: Pakai pemilihan berbobot alih-alih first-accepted
+        (argumen lain sama dengan simulated_annealing; max_iterations menghitung langkah batch)
+    
+    Returns:
+        best_state, best_score, score_history, probability_history, stuck_count
+        (probability_history berisi rata-rata probabilitas penerimaan per batch)
+    """
+    import numpy as np
+    
+    if bp.vector:
+        raise ValueError("simulated_annealing_batched hanya mendukung instance 1 dimensi")
+    rng = np.random.default_rng(random.randrange(2**32))
+    kapasitas = bp.kapasitas
+    item_ids = list(bp.item_ids)
+    n = len(item_ids)
+    sizes = np.array([bp.barang[item] for item in item_ids], dtype=np.int64)
+    
+    # assign[i] = kontainer item i, kontainer aktif selalu 0..num_bins-1
+    # members[b] = indeks item di kontainer b, slot[i] = posisi item i di members-nya,
+    # supaya menutup kontainer cukup memindahkan isi kontainer terakhir (bukan scan n item)
+    position = {item: idx for idx, item in enumerate(item_ids)}
+    assign = np.empty(n, dtype=np.int64)
+    members = [[] for _ in range(n + 1)]
+    slot = [0] * n
+    for bin_idx, bin_items in enumerate(initial_state):
+        for item in bin_items:
+            idx = position[item]
+            assign[idx] = bin_idx
+            slot[idx] = len(members[bin_idx])
+            members[bin_idx].append(idx)
+    num_bins = len(initial_state)
+    loads = np.zeros(n + 1, dtype=np.int64)
+    counts = np.zeros(n + 1, dtype=np.int64)
+    np.add.at(loads, assign, sizes)
+    np.add.at(counts, assign, 1)
+    
+    def bin_cost(load, count):
+        # kontribusi satu kontainer ke objektif (0 kalo kosong)
+        cost = 100 + 10000 * np.maximum(load - kapasitas, 0) + 0.1 * np.maximum(kapasitas - load, 0)
+        return np.where(count > 0, cost, 0.0)
+    
+    # total overflow & ruang kosong diupdate inkremental, skor eksak lewat objective_from_totals
+    active = loads[:num_bins]
+    total_overflow = int(np.maximum(active - kapasitas, 0).sum())
+    wasted_space = int(np.maximum(kapasitas - active, 0).sum())
+    
+    def bin_totals(load):
+        return max(load - kapasitas, 0), max(kapasitas - load, 0)
+    
+    current_score = objective_from_totals(num_bins, total_overflow, wasted_space) if num_bins > 0 else float('inf')
+    best_assign = assign.copy()
+    best_score = current_score
+    if trace is not None:
+        trace.count()
+        trace.improve(best_score)
+    if observer is not None:
+        observer.start('sa_batched')
+    
+    T = T_initial
+    score_history = [current_score]
+    probability_history = []
+    stuck_count = 0
+    iteration = 0
+    
+    while T > T_min and iteration < max_iterations and n > 0:
+        # Bangkitkan B kandidat move sekaligus
+        items = rng.integers(0, n, batch_size)
+        src = assign[items]
+        to_new = rng.random(batch_size) < new_bin_prob
+        dest = np.where(to_new, num_bins, rng.integers(0, max(num_bins, 1), batch_size))
+        item_sizes = sizes[items]
+        
+        # Delta E semua kandidat dari array load
+        src_after = loads[src] - item_sizes
+        dest_after = loads[dest] + item_sizes
+        delta = (bin_cost(src_after, counts[src] - 1) - bin_cost(loads[src], counts[src])
+                 + bin_cost(dest_after, counts[dest] + 1) - bin_cost(loads[dest], counts[dest]))
+        invalid = (dest == src) | (dest_after > kapasitas) | (to_new & (counts[src] == 1))
+        delta = np.where(invalid, np.inf, delta)
+        if trace is not None:
+            trace.count(batch_size)
+        
+        # Kriteria Metropolis untuk seluruh batch
+        # (rata-rata hanya atas kandidat valid, kandidat infeasible selalu probabilitas 0)
+        probabilities = np.exp(-np.maximum(delta, 0.0) / T)
+        valid = ~invalid
+        probability_history.append(float(probabilities[valid].mean()) if valid.any() else 0.0)
+        
+        chosen = -1
+        if rejection_free:
+            total = probabilities.sum()
+            if total > 0:
+                chosen = int(rng.choice(batch_size, p=probabilities / total))
+        else:
+            accepted = np.flatnonzero(rng.random(batch_size) < probabilities)
+            if len(accepted) > 0:
+                chosen = int(accepted[0])
+        
+        if chosen < 0:
+            stuck_count += 1
+        else:
+            item, s, d, size = int(items[chosen]), int(src[chosen]), int(dest[chosen]), int(item_sizes[chosen])
+            if d == num_bins:
+                num_bins += 1
+                wasted_space += kapasitas
+            for bin_idx, new_load in ((s, int(loads[s]) - size), (d, int(loads[d]) + size)):
+                old_overflow, old_wasted = bin_totals(int(loads[bin_idx]))
+                new_overflow, new_wasted = bin_totals(new_load)
+                total_overflow += new_overflow - old_overflow
+                wasted_space += new_wasted - old_wasted
+            assign[item] = d
+            moved = members[s].pop()
+            if moved != item:
+                members[s][slot[item]] = moved
+                slot[moved] = slot[item]
+            slot[item] = len(members[d])
+            members[d].append(item)
+            loads[s] -= size
+            loads[d] += size
+            counts[s] -= 1
+            counts[d] += 1
+            
+            # Kontainer asal kosong: isi slotnya dengan kontainer terakhir
+            if counts[s] == 0:
+                last = num_bins - 1
+                if s != last:
+                    members[s], members[last] = members[last], members[s]
+                    assign[members[s]] = s
+                    loads[s], counts[s] = loads[last], counts[last]
+                    loads[last], counts[last] = 0, 0
+                num_bins -= 1
+                wasted_space -= kapasitas
+            
+            current_score = objective_from_totals(num_bins, total_overflow, wasted_space)
+            if current_score < best_score:
+                best_assign = assign.copy()
+                best_score = current_score
+                if trace is not None:
+                    trace.improve(best_score)
+        
+        score_history.append(current_score)
+        if observer is not None:
+            observer.update(iteration, best_score, batch_size, current=current_score, temperature=T, accepted=chosen >= 0)
         T *= alpha
         iteration += 1
     
-    return best_state, best_score, score_history, probability_history, stuck_count
\ No newline at end of file
+    if observer is not None:
+        observer.finish(iteration, best_score, current=current_score, temperature=T)
+    
+    best_state = [[] for _ in range(int(best_assign.max()) + 1 if n > 0 else 0)]
+    for idx, bin_idx in enumerate(best_assign.tolist()):
+        best_state[bin_idx].append(item_ids[idx])
+    
+    return best_state, best_score, score_history, probability_history, stuck_count
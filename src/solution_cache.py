@@ -0,0 +1,247 @@
+import os
+import json
+import hashlib
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Iterable, List, Dict, Tuple, Optional
+from bin_packing import BinPacking
+from objective_function import calculate_objective
+from hill_climbing import steepest_ascent_hill_climbing
+from simulated_annealing import simulated_annealing
+from genetic_algorithm import genetic_algorithm
+
+
+def instance_fingerprint(kapasitas: int, barang: Dict[str, int]) -> str:
+    """
+    Fingerprint kanonik instance: hash dari kapasitas + multiset ukuran terurut
+    Id item tidak ikut dihitung, jadi instance dengan ukuran yang sama (walaupun
+    id-nya beda) punya fingerprint yang sama
+    """
+    return sizes_fingerprint(kapasitas, barang.values())
+
+
+def sizes_fingerprint(kapasitas: int, sizes: Iterable[int]) -> str:
+    """instance_fingerprint dari ukuran item saja (urutan bebas)"""
+    payload = f"{kapasitas}|" + ",".join(str(size) for size in sorted(sizes))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def size_histogram(bp: BinPacking) -> Counter:
+    """
+    Histogram ukuran item (ukuran -> jumlah)
+    Lewat item_ids, bukan barang.values(), jadi juga jalan untuk BinPackingView
+    yang barang-nya berupa array
+    """
+    barang = bp.barang
+    return Counter(barang[item] for item in bp.item_ids)
+
+
+class SolutionCache:
+    """
+    Penyimpanan solusi di disk, dikunci dengan instance_fingerprint
+
+    Tiap solusi disimpan di <directory>/<fingerprint>.json sebagai daftar kontainer
+    berisi UKURAN item (bukan id), supaya bisa dipakai ulang untuk instance lain
+    dengan multiset ukuran yang mirip. index.json menyimpan kapasitas, histogram
+    ukuran dan skor tiap entry untuk pencarian entry terdekat.
+    """
+
+    def __init__(self, directory: str = 'results/cache'):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.index_path = os.path.join(directory, 'index.json')
+        self.index = self._read_json(self.index_path) or {}
+        # histogram tiap entry di-parse sekali (bukan setiap nearest())
+        self._histograms = {
+            fingerprint: Counter({int(size): count for size, count in meta['sizes'].items()})
+            for fingerprint, meta in self.index.items()
+        }
+
+    def _read_json(self, path: str) -> Optional[Dict]:
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    def _write_json(self, path: str, data: Dict):
+        # tulis ke file sementara lalu rename supaya tidak ada file setengah jadi
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    def get(self, fingerprint: str) -> Optional[Dict]:
+        """Entry solusi untuk fingerprint tertentu (atau None)"""
+        if fingerprint not in self.index:
+            return None
+        return self._read_json(os.path.join(self.directory, f'{fingerprint}.json'))
+
+    def save(self, bp: BinPacking, state: List[List[str]], score: float, histogram: Optional[Counter] = None) -> bool:
+        """
+        Simpan solusi kalo belum ada atau lebih baik dari yang tersimpan
+
+        Args:
+            histogram: size_histogram(bp) kalo sudah dihitung pemanggil
+
+        Returns:
+            True kalo solusi disimpan
+        """
+        if histogram is None:
+            histogram = size_histogram(bp)
+        fingerprint = sizes_fingerprint(bp.kapasitas, histogram.elements())
+        existing = self.index.get(fingerprint)
+        if existing is not None and existing['score'] <= score:
+            return False
+
+        entry = {
+            'kapasitas': bp.kapasitas,
+            'score': score,
+            'bins': [[bp.barang[item] for item in bin_items] for bin_items in state]
+        }
+        self._write_json(os.path.join(self.directory, f'{fingerprint}.json'), entry)
+
+        self.index[fingerprint] = {
+            'kapasitas': bp.kapasitas,
+            'score': score,
+            'sizes': {str(size): count for size, count in histogram.items()}
+        }
+        self._histograms[fingerprint] = Counter(histogram)
+        self._write_json(self.index_path, self.index)
+        return True
+
+    def nearest(self, bp: BinPacking, histogram: Optional[Counter] = None) -> Tuple[Optional[str], int]:
+        """
+        Cari entry dengan kapasitas sama dan selisih multiset ukuran terkecil
+
+        Args:
+            histogram: size_histogram(bp) kalo sudah dihitung pemanggil
+
+        Returns:
+            fingerprint terdekat (atau None), jumlah item yang berbeda
+        """
+        if histogram is None:
+            histogram = size_histogram(bp)
+        best_fingerprint = None
+        best_distance = None
+
+        for fingerprint, meta in self.index.items():
+            if meta['kapasitas'] != bp.kapasitas:
+                continue
+            cached = self._histograms[fingerprint]
+            distance = sum(((histogram - cached) + (cached - histogram)).values())
+            if best_distance is None or distance < best_distance:
+                best_fingerprint = fingerprint
+                best_distance = distance
+                if distance == 0:
+                    break
+
+        return best_fingerprint, (best_distance if best_distance is not None else len(bp.item_ids))
+
+    def warm_start(self, bp: BinPacking, histogram: Optional[Counter] = None) -> Optional[List[List[str]]]:
+        """
+        Bangun state awal dari solusi cache terdekat
+
+        Item dicocokkan ke slot ukuran di kontainer cache. Slot yang itemnya sudah
+        tidak ada dibuang, item baru yang tidak kebagian slot dimasukkan dengan
+        Best Fit berindeks (bisect pada daftar sisa kapasitas).
+
+        Returns:
+            State valid, atau None kalo cache tidak punya entry dengan kapasitas sama
+        """
+        fingerprint, _ = self.nearest(bp, histogram)
+        if fingerprint is None:
+            return None
+
+        entry = self.get(fingerprint)
+        if entry is None:
+            return None
+
+        return adapt_solution(bp, entry['bins'])
+
+
+def adapt_solution(bp: BinPacking, size_bins: List[List[int]]) -> List[List[str]]:
+    """Petakan solusi berbasis ukuran ke item bp (drop item yang hilang, best fit item baru)"""
+    available = {}
+    for item in bp.item_ids:
+        available.setdefault(bp.barang[item], []).append(item)
+
+    # 1. Isi slot ukuran dengan item yang ukurannya sama
+    state = []
+    loads = []
+    for sizes in size_bins:
+        bin_items = []
+        load = 0
+        for size in sizes:
+            candidates = available.get(size)
+            if candidates:
+                bin_items.append(candidates.pop())
+                load += size
+        if len(bin_items) > 0:
+            state.append(bin_items)
+            loads.append(load)
+
+    # 2. Item sisa (baru) dengan Best Fit berindeks
+    residual_index = sorted((bp.kapasitas - load, idx) for idx, load in enumerate(loads))
+    leftovers = sorted((item for items in available.values() for item in items),
+                       key=lambda item: bp.barang[item], reverse=True)
+
+    for item in leftovers:
+        size = bp.barang[item]
+        pos = bisect_left(residual_index, (size, -1))
+        if pos < len(residual_index):
+            residual, idx = residual_index.pop(pos)
+            state[idx].append(item)
+            insort(residual_index, (residual - size, idx))
+        else:
+            state.append([item])
+            insort(residual_index, (bp.kapasitas - size, len(state) - 1))
+
+    return state
+
+
+def solve_with_cache(
+    bp: BinPacking,
+    algorithm: str = 'sa',
+    cache: Optional[SolutionCache] = None,
+    params: Optional[Dict] = None
+) -> Tuple[List[List[str]], float, str]:
+    """
+    Selesaikan instance dengan memanfaatkan cache
+
+    - Fingerprint sama persis: solusi cache langsung dikembalikan
+    - Ada entry terdekat: warm start dari entry tersebut lalu jalankan algoritma
+    - Tidak ada entry: cold start dari initial_state_random_worst
+
+    Args:
+        algorithm: 'sa', 'hc' (steepest ascent) atau 'ga'
+        params: Parameter tambahan untuk algoritma
+
+    Returns:
+        best_state, best_score, sumber ('hit', 'warm' atau 'cold')
+    """
+    cache = cache or SolutionCache()
+    params = params or {}
+
+    histogram = size_histogram(bp)
+    fingerprint = sizes_fingerprint(bp.kapasitas, histogram.elements())
+    entry = cache.get(fingerprint)
+    if entry is not None:
+        state = adapt_solution(bp, entry['bins'])
+        return state, calculate_objective(state, bp.kapasitas, bp.barang), 'hit'
+
+    initial_state = cache.warm_start(bp, histogram)
+    source = 'warm' if initial_state is not None else 'cold'
+    if initial_state is None:
+        initial_state = bp.initial_state_random_worst()
+
+    if algorithm == 'sa':
+        state, score = simulated_annealing(bp, initial_state, **params)[:2]
+    elif algorithm == 'hc':
+        state, score = steepest_ascent_hill_climbing(bp, initial_state, **params)[:2]
+    elif algorithm == 'ga':
+        state, score = genetic_algorithm(bp, seed_states=[initial_state], **params)[:2]
+    else:
+        raise ValueError(f"algorithm tidak dikenal: {algorithm}")
+
+    cache.save(bp, state, score, histogram)
+    return state, score, source
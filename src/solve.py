@@ -0,0 +1,142 @@
+import sys
+import json
+import time
+import argparse
+import importlib
+from typing import Dict, List, Optional
+
+# Entry point headless: hanya modul solver yang dipilih yang di-import, plot
+# (matplotlib/NumPy) hanya di-load kalo --plot diminta.
+# nama -> (modul, fungsi, butuh initial_state)
+SOLVERS = {
+    'hc': ('hill_climbing', 'steepest_ascent_hill_climbing', True),
+    'hc_stochastic': ('hill_climbing', 'stochastic_hill_climbing', True),
+    'hc_sideways': ('hill_climbing', 'sideways_move_hill_climbing', True),
+    'hc_restart': ('hill_climbing', 'random_restart_hill_climbing', False),
+    'sa': ('simulated_annealing', 'simulated_annealing', True),
+    'sa_reheat': ('simulated_annealing', 'simulated_annealing_with_reheating', True),
+    'sa_batched': ('simulated_annealing', 'simulated_annealing_batched', True),
+    'ga': ('genetic_algorithm', 'genetic_algorithm', False),
+    'ga_permutation': ('permutation_ga', 'genetic_algorithm_permutation', False),
+    'bin_elim': ('bin_elimination', 'eliminate_bins', True),
+    'vnd': ('vns', 'variable_neighborhood_descent', True),
+    'vns': ('vns', 'variable_neighborhood_search', True),
+}
+
+
+def solve(kapasitas, barang: Dict, algorithm: str = 'sa', params: Optional[Dict] = None,
+          eliminate: bool = False, dimensi: Optional[List[str]] = None) -> Dict:
+    """
+    Jalankan satu solver dan kembalikan ringkasan hasilnya
+    Dengan eliminate=True hasil solver dipoles lagi dengan eliminasi kontainer
+    kapasitas berupa list (ukuran barang juga list) = instance vektor multi-dimensi
+
+    Returns:
+        dict berisi algorithm, score, num_bins, time, state dan history (history skor solver)
+    """
+    from bin_packing import make_bin_packing
+    return solve_instance(make_bin_packing(kapasitas, barang, dimensi), algorithm, params, eliminate)
+
+
+def solve_instance(bp, algorithm: str = 'sa', params: Optional[Dict] = None, eliminate: bool = False) -> Dict:
+    """
+    Sama dengan solve, tapi untuk instance yang sudah dibangun, misal BinPackingView
+    di atas array ukuran (--stream / file .bpi): item berupa indeks 0..n-1
+    """
+    if algorithm not in SOLVERS:
+        raise ValueError(f"algorithm tidak dikenal: {algorithm}")
+
+    module_name, function_name, needs_initial_state = SOLVERS[algorithm]
+    solver = getattr(importlib.import_module(module_name), function_name)
+
+    start = time.perf_counter()
+    if needs_initial_state:
+        result = solver(bp, bp.initial_state_first_fit(), **(params or {}))
+    else:
+        result = solver(bp, **(params or {}))
+    state = [list(bin_items) for bin_items in result[0]]
+    if eliminate:
+        from bin_elimination import eliminate_bins
+        state = eliminate_bins(bp, state)[0]
+    elapsed = time.perf_counter() - start
+
+    return {
+        'algorithm': algorithm,
+        'score': bp.objective(state),
+        'num_bins': len(state),
+        'time': elapsed,
+        'state': state,
+        'history': list(result[2]),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Solve bin packing tanpa visualisasi (start cepat)")
+    parser.add_argument('input', help="Berkas instance JSON (kapasitas_kontainer/barang) atau biner .bpi (lihat binary_instance.py)")
+    parser.add_argument('-a', '--algorithm', default='sa', choices=sorted(SOLVERS))
+    parser.add_argument('-p', '--params', default='{}', help="Parameter solver dalam JSON, misal '{\"max_iterations\": 5000}'")
+    parser.add_argument('-o', '--output', help="Simpan hasil (JSON) ke berkas ini")
+    parser.add_argument('--seed', type=int, help="Seed random")
+    parser.add_argument('--eliminate', action='store_true', help="Post-processing: eliminasi kontainer (ejection chain/MBS)")
+    parser.add_argument('--plot', action='store_true', help="Simpan visualisasi state akhir ke results/")
+    parser.add_argument('--stream', action='store_true',
+                        help="Baca instance secara streaming (instance 1 dimensi yang sangat besar)")
+    parser.add_argument('--store', help="Catat run ke results store SQLite (misal results/results.db)")
+    args = parser.parse_args(argv)
+
+    if args.seed is not None:
+        import random
+        random.seed(args.seed)
+
+    # --stream dan .bpi: ukuran tetap di array ringkas (BinPackingView, item = indeks),
+    # tanpa objek Python per item; id asli hanya dibaca untuk output (-o)
+    binary = None
+    if args.input.endswith('.bpi'):
+        from binary_instance import BinaryInstance
+        binary = BinaryInstance(args.input)
+        bp = binary.to_bin_packing()
+    elif args.stream:
+        # format vektor tidak didukung di jalur ini
+        from utils import stream_load_data
+        from shared_instance import BinPackingView
+        kapasitas, sizes, ids = stream_load_data(args.input)
+        bp = BinPackingView(kapasitas, sizes, ids)
+    else:
+        from utils import load_data
+        from bin_packing import make_bin_packing
+        data = load_data(args.input)
+        bp = make_bin_packing(data['kapasitas_kontainer'], {item['id']: item['ukuran'] for item in data['barang']},
+                              data.get('dimensi'))
+
+    result = solve_instance(bp, args.algorithm, json.loads(args.params), args.eliminate)
+    print(f"{result['algorithm']}: {result['num_bins']} kontainer, skor {result['score']:.2f}, {result['time']:.3f} s")
+
+    if args.output:
+        # history bisa panjang, cukup dicatat di results store (--store)
+        output = {key: value for key, value in result.items() if key != 'history'}
+        names = binary.item_ids() if binary is not None else getattr(bp, 'item_names', None)
+        if names is not None:
+            output['state'] = [[names[item] for item in bin_items] for bin_items in result['state']]
+        with open(args.output, 'w') as f:
+            json.dump(output, f, indent=2)
+
+    if args.store:
+        from results_store import ResultsStore
+        from solution_cache import sizes_fingerprint
+        fingerprint = sizes_fingerprint(bp.kapasitas, (bp.barang[item] for item in bp.item_ids))
+        with ResultsStore(args.store) as store:
+            store.add_instance(fingerprint, args.input, len(bp.item_ids), bp.kapasitas)
+            store.add_run(fingerprint, args.algorithm, json.loads(args.params), args.seed, result['score'],
+                          result['num_bins'], result['time'], result['history'])
+
+    if args.plot and bp.vector:
+        print("--plot hanya untuk instance 1 dimensi, dilewati")
+    elif args.plot:
+        from visualizer import visualize_bins
+        visualize_bins(result['state'], bp.kapasitas, bp.barang, f"{args.algorithm} - Final State", f"{args.algorithm}_final_state")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,573 @@
+import os
+import sys
+import json
+import math
+import time
+import socket
+import asyncio
+import itertools
+import threading
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Tuple, Optional
+from bin_packing import make_bin_packing
+from decomposition import ALGORITHMS
+from portfolio import run_with_incumbent
+from anytime import DeadlineTrace, SolveInterrupted
+from utils import load_data
+
+# Protokol: satu objek JSON per baris (newline-delimited) lewat TCP atau Unix socket
+#   solve   : {"id": ..., "kapasitas_kontainer": int | [int, ...], "barang": [{"id", "ukuran"}],
+#              "algorithm": "sa", "params": {...}, "deadline": detik}
+#   cancel  : {"op": "cancel", "id": ...}
+#   metrics : {"op": "metrics"}
+# Balasan solve: {"id", "status": "ok"|"timeout"|"cancelled"|"error", "state", "score", "elapsed"}
+# Satu koneksi boleh mengirim banyak request sekaligus, balasan dicocokkan lewat "id".
+
+# Di-set initializer pool di tiap worker:
+# - _RESULTS: queue hasil, tiap request dikirim balik begitu selesai (bukan per batch)
+# - _CANCEL_FLAGS: slot token % panjang berisi token request yang dibatalkan server
+_RESULTS = None
+_CANCEL_FLAGS = None
+
+
+def _init_worker(results, cancel_flags):
+    global _RESULTS, _CANCEL_FLAGS
+    _RESULTS, _CANCEL_FLAGS = results, cancel_flags
+
+
+def _parse_size(value):
+    """Kapasitas / ukuran dari request: int, atau list int untuk instance vektor"""
+    if isinstance(value, list):
+        return [int(v) for v in value]
+    return int(value)
+
+
+def _warm_up() -> int:
+    """Dipanggil sekali di tiap worker supaya modul solver sudah ter-import"""
+    return os.getpid()
+
+
+class _CancelFlag:
+    """stop_event untuk DeadlineTrace: aktif kalo server menandai token request ini batal"""
+
+    def __init__(self, token: int):
+        self.token = token
+
+    def is_set(self) -> bool:
+        return _CANCEL_FLAGS[self.token % len(_CANCEL_FLAGS)] == self.token
+
+
+def _solve_batch(tasks: List[Tuple]) -> int:
+    """
+    Worker: selesaikan beberapa request kecil dalam satu dispatch
+    Request dijalankan urut deadline (paling dekat dulu) dan hasil tiap request
+    langsung dikirim lewat _RESULTS. Request yang deadline-nya sudah lewat atau
+    sudah dibatalkan sebelum sempat dijalankan langsung dilewati; run yang melewati
+    deadline atau dibatalkan dihentikan di tengah jalan lewat DeadlineTrace.
+
+    Returns:
+        jumlah request yang diproses
+    """
+    for token, request_id, kapasitas, barang, algorithm, params, deadline in sorted(tasks, key=lambda task: task[-1]):
+        cancel_flag = _CancelFlag(token)
+        result = {'id': request_id, 'status': 'timeout'}
+        if cancel_flag.is_set():
+            result['status'] = 'cancelled'
+        elif time.time() < deadline:
+            started = time.time()
+            try:
+                bp = make_bin_packing(kapasitas, barang)
+                state = run_with_incumbent(bp, algorithm, params, None, DeadlineTrace(deadline, cancel_flag))
+                result = {
+                    'id': request_id,
+                    'status': 'ok',
+                    'state': state,
+                    'score': bp.objective(state),
+                    'elapsed': time.time() - started,
+                }
+            except SolveInterrupted:
+                result['status'] = 'cancelled' if cancel_flag.is_set() else 'timeout'
+            except Exception as e:
+                result = {'id': request_id, 'status': 'error', 'error': str(e)}
+        _RESULTS.put((token, result))
+    return len(tasks)
+
+
+class _Pending:
+    """Request yang sedang antri / berjalan"""
+
+    def __init__(self, token: int, request_id, task: Tuple, num_items: int, deadline: float, writer):
+        self.token = token
+        self.id = request_id
+        self.task = task
+        self.num_items = num_items
+        self.deadline = deadline
+        self.writer = writer
+        self.timer = None
+        self.done = False
+
+
+class SolveServer:
+    """
+    Server solve asyncio yang hidup lama dengan worker process yang sudah "hangat"
+
+    - request kecil (<= small_items item) yang datang dalam batch_window detik
+      digabung menjadi satu dispatch ke pool (hemat overhead pickling/IPC)
+    - satu request (satu baris JSON) dibatasi max_request_bytes
+    - setiap request punya deadline yang juga dicek di dalam worker; request yang
+      lewat deadline dibalas 'timeout' tepat di deadline-nya sendiri, dan hasil tiap
+      request dibalas begitu selesai (tidak menunggu request lain di batch yang sama)
+    - request bisa dibatalkan dengan op 'cancel' atau otomatis saat koneksi putus;
+      run yang sedang berjalan di worker ikut dihentikan (flag cancel di shared memory)
+    - op 'metrics' mengembalikan kedalaman antrian dan counter lain
+
+    Contoh:
+        server = SolveServer(port=8765)
+        asyncio.run(server.serve_forever())
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 8765, unix_path: Optional[str] = None,
+                 n_workers: Optional[int] = None, batch_size: int = 16, batch_window: float = 0.005,
+                 small_items: int = 200, default_deadline: float = 30.0, max_request_bytes: int = 64 << 20,
+                 cancel_slots: int = 1 << 16):
+        self.host = host
+        self.port = port
+        self.unix_path = unix_path
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.small_items = small_items
+        self.default_deadline = default_deadline
+        self.max_request_bytes = max_request_bytes
+        self.cancel_slots = cancel_slots
+
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.server = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._pending: Dict = {}
+        self._in_flight = 0
+        self._dispatcher = None
+        self._tokens = itertools.count(1)
+        self._results = None
+        self._cancel_flags = None
+        self._result_reader = None
+        self.metrics_counters = {'received': 0, 'completed': 0, 'timeouts': 0, 'cancelled': 0,
+                                 'errors': 0, 'batches': 0, 'batched_requests': 0}
+
+    async def start(self):
+        """Buat pool, hangatkan semua worker, lalu mulai menerima koneksi"""
+        loop = asyncio.get_running_loop()
+        ctx = mp.get_context()
+        self._results = ctx.SimpleQueue()
+        self._cancel_flags = ctx.Array('q', self.cancel_slots, lock=False)
+        self.executor = ProcessPoolExecutor(max_workers=self.n_workers, mp_context=ctx, initializer=_init_worker,
+                                            initargs=(self._results, self._cancel_flags))
+        self._result_reader = threading.Thread(target=self._read_results, args=(loop,), daemon=True)
+        self._result_reader.start()
+        await asyncio.gather(*(loop.run_in_executor(self.executor, _warm_up) for _ in range(self.n_workers)))
+
+        self._queue = asyncio.Queue()
+        self._dispatcher = asyncio.create_task(self._dispatch_loop())
+        if self.unix_path is not None:
+            self.server = await asyncio.start_unix_server(self._handle_client, path=self.unix_path, limit=self.max_request_bytes)
+        else:
+            self.server = await asyncio.start_server(self._handle_client, self.host, self.port, limit=self.max_request_bytes)
+            # port=0 -> ambil port yang dipilih OS
+            self.port = self.server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        await self.start()
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+        if self._results is not None:
+            self._results.put(None)
+        if self.unix_path is not None and os.path.exists(self.unix_path):
+            os.unlink(self.unix_path)
+
+    def metrics(self) -> Dict:
+        return {
+            'queue_depth': self._queue.qsize() if self._queue is not None else 0,
+            'in_flight': self._in_flight,
+            'pending': len(self._pending),
+            'workers': self.n_workers,
+            **self.metrics_counters,
+        }
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        own = set()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    await self._send(writer, {'status': 'error', 'error': f'request melebihi {self.max_request_bytes} byte'})
+                    break
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                except json.JSONDecodeError as e:
+                    await self._send(writer, {'status': 'error', 'error': f'JSON tidak valid: {e}'})
+                    continue
+                if not isinstance(message, dict):
+                    self.metrics_counters['errors'] += 1
+                    await self._send(writer, {'id': None, 'status': 'error', 'error': 'request harus berupa objek JSON'})
+                    continue
+
+                op = message.get('op', 'solve')
+                if op == 'metrics':
+                    await self._send(writer, {'op': 'metrics', **self.metrics()})
+                elif op == 'cancel':
+                    await self._cancel(message.get('id'))
+                elif op == 'solve':
+                    request_id = await self._submit(message, writer)
+                    if request_id is not None:
+                        own.add(request_id)
+                else:
+                    await self._send(writer, {'id': message.get('id'), 'status': 'error', 'error': f'op tidak dikenal: {op}'})
+        finally:
+            # koneksi putus: batalkan (dan hentikan) request yang masih menunggu/berjalan
+            writer.close()
+            for request_id in own:
+                pending = self._pending.get(request_id)
+                if pending is not None and pending.writer is writer:
+                    await self._cancel_pending(pending)
+
+    async def _submit(self, message: Dict, writer):
+        """Validasi request lalu masukkan ke antrian"""
+        request_id = None
+        try:
+            request_id = message.get('id')
+            algorithm = message.get('algorithm', 'sa')
+            if algorithm not in ALGORITHMS:
+                raise ValueError(f"algorithm tidak dikenal: {algorithm}")
+            kapasitas = _parse_size(message['kapasitas_kontainer'])
+            barang = {item['id']: _parse_size(item['ukuran']) for item in message['barang']}
+            if request_id is None or request_id in self._pending:
+                raise ValueError("id request wajib diisi dan harus unik selama request berjalan")
+            timeout = float(message.get('deadline', self.default_deadline))
+            if not math.isfinite(timeout):
+                raise ValueError(f"deadline tidak valid: {timeout}")
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            self.metrics_counters['errors'] += 1
+            await self._send(writer, {'id': request_id, 'status': 'error', 'error': str(e)})
+            return None
+
+        deadline = time.time() + timeout
+        token = next(self._tokens)
+        task = (token, request_id, kapasitas, barang, algorithm, message.get('params', {}), deadline)
+        pending = _Pending(token, request_id, task, len(barang), deadline, writer)
+        self._pending[request_id] = pending
+        # balas 'timeout' tepat di deadline request ini, di manapun posisinya (antrian/batch)
+        pending.timer = asyncio.get_running_loop().call_later(
+            max(0.0, timeout), lambda: asyncio.ensure_future(self._finish(pending, {'id': request_id, 'status': 'timeout'})))
+        self.metrics_counters['received'] += 1
+        await self._queue.put(pending)
+        return request_id
+
+    async def _cancel(self, request_id):
+        try:
+            pending = self._pending.get(request_id)
+        except TypeError:
+            # id tidak hashable (misal list): pasti tidak ada request dengan id itu
+            return
+        if pending is not None:
+            await self._cancel_pending(pending)
+
+    async def _cancel_pending(self, pending: _Pending):
+        """Tandai token di flag cancel (worker berhenti di cek DeadlineTrace berikutnya) lalu balas"""
+        if pending.done:
+            return
+        self._cancel_flags[pending.token % self.cancel_slots] = pending.token
+        await self._finish(pending, {'id': pending.id, 'status': 'cancelled'})
+
+    def _read_results(self, loop):
+        """Thread: teruskan hasil per request dari worker ke event loop"""
+        while True:
+            message = self._results.get()
+            if message is None:
+                break
+            try:
+                loop.call_soon_threadsafe(self._on_result, *message)
+            except RuntimeError:
+                # event loop sudah ditutup
+                break
+
+    def _on_result(self, token: int, result: Dict):
+        pending = self._pending.get(result['id'])
+        # id bisa sudah dipakai ulang request baru: cocokkan lewat token
+        if pending is not None and pending.token == token:
+            asyncio.ensure_future(self._finish(pending, result))
+
+    async def _dispatch_loop(self):
+        """
+        Ambil request dari antrian; request kecil ditahan maksimal batch_window detik
+        untuk dikumpulkan jadi satu batch, request besar langsung dikirim sendiri
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            first = await self._queue.get()
+            batch = [first]
+            if first.num_items <= self.small_items:
+                window_end = loop.time() + self.batch_window
+                while len(batch) < self.batch_size:
+                    timeout = window_end - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        pending = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                    if pending.num_items <= self.small_items:
+                        batch.append(pending)
+                    else:
+                        asyncio.create_task(self._run_batch([pending]))
+            asyncio.create_task(self._run_batch(batch))
+
+    async def _run_batch(self, batch: List[_Pending]):
+        # request yang sudah dibalas (batal/timeout selagi antri) tidak perlu dikirim ke worker
+        batch = [pending for pending in batch if not pending.done]
+        if not batch:
+            return
+
+        loop = asyncio.get_running_loop()
+        self._in_flight += len(batch)
+        self.metrics_counters['batches'] += 1
+        self.metrics_counters['batched_requests'] += len(batch)
+
+        # hasil tiap request datang lewat _read_results; future ini hanya menandai
+        # batch selesai di worker (atau gagal, misal worker mati)
+        try:
+            await loop.run_in_executor(self.executor, _solve_batch, [pending.task for pending in batch])
+        except Exception as e:
+            for pending in batch:
+                await self._finish(pending, {'id': pending.id, 'status': 'error', 'error': str(e)})
+        finally:
+            self._in_flight -= len(batch)
+
+    async def _finish(self, pending: _Pending, result: Dict):
+        if pending.done:
+            return
+        pending.done = True
+        if pending.timer is not None:
+            pending.timer.cancel()
+        if self._pending.get(pending.id) is pending:
+            del self._pending[pending.id]
+
+        status = result['status']
+        if status == 'ok':
+            self.metrics_counters['completed'] += 1
+        elif status == 'timeout':
+            self.metrics_counters['timeouts'] += 1
+        elif status == 'cancelled':
+            self.metrics_counters['cancelled'] += 1
+        else:
+            self.metrics_counters['errors'] += 1
+
+        if not pending.writer.is_closing():
+            await self._send(pending.writer, result)
+
+    @staticmethod
+    async def _send(writer, message: Dict):
+        try:
+            writer.write(json.dumps(message).encode('utf-8') + b'\n')
+            await writer.drain()
+        except (ConnectionError, RuntimeError):
+            pass
+
+
+class SolveClient:
+    """
+    Client sinkron (blocking socket) untuk SolveServer
+
+    Contoh:
+        with SolveClient(port=8765) as client:
+            result = client.solve(data['kapasitas_kontainer'], data['barang'], algorithm='sa')
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 8765, unix_path: Optional[str] = None, timeout: Optional[float] = None):
+        if unix_path is not None:
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.connect(unix_path)
+        else:
+            self.sock = socket.create_connection((host, port))
+        self.sock.settimeout(timeout)
+        self._file = self.sock.makefile('rb')
+        self._ids = itertools.count()
+        self._unclaimed: Dict = {}
+
+    def send(self, message: Dict):
+        self.sock.sendall(json.dumps(message).encode('utf-8') + b'\n')
+
+    def receive(self) -> Dict:
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("Koneksi ke server terputus")
+        return json.loads(line)
+
+    def submit(self, kapasitas, barang: List[Dict], algorithm: str = 'sa',
+               params: Optional[Dict] = None, deadline: Optional[float] = None, request_id=None):
+        """Kirim request solve tanpa menunggu balasan (untuk beberapa request sekaligus)"""
+        request_id = request_id if request_id is not None else f'{os.getpid()}-{next(self._ids)}'
+        message = {'id': request_id, 'kapasitas_kontainer': kapasitas, 'barang': barang,
+                   'algorithm': algorithm, 'params': params or {}}
+        if deadline is not None:
+            message['deadline'] = deadline
+        self.send(message)
+        return request_id
+
+    def wait(self, request_id) -> Dict:
+        """Tunggu balasan untuk request tertentu (balasan request lain disimpan)"""
+        while request_id not in self._unclaimed:
+            message = self.receive()
+            self._unclaimed[message.get('id')] = message
+        return self._unclaimed.pop(request_id)
+
+    def solve(self, kapasitas, barang: List[Dict], algorithm: str = 'sa',
+              params: Optional[Dict] = None, deadline: Optional[float] = None, request_id=None) -> Dict:
+        return self.wait(self.submit(kapasitas, barang, algorithm, params, deadline, request_id))
+
+    def cancel(self, request_id):
+        self.send({'op': 'cancel', 'id': request_id})
+
+    def metrics(self) -> Dict:
+        self.send({'op': 'metrics'})
+        while True:
+            message = self.receive()
+            if message.get('op') == 'metrics':
+                return message
+            self._unclaimed[message.get('id')] = message
+
+    def close(self):
+        self._file.close()
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+async def _self_check_async(n_workers: int) -> Dict:
+    """
+    Loopback check lewat TCP lokal: solve, batching, deadline per request di dalam
+    satu batch, timeout, cancel (run di worker ikut berhenti), koneksi putus
+    (request dibersihkan dan id bisa dipakai lagi) dan metrics
+    """
+    server = SolveServer(port=0, n_workers=n_workers)
+    await server.start()
+    try:
+        def settle(client: SolveClient, timeout: float = 2.0) -> Dict:
+            """Tunggu sampai tidak ada request yang antri/berjalan (atau timeout)"""
+            end = time.time() + timeout
+            while True:
+                metrics = client.metrics()
+                if (metrics['pending'] == 0 and metrics['in_flight'] == 0) or time.time() > end:
+                    return metrics
+                time.sleep(0.05)
+
+        def scenario():
+            barang = [{'id': f'B{i}', 'ukuran': size} for i, size in enumerate([40, 30, 60, 20, 50, 10, 70, 30])]
+            long_sa = {'alpha': 0.999999, 'max_iterations': 10**8}
+            with SolveClient(port=server.port, timeout=30) as client:
+                ok = client.solve(100, barang, algorithm='hc', params={'max_iterations': 50})
+                ids = [client.submit(100, barang, algorithm='sa', params={'max_iterations': 200}) for _ in range(8)]
+                batched = [client.wait(request_id) for request_id in ids]
+
+                # dua request kecil di batch yang sama: yang lambat tidak boleh membuat
+                # yang cepat (deadline lebih pendek) ikut timeout
+                medium = [{'id': f'M{i}', 'ukuran': 1 + i % 60} for i in range(150)]
+                slow_small = client.submit(100, medium, algorithm='sa', params=long_sa, deadline=2.0)
+                fast_small = client.submit(100, barang, algorithm='hc', params={'max_iterations': 50}, deadline=1.0)
+                fast_result = client.wait(fast_small)
+                slow_result = client.wait(slow_small)
+
+                big = [{'id': f'X{i}', 'ukuran': 1 + i % 60} for i in range(3000)]
+                slow = client.submit(100, big, algorithm='sa', params=long_sa, deadline=0.5)
+                timed_out = client.wait(slow)
+                settle(client)
+
+                cancel_id = client.submit(100, big, algorithm='sa', params=long_sa, deadline=5.0)
+                time.sleep(0.3)
+                client.cancel(cancel_id)
+                cancelled = client.wait(cancel_id)
+                after_cancel = settle(client)
+
+                # koneksi putus di tengah run: request dibatalkan, dihapus dari pending,
+                # dan id-nya boleh dipakai lagi
+                with SolveClient(port=server.port, timeout=30) as other:
+                    other.submit(100, big, algorithm='sa', params=long_sa, deadline=5.0, request_id='disconnect-1')
+                    time.sleep(0.3)
+                after_disconnect = settle(client)
+                reused = client.solve(100, barang, algorithm='hc', params={'max_iterations': 50}, request_id='disconnect-1')
+
+                # instance vektor: kapasitas & ukuran berupa list
+                vector_barang = [{'id': f'V{i}', 'ukuran': [size, 90 - size]} for i, size in enumerate([40, 30, 60, 20, 50, 10])]
+                vector = client.solve([100, 100], vector_barang, algorithm='sa', params={'max_iterations': 200})
+                vector_unsupported = client.solve([100, 100], vector_barang, algorithm='ga_permutation')
+                metrics = client.metrics()
+
+            return {
+                'solve_ok': ok['status'] == 'ok' and sorted(i for b in ok['state'] for i in b) == sorted(b['id'] for b in barang),
+                'batched_ok': all(result['status'] == 'ok' for result in batched),
+                'deadline_ok': fast_result['status'] == 'ok' and slow_result['status'] == 'timeout',
+                'timeout_ok': timed_out['status'] == 'timeout',
+                'cancel_ok': cancelled['status'] == 'cancelled' and after_cancel['in_flight'] == 0,
+                'disconnect_ok': after_disconnect['pending'] == 0 and after_disconnect['in_flight'] == 0
+                                 and reused['status'] == 'ok',
+                'vector_ok': vector['status'] == 'ok' and vector_unsupported['status'] == 'error',
+                'metrics': metrics,
+            }
+
+        return await asyncio.get_running_loop().run_in_executor(None, scenario)
+    finally:
+        await server.close()
+
+
+def self_check(n_workers: int = 2) -> Dict:
+    return asyncio.run(_self_check_async(n_workers))
+
+
+if __name__ == "__main__":
+    # python src/solve_server.py serve [port | unix:/tmp/solver.sock]
+    # python src/solve_server.py solve data/input.json [algorithm] [port | unix:/tmp/solver.sock]
+    # python src/solve_server.py selfcheck
+    if len(sys.argv) < 2 or sys.argv[1] not in ('serve', 'solve', 'selfcheck'):
+        print("Usage: python src/solve_server.py <serve|solve|selfcheck> ...")
+        sys.exit(1)
+
+    def parse_address(arg: Optional[str]) -> Dict:
+        if arg is None:
+            return {}
+        if arg.startswith('unix:'):
+            return {'unix_path': arg[len('unix:'):]}
+        return {'port': int(arg)}
+
+    command = sys.argv[1]
+    if command == 'serve':
+        try:
+            asyncio.run(SolveServer(**parse_address(sys.argv[2] if len(sys.argv) > 2 else None)).serve_forever())
+        except KeyboardInterrupt:
+            pass
+    elif command == 'solve':
+        data = load_data(sys.argv[2])
+        algorithm = sys.argv[3] if len(sys.argv) > 3 else 'sa'
+        with SolveClient(**parse_address(sys.argv[4] if len(sys.argv) > 4 else None)) as client:
+            print(json.dumps(client.solve(data['kapasitas_kontainer'], data['barang'], algorithm=algorithm), indent=2))
+    else:
+        result = self_check()
+        print(json.dumps(result, indent=2))
+        sys.exit(0 if all(value for key, value in result.items() if key.endswith('_ok')) else 1)
@@ -0,0 +1,216 @@
+import math
+import numpy as np
+from typing import Dict, Iterable, Optional, Tuple
+
+
+class QuantileSketch:
+    """
+    Sketch kuantil dengan akurasi relatif (ala DDSketch)
+
+    Nilai dimasukkan ke bucket logaritmik dengan basis gamma = (1 + a) / (1 - a),
+    jadi setiap kuantil punya galat relatif paling besar a. Ukurannya hanya
+    bergantung pada rentang nilai (bukan jumlah data) dan dua sketch bisa
+    digabung dengan menjumlahkan isi bucket.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.positive: Dict[int, int] = {}
+        self.negative: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def _key(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, key: int) -> float:
+        return 2 * self.gamma ** key / (self.gamma + 1)
+
+    def add(self, value: float, weight: int = 1):
+        if value > 0:
+            key = self._key(value)
+            self.positive[key] = self.positive.get(key, 0) + weight
+        elif value < 0:
+            key = self._key(-value)
+            self.negative[key] = self.negative.get(key, 0) + weight
+        else:
+            self.zero_count += weight
+        self.count += weight
+
+    def add_many(self, values: np.ndarray):
+        """Tambah banyak nilai sekaligus (kunci bucket dihitung vektorial)"""
+        for store, magnitudes in ((self.positive, values[values > 0]), (self.negative, -values[values < 0])):
+            if len(magnitudes) == 0:
+                continue
+            keys, counts = np.unique(np.ceil(np.log(magnitudes) / self._log_gamma).astype(np.int64), return_counts=True)
+            for key, count in zip(keys.tolist(), counts.tolist()):
+                store[key] = store.get(key, 0) + count
+        self.zero_count += int((values == 0).sum())
+        self.count += len(values)
+
+    def merge(self, other: 'QuantileSketch'):
+        if other.gamma != self.gamma:
+            raise ValueError("Sketch hanya bisa digabung dengan relative_accuracy yang sama")
+        for key, count in other.positive.items():
+            self.positive[key] = self.positive.get(key, 0) + count
+        for key, count in other.negative.items():
+            self.negative[key] = self.negative.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+    def quantile(self, q: float) -> float:
+        """Perkiraan kuantil q (0..1)"""
+        if self.count == 0:
+            return float('nan')
+
+        rank = q * (self.count - 1)
+        seen = 0
+
+        # urutan naik: negatif terbesar (magnitudo) dulu, lalu nol, lalu positif
+        for key in sorted(self.negative, reverse=True):
+            seen += self.negative[key]
+            if seen > rank:
+                return -self._value(key)
+
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+
+        for key in sorted(self.positive):
+            seen += self.positive[key]
+            if seen > rank:
+                return self._value(key)
+
+        return self._value(max(self.positive)) if self.positive else 0.0
+
+
+class StreamingStatistics:
+    """
+    Agregator statistik streaming untuk hasil eksperimen multi-run
+
+    - mean/std lewat algoritma Welford (update satu per satu atau per batch)
+    - bisa digabung antar worker dengan kombinasi varians paralel (Chan et al.)
+    - kuantil lewat QuantileSketch
+    - confidence interval bootstrap untuk mean lewat Poisson bootstrap online:
+      tiap replika menerima setiap nilai dengan bobot Poisson(1), jadi tidak perlu
+      menyimpan data mentah
+
+    Contoh:
+        stats = StreamingStatistics()
+        stats.update(scores_batch)
+        stats.merge(stats_dari_worker_lain)
+        stats.summary()
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, bootstrap_replicates: int = 100, seed: Optional[int] = None):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+        self.sketch = QuantileSketch(relative_accuracy)
+
+        self._rng = np.random.default_rng(seed)
+        self._boot_weight = np.zeros(bootstrap_replicates)
+        self._boot_sum = np.zeros(bootstrap_replicates)
+
+    def add(self, value: float):
+        """Tambah satu hasil (Welford)"""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.sketch.add(value)
+
+        weights = self._rng.poisson(1.0, len(self._boot_weight))
+        self._boot_weight += weights
+        self._boot_sum += weights * value
+
+    def update(self, values: Iterable[float]):
+        """Tambah satu batch hasil sekaligus (vektorial, lalu digabung dengan rumus Chan)"""
+        batch = np.asarray(list(values) if not isinstance(values, np.ndarray) else values, dtype=float)
+        if len(batch) == 0:
+            return
+
+        batch_mean = float(batch.mean())
+        batch_m2 = float(((batch - batch_mean) ** 2).sum())
+        self._combine(len(batch), batch_mean, batch_m2)
+
+        self.min = min(self.min, float(batch.min()))
+        self.max = max(self.max, float(batch.max()))
+        self.sketch.add_many(batch)
+
+        # bobot bootstrap dibangkitkan per potongan supaya matriks bobot tetap kecil
+        for start in range(0, len(batch), 4096):
+            piece = batch[start:start + 4096]
+            weights = self._rng.poisson(1.0, (len(self._boot_weight), len(piece)))
+            self._boot_weight += weights.sum(axis=1)
+            self._boot_sum += weights @ piece
+
+    def _combine(self, count: int, mean: float, m2: float):
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self._m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+
+    def merge(self, other: 'StreamingStatistics') -> 'StreamingStatistics':
+        """Gabungkan agregator dari worker lain ke agregator ini"""
+        if other.count == 0:
+            return self
+        if len(other._boot_weight) != len(self._boot_weight):
+            raise ValueError("Jumlah replika bootstrap harus sama untuk digabung")
+
+        self._combine(other.count, other.mean, other._m2)
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.sketch.merge(other.sketch)
+        self._boot_weight += other._boot_weight
+        self._boot_sum += other._boot_sum
+        return self
+
+    @property
+    def variance(self) -> float:
+        """Varians populasi (sama dengan calculate_statistics)"""
+        return self._m2 / self.count if self.count > 0 else float('nan')
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance) if self.count > 0 else float('nan')
+
+    def quantile(self, q: float) -> float:
+        """Perkiraan kuantil (dibatasi ke [min, max] yang eksak)"""
+        if self.count == 0:
+            return float('nan')
+        return min(max(self.sketch.quantile(q), self.min), self.max)
+
+    def bootstrap_ci(self, confidence: float = 0.95) -> Tuple[float, float]:
+        """Confidence interval bootstrap (persentil) untuk mean"""
+        valid = self._boot_weight > 0
+        if not valid.any():
+            return float('nan'), float('nan')
+        means = self._boot_sum[valid] / self._boot_weight[valid]
+        tail = (1 - confidence) / 2 * 100
+        low, high = np.percentile(means, [tail, 100 - tail])
+        return float(low), float(high)
+
+    def summary(self, quantiles: Tuple[float, ...] = (0.5, 0.9, 0.99), confidence: float = 0.95) -> Dict:
+        """Ringkasan statistik (key mean/min/max/std sama dengan calculate_statistics)"""
+        ci_low, ci_high = self.bootstrap_ci(confidence)
+        result = {
+            'count': self.count,
+            'mean': self.mean,
+            'min': self.min,
+            'max': self.max,
+            'std': self.std,
+            'ci_low': ci_low,
+            'ci_high': ci_high,
+        }
+        for q in quantiles:
+            result[f'p{q * 100:g}'] = self.quantile(q)
+        return result
@@ -0,0 +1,303 @@
+import os
+import sys
+import json
+import math
+import time
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Tuple, Optional
+from bin_packing import make_bin_packing
+from decomposition import run_algorithm_result
+from utils import load_data
+from solution_cache import instance_fingerprint
+
+# Ruang parameter per algoritma: nama -> (tipe, batas bawah, batas atas)
+# 'log' = sampling log-uniform, 'float' = uniform, 'int' = integer uniform
+PARAMETER_SPACES = {
+    'sa': {
+        'T_initial': ('log', 10.0, 5000.0),
+        'alpha': ('float', 0.9, 0.9999),
+        'T_min': ('log', 0.01, 1.0),
+    },
+    'ga': {
+        'population_size': ('int', 10, 100),
+        'mutation_rate': ('float', 0.01, 0.5),
+        'crossover_rate': ('float', 0.5, 1.0),
+    },
+}
+
+# Parameter yang tidak di-tune tapi ikut dikirim ke algoritma
+FIXED_PARAMETERS = {
+    'sa': {'max_iterations': 1000},
+    'ga': {'generations': 100},
+}
+
+
+def sample_configuration(space: Dict[str, Tuple]) -> Dict:
+    """Ambil satu konfigurasi acak dari ruang parameter"""
+    config = {}
+    for name, (kind, low, high) in space.items():
+        if kind == 'log':
+            config[name] = math.exp(random.uniform(math.log(low), math.log(high)))
+        elif kind == 'int':
+            config[name] = random.randint(low, high)
+        else:
+            config[name] = random.uniform(low, high)
+    return config
+
+
+def _evaluate(task: Tuple) -> Tuple[float, int, float, List[float]]:
+    """
+    Worker: jalankan satu konfigurasi pada satu instance dengan seed tertentu
+
+    Returns:
+        skor, jumlah kontainer, waktu (detik), history skor solver
+    """
+    kapasitas, barang, algorithm, params, seed = task
+    random.seed(seed)
+    start = time.perf_counter()
+    bp = make_bin_packing(kapasitas, barang)
+    result = run_algorithm_result(bp, algorithm, params)
+    state = result[0]
+    return bp.objective(state), len(state), time.perf_counter() - start, list(result[2])
+
+
+def _rank_block(scores: List[float]) -> List[float]:
+    """Ranking satu blok (1 = terbaik), nilai seri mendapat rata-rata ranking"""
+    order = sorted(range(len(scores)), key=lambda i: scores[i])
+    ranks = [0.0] * len(scores)
+    pos = 0
+    while pos < len(order):
+        end = pos
+        while end + 1 < len(order) and scores[order[end + 1]] == scores[order[pos]]:
+            end += 1
+        for k in range(pos, end + 1):
+            ranks[order[k]] = (pos + end) / 2.0 + 1
+        pos = end + 1
+    return ranks
+
+
+def _chi2_sf(x: float, dof: int) -> float:
+    """P(X > x) untuk distribusi chi-kuadrat (lewat deret gamma tak lengkap)"""
+    if x <= 0:
+        return 1.0
+    a, z = dof / 2.0, x / 2.0
+    term = total = 1.0 / a
+    k = 1
+    while term > total * 1e-12 and k < 1000:
+        term *= z / (a + k)
+        total += term
+        k += 1
+    lower = total * math.exp(-z + a * math.log(z) - math.lgamma(a))
+    return max(0.0, 1.0 - lower)
+
+
+def _betainc(a: float, b: float, x: float) -> float:
+    """Fungsi beta tak lengkap teregularisasi I_x(a, b) (continued fraction, metode Lentz)"""
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    if x > (a + 1.0) / (a + b + 2.0):
+        # continued fraction konvergen cepat hanya di sisi ini
+        return 1.0 - _betainc(b, a, 1.0 - x)
+
+    front = math.exp(math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) + a * math.log(x) + b * math.log(1.0 - x)) / a
+    tiny = 1e-300
+    c, d = 1.0, 1.0 - (a + b) * x / (a + 1.0)
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    total = d
+    for m in range(1, 300):
+        for numerator in (m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+                          -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1))):
+            d = 1.0 + numerator * d
+            d = 1.0 / (d if abs(d) > tiny else tiny)
+            c = 1.0 + numerator / c
+            c = c if abs(c) > tiny else tiny
+            total *= c * d
+        if abs(c * d - 1.0) < 1e-14:
+            break
+    return front * total
+
+
+def _t_cdf(t: float, dof: float) -> float:
+    """P(T <= t) untuk distribusi Student-t"""
+    tail = 0.5 * _betainc(dof / 2.0, 0.5, dof / (dof + t * t))
+    return 1.0 - tail if t >= 0 else tail
+
+
+def _t_quantile(p: float, dof: float) -> float:
+    """Kuantil distribusi Student-t (bisection pada _t_cdf), untuk 0.5 <= p < 1"""
+    low, high = 0.0, 1.0
+    while _t_cdf(high, dof) < p:
+        high *= 2.0
+    for _ in range(100):
+        mid = (low + high) / 2.0
+        if _t_cdf(mid, dof) < p:
+            low = mid
+        else:
+            high = mid
+        if high - low < 1e-10:
+            break
+    return (low + high) / 2.0
+
+
+def friedman_eliminate(results: List[List[float]], alpha: float = 0.05) -> List[int]:
+    """
+    Uji Friedman + post-hoc Conover ala F-race
+
+    Args:
+        results: results[blok][konfigurasi] = skor (semakin rendah semakin baik)
+
+    Returns:
+        Indeks konfigurasi yang TIDAK signifikan lebih buruk dari yang terbaik
+    """
+    num_blocks, k = len(results), len(results[0])
+    if k < 2 or num_blocks < 2:
+        return list(range(k))
+
+    ranks = [_rank_block(block) for block in results]
+    rank_sums = [sum(block[j] for block in ranks) for j in range(k)]
+    sum_sq_ranks = sum(r * r for block in ranks for r in block)
+    correction = num_blocks * k * (k + 1) ** 2 / 4.0
+
+    denominator = sum_sq_ranks - correction
+    if denominator <= 0:
+        # semua seri
+        return list(range(k))
+
+    statistic = (k - 1) * sum((r - num_blocks * (k + 1) / 2.0) ** 2 for r in rank_sums) / denominator
+    if _chi2_sf(statistic, k - 1) >= alpha:
+        return list(range(k))
+
+    # Post-hoc: bandingkan tiap konfigurasi dengan yang terbaik (kuantil t Conover)
+    dof = (num_blocks - 1) * (k - 1)
+    spread = 2 * (num_blocks * sum_sq_ranks - sum(r * r for r in rank_sums)) / dof
+    critical = _t_quantile(1 - alpha / 2, dof) * math.sqrt(max(spread, 0.0))
+
+    best = min(rank_sums)
+    return [j for j in range(k) if rank_sums[j] - best <= critical]
+
+
+def race(
+    algorithm: str,
+    instances: List[Tuple[int, Dict[str, int]]],
+    num_configurations: int = 20,
+    max_experiments: int = 400,
+    min_blocks: int = 5,
+    alpha: float = 0.05,
+    n_workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    store=None
+) -> Tuple[Dict, float, int]:
+    """
+    Racing ala irace/F-race untuk parameter SA atau GA
+
+    Konfigurasi diambil acak dari PARAMETER_SPACES. Setiap "blok" adalah satu
+    instance (dipakai bergiliran dengan seed baru) di mana semua konfigurasi yang
+    masih bertahan dijalankan paralel di process pool. Setelah min_blocks blok,
+    konfigurasi yang signifikan lebih buruk (Friedman + Conover) dibuang.
+
+    Args:
+        algorithm: 'sa' atau 'ga'
+        instances: List (kapasitas, barang) untuk training
+        num_configurations: Jumlah konfigurasi awal
+        max_experiments: Budget total jumlah run
+        min_blocks: Jumlah blok minimum sebelum eliminasi pertama
+        alpha: Tingkat signifikansi
+        n_workers: Jumlah worker process
+        seed: Seed random
+        store: ResultsStore opsional, setiap run dicatat (fingerprint, parameter, seed, skor, history)
+
+    Returns:
+        best_config, mean_score, experiments_used
+    """
+    if algorithm not in PARAMETER_SPACES:
+        raise ValueError(f"algorithm tidak bisa di-tune: {algorithm}")
+
+    if seed is not None:
+        random.seed(seed)
+
+    configs = [sample_configuration(PARAMETER_SPACES[algorithm]) for _ in range(num_configurations)]
+    alive = list(range(len(configs)))
+    results = []  # results[blok][indeks konfigurasi asli]
+    experiments = 0
+    block = 0
+
+    with ProcessPoolExecutor(max_workers=n_workers or os.cpu_count() or 1) as executor:
+        while len(alive) > 1 and experiments + len(alive) <= max_experiments:
+            kapasitas, barang = instances[block % len(instances)]
+            run_seed = random.randrange(2**31)
+            tasks = [(kapasitas, barang, algorithm, {**FIXED_PARAMETERS[algorithm], **configs[j]}, run_seed)
+                     for j in alive]
+
+            outcomes = list(executor.map(_evaluate, tasks))
+            scores = {j: outcome[0] for j, outcome in zip(alive, outcomes)}
+            results.append(scores)
+            if store is not None:
+                fingerprint = instance_fingerprint(kapasitas, barang)
+                for task, (score, num_bins, elapsed, history) in zip(tasks, outcomes):
+                    store.add_run(fingerprint, algorithm, task[3], run_seed, score, num_bins, elapsed, history)
+            experiments += len(alive)
+            block += 1
+
+            if block >= min_blocks:
+                table = [[row[j] for j in alive] for row in results]
+                survivors = friedman_eliminate(table, alpha)
+                alive = [alive[pos] for pos in survivors]
+
+    mean_scores = {j: sum(row[j] for row in results) / len(results) for j in alive} if results else {alive[0]: float('inf')}
+    best = min(alive, key=lambda j: mean_scores[j])
+    return configs[best], mean_scores[best], experiments
+
+
+def tune_families(
+    algorithm: str,
+    families: Dict[str, List[str]],
+    output_path: str = 'results/tuned_profiles.json',
+    **race_kwargs
+) -> Dict:
+    """
+    Jalankan race untuk tiap keluarga instance dan simpan profil parameter ke JSON
+
+    Args:
+        families: nama keluarga -> list path instance JSON (schema kapasitas_kontainer/barang)
+        output_path: Berkas profil (entry yang sudah ada untuk algoritma lain dipertahankan)
+
+    Returns:
+        Isi profil setelah diperbarui
+    """
+    profiles = load_data(output_path) if os.path.exists(output_path) else {}
+
+    for family, paths in families.items():
+        instances = []
+        for path in paths:
+            data = load_data(path)
+            instances.append((data['kapasitas_kontainer'], {item['id']: item['ukuran'] for item in data['barang']}))
+
+        config, mean_score, experiments = race(algorithm, instances, **race_kwargs)
+        profiles.setdefault(family, {})[algorithm] = {
+            'params': {**FIXED_PARAMETERS[algorithm], **config},
+            'mean_score': mean_score,
+            'experiments': experiments
+        }
+
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    with open(output_path, 'w') as f:
+        json.dump(profiles, f, indent=2)
+
+    return profiles
+
+
+def load_profile(path: str, family: str, algorithm: str) -> Dict:
+    """Ambil parameter hasil tuning untuk keluarga instance dan algoritma tertentu"""
+    return load_data(path)[family][algorithm]['params']
+
+
+if __name__ == "__main__":
+    # python src/tuner.py sa results/tuned_profiles.json data/input.json [data/lain.json ...]
+    if len(sys.argv) < 4:
+        print("Usage: python src/tuner.py <sa|ga> <output.json> <instance.json> [...]")
+        sys.exit(1)
+    result = tune_families(sys.argv[1], {'default': sys.argv[3:]}, sys.argv[2])
+    print(json.dumps(result, indent=2))
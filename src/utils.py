@@ -1,6 +1,8 @@
 import json
+import re
 import time
-from typing import List, Dict, Tuple
+from array import array
+from typing import List, Dict, Tuple, Optional, Callable
 import os
 
 def load_data(filepath: str) -> Dict:
@@ -8,6 +10,170 @@ def load_data(filepath: str) -> Dict:
     with open(filepath, 'r') as f:
         return json.load(f)
 
+_WHITESPACE = re.compile(r'[ \t\r\n]*')
+# ukuran barang maksimum di stream_load_data (rentang int64 array('q'))
+_MAX_SIZE = (1 << 63) - 1
+
+class _JSONStream:
+    """
+    Pembaca JSON bertahap: buffer kecil yang diisi ulang per chunk dari file
+    Satu nilai (misal satu entry barang) paling panjang max_value_chars karakter,
+    jadi input rusak tidak membuat buffer tumbuh sebesar seluruh file
+    """
+    
+    def __init__(self, f, chunk_size: int, max_value_chars: int = 1 << 20):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.max_value_chars = max_value_chars
+        self.decoder = json.JSONDecoder()
+        self.buf = ''
+        self.pos = 0
+        self.chars_read = 0
+        self.eof = False
+    
+    def fill(self) -> bool:
+        """Tambah satu chunk ke buffer (buang bagian yang sudah diproses)"""
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.chars_read += len(chunk)
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+    
+    def peek(self) -> str:
+        """Karakter non-whitespace berikutnya ('' kalo file habis)"""
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf) or not self.fill():
+                break
+        return self.buf[self.pos] if self.pos < len(self.buf) else ''
+    
+    def expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"JSON tidak valid: diharapkan '{char}', ditemukan '{found}' (posisi ~{self.chars_read})")
+        self.pos += 1
+    
+    def next_element(self, close: str) -> bool:
+        """
+        Setelah satu elemen array/objek: True kalo ada ',' (elemen berikutnya menyusul),
+        False kalo sudah di penutup `close`. Selain itu (koma hilang, koma di akhir) error
+        """
+        found = self.peek()
+        if found == close:
+            return False
+        if found != ',':
+            raise ValueError(f"JSON tidak valid: diharapkan ',' atau '{close}', ditemukan '{found}' (posisi ~{self.chars_read})")
+        self.pos += 1
+        if self.peek() == close:
+            raise ValueError(f"JSON tidak valid: koma sebelum '{close}' (posisi ~{self.chars_read})")
+        return True
+    
+    def value(self):
+        """Decode satu nilai JSON lengkap mulai dari posisi saat ini"""
+        self.peek()
+        while True:
+            try:
+                obj, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                self._check_bound()
+                if not self.fill():
+                    raise
+                continue
+            # angka di ujung buffer bisa saja terpotong, baca lagi untuk memastikan
+            if end == len(self.buf):
+                self._check_bound()
+                if self.fill():
+                    continue
+            self.pos = end
+            return obj
+    
+    def _check_bound(self):
+        if len(self.buf) - self.pos > self.max_value_chars:
+            raise ValueError(f"JSON tidak valid: tidak ada nilai lengkap dalam {self.max_value_chars} karakter "
+                             f"(posisi ~{self.chars_read})")
+
+
+def stream_load_data(filepath: str, include_ids: bool = True, progress: Optional[Callable[[int, int], None]] = None,
+                     progress_every: int = 100000, chunk_size: int = 1 << 16,
+                     max_value_chars: int = 1 << 20) -> Tuple[int, array, Optional[List[str]]]:
+    """
+    Membaca instance JSON (kapasitas_kontainer/barang) secara streaming
+    
+    Array barang diproses item per item: ukuran langsung ditulis ke array('q')
+    dan divalidasi saat dibaca, jadi memori puncak sebanding dengan array output,
+    bukan dengan seluruh pohon objek JSON seperti json.load.
+    
+    Args:
+        filepath: Path berkas JSON
+        include_ids: Simpan juga daftar id item
+        progress: Callback progress(jumlah_item, jumlah_karakter_terbaca)
+        progress_every: Interval (jumlah item) pemanggilan progress
+        chunk_size: Ukuran chunk baca (karakter)
+        max_value_chars: Panjang maksimum satu nilai JSON (selain array barang)
+    
+    Returns:
+        kapasitas, sizes (array('q')), ids (atau None)
+    """
+    kapasitas = None
+    sizes = array('q')
+    ids = [] if include_ids else None
+    
+    with open(filepath, 'r', encoding='utf-8') as f:
+        stream = _JSONStream(f, chunk_size, max_value_chars)
+        stream.expect('{')
+        
+        more = stream.peek() != '}'
+        while more:
+            key = stream.value()
+            if not isinstance(key, str):
+                raise ValueError(f"JSON tidak valid: key objek harus string, ditemukan {key!r}")
+            stream.expect(':')
+            
+            if key == 'barang':
+                stream.expect('[')
+                more_items = stream.peek() != ']'
+                while more_items:
+                    item = stream.value()
+                    _validate_item(item, len(sizes))
+                    sizes.append(item['ukuran'])
+                    if ids is not None:
+                        ids.append(item['id'])
+                    
+                    if progress is not None and len(sizes) % progress_every == 0:
+                        progress(len(sizes), stream.chars_read)
+                    
+                    more_items = stream.next_element(']')
+                stream.expect(']')
+            else:
+                value = stream.value()
+                if key == 'kapasitas_kontainer':
+                    kapasitas = value
+            
+            more = stream.next_element('}')
+        stream.expect('}')
+    
+    if not isinstance(kapasitas, int) or isinstance(kapasitas, bool) or kapasitas <= 0:
+        raise ValueError(f"kapasitas_kontainer tidak valid: {kapasitas!r}")
+    
+    if progress is not None and len(sizes) % progress_every != 0:
+        progress(len(sizes), stream.chars_read)
+    
+    return kapasitas, sizes, ids
+
+
+def _validate_item(item, index: int):
+    """Validasi satu entry barang saat streaming"""
+    if not isinstance(item, dict) or 'id' not in item or 'ukuran' not in item:
+        raise ValueError(f"barang[{index}] harus berupa objek dengan field 'id' dan 'ukuran'")
+    size = item['ukuran']
+    if not isinstance(size, int) or isinstance(size, bool) or size <= 0 or size > _MAX_SIZE:
+        raise ValueError(f"barang[{index}] ({item['id']}): ukuran tidak valid {size!r}")
+
 def save_result(filename: str, result: Dict):
     """menyimpan hasil eksperimen ke berkas JSON"""
     os.makedirs('results', exist_ok=True)
@@ -38,10 +204,14 @@ def print_state(state: List[List[str]], kapasitas: int, barang: Dict[str, int]):
             print(f"  - {item} ({barang[item]})")
 
 def calculate_statistics(results: List[float]) -> Dict:
-    """menghitung statistik dari beberapa percobaan"""
+    """
+    menghitung statistik dari beberapa percobaan
+    untuk hasil yang sangat banyak / dari banyak worker, pakai streaming_stats.StreamingStatistics
+    """
+    mean = sum(results) / len(results)
     return {
-        'mean': sum(results) / len(results),
+        'mean': mean,
         'min': min(results),
         'max': max(results),
-        'std': (sum((x - sum(results)/len(results))**2 for x in results) / len(results))**0.5
+        'std': (sum((x - mean)**2 for x in results) / len(results))**0.5
     }
\ No newline at end of file
@@ -0,0 +1,228 @@
+import random
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from bin_packing import BinPacking
+from objective_function import objective_from_totals
+from neighbor_sampler import NeighborSampler
+
+
+def vector_objective(loads: np.ndarray, kapasitas: np.ndarray) -> float:
+    """
+    Nilai objektif dari matriks load (kontainer x dimensi)
+
+    Overflow dan ruang terbuang dihitung per dimensi lalu dijumlahkan, jadi untuk
+    d = 1 hasilnya identik dengan calculate_objective.
+    """
+    if len(loads) == 0:
+        return float('inf')
+    total_overflow = int(np.maximum(loads - kapasitas, 0).sum())
+    wasted_space = int(np.maximum(kapasitas - loads, 0).sum())
+    return objective_from_totals(len(loads), total_overflow, wasted_space)
+
+
+class VectorBinPacking(BinPacking):
+    """
+    Bin packing vektor (d dimensi, misal berat dan volume)
+
+    - kapasitas: vektor (d,)
+    - sizes: matriks ukuran item (n x d), barang[item] adalah baris matriks ini
+    - load kontainer: matriks (kontainer x d)
+    Item muat kalo SEMUA dimensi muat. Cek feasibility, objektif dan delta move
+    dihitung dengan operasi NumPy di semua dimensi sekaligus.
+
+    Interface sama dengan BinPacking (initial state, get_neighbors,
+    get_random_neighbor, objective, neighbor_sampler), jadi HC, SA dan GA
+    berjalan tanpa perubahan.
+    """
+
+    vector = True
+
+    def __init__(self, kapasitas: Sequence[int], barang: Dict[str, Sequence[int]],
+                 dimensi: Optional[Sequence[str]] = None):
+        """
+        Args:
+            kapasitas: Kapasitas kontainer per dimensi
+            barang: Dictionary item_id -> ukuran per dimensi
+            dimensi: Nama dimensi (opsional, misal ['berat', 'volume'])
+        """
+        kapasitas = np.asarray(kapasitas, dtype=np.int64).reshape(-1)
+        item_ids = list(barang)
+        sizes = np.asarray([barang[item] for item in item_ids], dtype=np.int64)
+        if sizes.ndim != 2 or sizes.shape[1] != len(kapasitas):
+            raise ValueError(f"ukuran barang harus berdimensi {len(kapasitas)} seperti kapasitas_kontainer")
+        if dimensi is not None and len(dimensi) != len(kapasitas):
+            raise ValueError(f"jumlah nama dimensi ({len(dimensi)}) tidak sama dengan dimensi kapasitas ({len(kapasitas)})")
+
+        super().__init__(kapasitas, {item: sizes[idx] for idx, item in enumerate(item_ids)})
+        self.sizes = sizes
+        self.rows = {item: idx for idx, item in enumerate(item_ids)}
+        self.dimensi = list(dimensi) if dimensi is not None else [f'dim{k}' for k in range(len(kapasitas))]
+
+    @property
+    def num_dimensions(self) -> int:
+        return len(self.kapasitas)
+
+    def bin_loads(self, state: Sequence[Sequence[str]]) -> np.ndarray:
+        """Matriks load (kontainer x dimensi) untuk seluruh state"""
+        rows = [self.rows[item] for bin_items in state for item in bin_items]
+        bin_index = np.repeat(np.arange(len(state)), [len(bin_items) for bin_items in state])
+        loads = np.zeros((len(state), self.num_dimensions), dtype=np.int64)
+        np.add.at(loads, bin_index, self.sizes[rows])
+        return loads
+
+    def get_bin_size(self, bin_items: Sequence[str]) -> np.ndarray:
+        """Load satu kontainer (vektor per dimensi)"""
+        return self.sizes[[self.rows[item] for item in bin_items]].sum(axis=0)
+
+    def fits(self, load: np.ndarray) -> bool:
+        return bool(np.all(load <= self.kapasitas))
+
+    def _can_fit(self, bin_items: Sequence[str], item: str) -> bool:
+        return bool(np.all(self.get_bin_size(bin_items) + self.barang[item] <= self.kapasitas))
+
+    def objective(self, state: Sequence[Sequence[str]]) -> float:
+        return vector_objective(self.bin_loads(state), self.kapasitas)
+
+    def is_valid(self, state: List[List[str]]) -> bool:
+        """Cek apakah state valid (tidak overflow di dimensi manapun, semua item ada)"""
+        if np.any(self.bin_loads(state) > self.kapasitas):
+            return False
+        all_items = set()
+        for bin_items in state:
+            all_items.update(bin_items)
+        return all_items == set(self.item_ids)
+
+    def initial_state_best_fit(self) -> List[List[str]]:
+        """Best Fit: kontainer yang muat dengan sisa kapasitas total (semua dimensi) terkecil"""
+        state = []
+        loads = np.zeros((0, self.num_dimensions), dtype=np.int64)
+
+        for item in self.item_ids:
+            after = loads + self.barang[item]
+            fits = np.all(after <= self.kapasitas, axis=1)
+            if fits.any():
+                remaining = np.where(fits, (self.kapasitas - after).sum(axis=1), np.iinfo(np.int64).max)
+                best = int(np.argmin(remaining))
+                state[best].append(item)
+                loads[best] = after[best]
+            else:
+                state.append([item])
+                loads = np.vstack([loads, self.barang[item]])
+
+        return state
+
+    def get_size_index(self):
+        raise ValueError("indeks ukuran hanya ada untuk instance 1 dimensi")
+
+    def neighbor_sampler(self, state: Sequence[Sequence[str]]) -> 'VectorNeighborSampler':
+        return VectorNeighborSampler(self, state)
+
+
+class VectorNeighborSampler(NeighborSampler):
+    """
+    NeighborSampler untuk VectorBinPacking
+
+    Load disimpan sebagai matriks (kontainer x dimensi) dalam buffer NumPy
+    (paling banyak satu kontainer per item, jadi buffer tidak pernah di-resize).
+    Kontainer tujuan yang muat dicari dengan satu operasi vektor atas seluruh
+    matriks load; evaluasi dan penerapan move memakai method NeighborSampler,
+    hanya suku per kontainer (_load_terms) dan pemeliharaan load yang diganti.
+    """
+
+    def __init__(self, bp: VectorBinPacking, state: Sequence[Sequence[str]], max_swap_attempts: int = 16):
+        self.bp = bp
+        self.kapasitas = bp.kapasitas
+        self.max_swap_attempts = max_swap_attempts
+
+        self.bins = [tuple(bin_items) for bin_items in state]
+        self.location = {}
+        for idx, bin_items in enumerate(self.bins):
+            for item in bin_items:
+                self.location[item] = idx
+        self.items = list(self.location)
+
+        self._buffer = np.zeros((len(self.items) + 1, bp.num_dimensions), dtype=np.int64)
+        self._buffer[:len(self.bins)] = bp.bin_loads(self.bins)
+        self.loads = self._buffer[:len(self.bins)]
+
+        self.total_overflow = int(np.maximum(self.loads - self.kapasitas, 0).sum())
+        self.wasted_space = int(np.maximum(self.kapasitas - self.loads, 0).sum())
+
+    def _load_terms(self, load: np.ndarray) -> Tuple[int, int]:
+        """(overflow, ruang terbuang) satu kontainer, dijumlah di semua dimensi"""
+        return int(np.maximum(load - self.kapasitas, 0).sum()), int(np.maximum(self.kapasitas - load, 0).sum())
+
+    def balance_delta(self, move: Tuple) -> int:
+        return int(sum((new_load * new_load - old_load * old_load).sum()
+                       for _, old_load, new_load in self._load_changes(move)))
+
+    # ------------------------------------------------------------------
+    # Sampling
+    # ------------------------------------------------------------------
+
+    def _sample_dest_bin(self, size: np.ndarray, exclude: int) -> Optional[int]:
+        """Pilih random kontainer (selain exclude) yang muat di semua dimensi"""
+        fits = np.all(self.loads + size <= self.kapasitas, axis=1)
+        fits[exclude] = False
+        candidates = np.flatnonzero(fits)
+        if len(candidates) == 0:
+            return None
+        return int(candidates[random.randrange(len(candidates))])
+
+    def _sample_swap(self) -> Optional[Tuple]:
+        if len(self.bins) < 2:
+            return None
+
+        barang = self.bp.barang
+        for _ in range(self.max_swap_attempts):
+            item1 = random.choice(self.items)
+            item2 = random.choice(self.items)
+            bin1 = self.location[item1]
+            bin2 = self.location[item2]
+            if bin1 == bin2:
+                continue
+
+            diff = barang[item2] - barang[item1]
+            if np.all(self.loads[bin1] + diff <= self.kapasitas) and np.all(self.loads[bin2] - diff <= self.kapasitas):
+                return ('swap', item1, bin1, item2, bin2)
+
+        return None
+
+    # ------------------------------------------------------------------
+    # Pemeliharaan matriks load
+    # ------------------------------------------------------------------
+
+    def _load_changes(self, move: Tuple) -> List[Tuple[int, np.ndarray, np.ndarray]]:
+        # salin baris load lama: self.loads[idx] hanya view ke buffer (NEW_BIN: load lama 0)
+        return [(idx, np.array(old_load), new_load) for idx, old_load, new_load in super()._load_changes(move)]
+
+    def _set_load(self, idx: int, new_load: np.ndarray):
+        overflow, wasted = self._load_terms(self.loads[idx])
+        self.total_overflow -= overflow
+        self.wasted_space -= wasted
+        overflow, wasted = self._load_terms(new_load)
+        self.total_overflow += overflow
+        self.wasted_space += wasted
+        self.loads[idx] = new_load
+
+    def _open_bin(self) -> int:
+        idx = len(self.bins)
+        self.bins.append(())
+        self._buffer[idx] = 0
+        self.loads = self._buffer[:idx + 1]
+        self.wasted_space += int(self.kapasitas.sum())
+        return idx
+
+    def _close_bin(self, idx: int):
+        last = len(self.bins) - 1
+        self.wasted_space -= int((self.kapasitas - self.loads[idx]).sum())
+
+        if idx != last:
+            self.bins[idx] = self.bins[last]
+            self.loads[idx] = self.loads[last]
+            for item in self.bins[idx]:
+                self.location[item] = idx
+
+        self.bins.pop()
+        self.loads = self._buffer[:last]
+
@@ -1,12 +1,36 @@
 import matplotlib.pyplot as plt
+from matplotlib.collections import PolyCollection
 import numpy as np
-from typing import List, Dict
+from typing import List, Dict, Optional
 import os
+from downsample import lttb_downsample, minmax_envelope
 
-def plot_convergence(history: List[float], title: str, filename: str):
+# Riwayat yang lebih panjang dari ini otomatis di-downsample (LTTB) sebelum diplot
+DOWNSAMPLE_THRESHOLD = 5000
+
+
+def _plot_history(ax, history: List[float], max_points: Optional[int], envelope: bool, **kwargs):
+    """
+    Plot satu riwayat nilai ke ax
+    Kalo panjangnya melebihi max_points, yang diplot hasil LTTB (plus pita min/max
+    opsional), jadi waktu plot tetap konstan berapapun panjang run-nya
+    """
+    if max_points is None or len(history) <= max_points:
+        ax.plot(history, **kwargs)
+        return
+    
+    x, y = lttb_downsample(history, max_points)
+    line, = ax.plot(x, y, **kwargs)
+    
+    if envelope:
+        env_x, lower, upper = minmax_envelope(history, max_points // 2)
+        ax.fill_between(env_x, lower, upper, color=line.get_color(), alpha=0.15, linewidth=0)
+
+def plot_convergence(history: List[float], title: str, filename: str,
+                     max_points: Optional[int] = DOWNSAMPLE_THRESHOLD, envelope: bool = True):
     """Plot nilai fungsi objektif terhadap nilai iterasi"""
     plt.figure(figsize=(10, 6))
-    plt.plot(history, linewidth=2)
+    _plot_history(plt.gca(), history, max_points, envelope, linewidth=2)
     plt.xlabel('Iterasi', fontsize=12)
     plt.ylabel('Nilai Fungsi Objektif', fontsize=12)
     plt.title(title, fontsize=14, fontweight='bold')
@@ -18,10 +42,11 @@ def plot_convergence(history: List[float], title: str, filename: str):
     plt.close()
 
 
-def plot_sa_probability(probability_history: List[float], filename: str):
+def plot_sa_probability(probability_history: List[float], filename: str,
+                        max_points: Optional[int] = DOWNSAMPLE_THRESHOLD, envelope: bool = True):
     """Plot e^(ΔE/T) untuk Simulated Annealing"""
     plt.figure(figsize=(10, 6))
-    plt.plot(probability_history, linewidth=2, color='red')
+    _plot_history(plt.gca(), probability_history, max_points, envelope, linewidth=2, color='red')
     plt.xlabel('Iterasi', fontsize=12)
     plt.ylabel('Probabilitas Penerimaan e^(ΔE/T)', fontsize=12)
     plt.title('Simulated Annealing - Probabilitas Penerimaan', fontsize=14, fontweight='bold')
@@ -33,11 +58,12 @@ def plot_sa_probability(probability_history: List[float], filename: str):
     plt.close()
 
 
-def plot_ga_convergence(best_history: List[float], avg_history: List[float], title: str, filename: str):
+def plot_ga_convergence(best_history: List[float], avg_history: List[float], title: str, filename: str,
+                        max_points: Optional[int] = DOWNSAMPLE_THRESHOLD, envelope: bool = True):
     """Plot konvergensi GA dengan nilai terbaik dan rata-rata"""
     plt.figure(figsize=(10, 6))
-    plt.plot(best_history, label='Terbaik', linewidth=2, color='green')
-    plt.plot(avg_history, label='Rata-rata', linewidth=2, color='blue', alpha=0.7)
+    _plot_history(plt.gca(), best_history, max_points, envelope, label='Terbaik', linewidth=2, color='green')
+    _plot_history(plt.gca(), avg_history, max_points, envelope, label='Rata-rata', linewidth=2, color='blue', alpha=0.7)
     plt.xlabel('Generasi', fontsize=12)
     plt.ylabel('Nilai Fungsi Objektif', fontsize=12)
     plt.title(title, fontsize=14, fontweight='bold')
@@ -50,7 +76,8 @@ def plot_ga_convergence(best_history: List[float], avg_history: List[float], tit
     plt.close()
 
 
-def plot_hc_comparison(histories: Dict[str, List[float]], filename: str):
+def plot_hc_comparison(histories: Dict[str, List[float]], filename: str,
+                       max_points: Optional[int] = DOWNSAMPLE_THRESHOLD, envelope: bool = True):
     """Plot semua 4 varian Hill Climbing dalam satu figure dengan subplot 2x2"""
     fig, axes = plt.subplots(2, 2, figsize=(16, 12))
     fig.suptitle('Varian Hill Climbing - Perbandingan Konvergensi', fontsize=16, fontweight='bold')
@@ -70,7 +97,7 @@ def plot_hc_comparison(histories: Dict[str, List[float]], filename: str):
         
         if key in histories and len(histories[key]) > 0:
             history = histories[key]
-            ax.plot(history, linewidth=2, color=colors[idx])
+            _plot_history(ax, history, max_points, envelope, linewidth=2, color=colors[idx])
             ax.set_xlabel('Iterasi', fontsize=11)
             ax.set_ylabel('Nilai Fungsi Objektif', fontsize=11)
             ax.set_title(f'{title} Hill Climbing', fontsize=13, fontweight='bold')
@@ -98,31 +125,58 @@ def plot_hc_comparison(histories: Dict[str, List[float]], filename: str):
     plt.close()
 
 
-def visualize_bins(state: List[List[str]], kapasitas: int, barang: Dict[str, int], title: str, filename: str):
-    """Visualisasi kontainer sebagai bar horizontal"""
+def visualize_bins(state: List[List[str]], kapasitas: int, barang: Dict[str, int], title: str, filename: str,
+                   max_detailed_bins: int = 100, max_labeled_items: int = 300, dpi: int = 300, fmt: str = 'png'):
+    """
+    Visualisasi kontainer sebagai bar horizontal
+    
+    Semua kotak item digambar sebagai satu PolyCollection (bukan satu barh per item).
+    Kalo jumlah kontainer melebihi max_detailed_bins, otomatis pindah ke tampilan
+    agregat (histogram rasio isi + kurva load terurut) supaya waktu render dan
+    ukuran gambar tetap terbatas berapapun ukuran solusinya.
+    
+    Args:
+        max_detailed_bins: Batas jumlah kontainer untuk tampilan detail per item
+        max_labeled_items: Label id item hanya digambar kalo total item <= batas ini
+        dpi: Resolusi untuk format raster
+        fmt: Format file ('png', atau 'svg'/'pdf' untuk output vektor)
+    """
     if len(state) == 0:
         return
     
+    if len(state) > max_detailed_bins:
+        plot_bin_fill_summary(state, kapasitas, barang, title, filename, dpi=dpi, fmt=fmt)
+        return
+    
     fig, ax = plt.subplots(figsize=(12, max(6, len(state) * 0.5)))
     
     colors = plt.cm.Set3(np.linspace(0, 1, len(state)))
+    label_items = sum(len(bin_items) for bin_items in state) <= max_labeled_items
+    
+    capacity_boxes = []
+    item_boxes = []
+    item_colors = []
+    half_height = 0.4
     
     for i, bin_items in enumerate(state):
         bin_size = sum(barang[item] for item in bin_items)
         
-        # Gambar kapasitas kontainer
-        ax.barh(i, kapasitas, color='lightgray', alpha=0.3, edgecolor='black', linewidth=2)
+        # Kotak kapasitas kontainer
+        capacity_boxes.append([(0, i - half_height), (kapasitas, i - half_height),
+                               (kapasitas, i + half_height), (0, i + half_height)])
         
-        # Gambar item-item
+        # Kotak item-item
         cumulative = 0
         for item in bin_items:
             item_size = barang[item]
-            ax.barh(i, item_size, left=cumulative, color=colors[i], 
-                   edgecolor='black', linewidth=1)
+            item_boxes.append([(cumulative, i - half_height), (cumulative + item_size, i - half_height),
+                               (cumulative + item_size, i + half_height), (cumulative, i + half_height)])
+            item_colors.append(colors[i])
             
             # Tambahkan label item
-            ax.text(cumulative + item_size/2, i, item, 
-                   ha='center', va='center', fontsize=8, fontweight='bold')
+            if label_items:
+                ax.text(cumulative + item_size/2, i, item, 
+                       ha='center', va='center', fontsize=8, fontweight='bold')
             
             cumulative += item_size
         
@@ -131,15 +185,56 @@ def visualize_bins(state: List[List[str]], kapasitas: int, barang: Dict[str, int
         ax.text(kapasitas + 5, i, f'{bin_size}/{kapasitas} ({usage_percent:.1f}%)', 
                va='center', fontsize=10)
     
+    ax.add_collection(PolyCollection(capacity_boxes, facecolors='lightgray', alpha=0.3,
+                                     edgecolors='black', linewidths=2))
+    ax.add_collection(PolyCollection(item_boxes, facecolors=item_colors,
+                                     edgecolors='black', linewidths=1))
+    
     ax.set_yticks(range(len(state)))
     ax.set_yticklabels([f'Kontainer {i+1}' for i in range(len(state))])
     ax.set_xlabel('Kapasitas', fontsize=12)
     ax.set_title(title, fontsize=14, fontweight='bold')
     ax.set_xlim(0, kapasitas + 50)
+    ax.set_ylim(-0.5 - half_height, len(state) - 0.5 + half_height)
     plt.tight_layout()
     
     os.makedirs('results', exist_ok=True)
-    plt.savefig(f'results/{filename}.png', dpi=300, bbox_inches='tight')
+    plt.savefig(f'results/{filename}.{fmt}', dpi=dpi, bbox_inches='tight')
+    plt.close()
+
+
+def plot_bin_fill_summary(state: List[List[str]], kapasitas: int, barang: Dict[str, int], title: str, filename: str,
+                          dpi: int = 150, fmt: str = 'png'):
+    """Tampilan agregat untuk solusi dengan banyak kontainer: histogram rasio isi + kurva load terurut"""
+    loads = np.array([sum(barang[item] for item in bin_items) for bin_items in state], dtype=float)
+    fill_ratio = loads / kapasitas * 100
+    
+    fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+    fig.suptitle(f'{title} ({len(state)} kontainer)', fontsize=14, fontweight='bold')
+    
+    # Histogram rasio isi
+    axes[0].hist(fill_ratio, bins=min(50, max(10, len(state) // 20)), color='steelblue', edgecolor='black')
+    axes[0].set_xlabel('Rasio Isi Kontainer (%)', fontsize=12)
+    axes[0].set_ylabel('Jumlah Kontainer', fontsize=12)
+    axes[0].set_title('Distribusi Rasio Isi', fontsize=13)
+    axes[0].grid(True, alpha=0.3)
+    
+    # Kurva load terurut
+    axes[1].plot(np.sort(fill_ratio)[::-1], linewidth=2, color='darkgreen')
+    axes[1].axhline(100, color='red', linestyle='--', linewidth=1)
+    axes[1].set_xlabel('Kontainer (terurut)', fontsize=12)
+    axes[1].set_ylabel('Rasio Isi (%)', fontsize=12)
+    axes[1].set_title('Kurva Load Terurut', fontsize=13)
+    axes[1].grid(True, alpha=0.3)
+    
+    utilization = loads.sum() / (len(state) * kapasitas) * 100
+    axes[1].text(0.98, 0.05, f'Utilisasi: {utilization:.2f}%\nKontainer < 50%: {int((fill_ratio < 50).sum())}',
+                 transform=axes[1].transAxes, ha='right', va='bottom',
+                 bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5), fontsize=10)
+    
+    plt.tight_layout()
+    os.makedirs('results', exist_ok=True)
+    plt.savefig(f'results/{filename}.{fmt}', dpi=dpi)
     plt.close()
 
 
@@ -176,6 +271,98 @@ def plot_comparison(results: Dict, filename: str):
     plt.close()
 
 
+def plot_store_summary(store, filename: str, fingerprint: Optional[str] = None,
+                       max_points: Optional[int] = DOWNSAMPLE_THRESHOLD, envelope: bool = True):
+    """
+    Plot agregat per algoritma langsung dari ResultsStore (tanpa me-load semua run):
+    rata-rata skor (+- std), rata-rata kontainer dan waktu dari store.summary, plus
+    konvergensi run terbaik tiap algoritma dari history yang tersimpan.
+    Skor antar instance tidak sebanding, jadi biasanya difilter per fingerprint.
+    """
+    rows = store.summary(fingerprint)
+    algorithms = [row['algorithm'] for row in rows]
+    labels = [f"{row['algorithm']}\n(n={row['count']})" for row in rows]
+    
+    fig, axes = plt.subplots(1, 4, figsize=(22, 5))
+    
+    axes[0].bar(labels, [row['mean'] for row in rows], yerr=[row['std'] for row in rows], capsize=4, color='tab:blue')
+    axes[0].set_ylabel('Nilai Fungsi Objektif')
+    axes[0].set_title('Rata-rata Skor (± std)')
+    
+    axes[1].bar(labels, [row['mean_bins'] or 0 for row in rows], color='tab:green')
+    axes[1].set_ylabel('Jumlah Kontainer')
+    axes[1].set_title('Rata-rata Kontainer')
+    
+    axes[2].bar(labels, [row['mean_time'] or 0 for row in rows], color='tab:red')
+    axes[2].set_ylabel('Waktu (detik)')
+    axes[2].set_title('Rata-rata Waktu')
+    
+    for ax in axes[:3]:
+        ax.tick_params(axis='x', rotation=45)
+    
+    for algorithm in algorithms:
+        best = store.best(fingerprint, algorithm)
+        if best is not None and best['history']:
+            _plot_history(axes[3], best['history'], max_points, envelope, linewidth=2, label=algorithm)
+    axes[3].set_xlabel('Iterasi / Generasi')
+    axes[3].set_ylabel('Nilai Fungsi Objektif')
+    axes[3].set_title('Konvergensi Run Terbaik')
+    if axes[3].lines:
+        axes[3].legend(fontsize=9)
+    axes[3].grid(True, alpha=0.3)
+    
+    plt.tight_layout()
+    os.makedirs('results', exist_ok=True)
+    plt.savefig(f'results/{filename}.png', dpi=300)
+    plt.close()
+
+
+def plot_time_to_target(ecdfs: Dict[str, tuple], target: float, filename: str):
+    """Plot ECDF time-to-target tiap algoritma (probabilitas mencapai target vs waktu)"""
+    plt.figure(figsize=(10, 6))
+    for name, (times, probabilities) in ecdfs.items():
+        if len(times) > 0:
+            plt.step(times, probabilities, where='post', linewidth=2, label=name)
+        else:
+            plt.plot([], [], linewidth=2, label=f'{name} (tidak mencapai target)')
+    plt.xscale('symlog', linthresh=1e-3)
+    plt.xlabel('Waktu (detik)', fontsize=12)
+    plt.ylabel('P(mencapai target)', fontsize=12)
+    plt.title(f'Time-to-Target (target = {target:.2f})', fontsize=14, fontweight='bold')
+    plt.ylim(0, 1.05)
+    plt.legend(fontsize=10)
+    plt.grid(True, alpha=0.3)
+    plt.tight_layout()
+    
+    os.makedirs('results', exist_ok=True)
+    plt.savefig(f'results/{filename}.png', dpi=300)
+    plt.close()
+
+
+def plot_anytime_profiles(profiles: Dict[str, Dict[str, List[float]]], filename: str):
+    """Plot profil anytime (median + rentang kuartil skor incumbent) tiap algoritma"""
+    plt.figure(figsize=(10, 6))
+    for name, profile in profiles.items():
+        times = np.array(profile['time'])
+        median = np.array(profile['median'])
+        finite = np.isfinite(median) & np.isfinite(np.array(profile['q75']))
+        if not finite.any():
+            continue
+        line, = plt.step(times[finite], median[finite], where='post', linewidth=2, label=name)
+        plt.fill_between(times[finite], np.array(profile['q25'])[finite], np.array(profile['q75'])[finite],
+                         step='post', color=line.get_color(), alpha=0.15)
+    plt.xlabel('Waktu (detik)', fontsize=12)
+    plt.ylabel('Skor Incumbent', fontsize=12)
+    plt.title('Profil Anytime', fontsize=14, fontweight='bold')
+    plt.legend(fontsize=10)
+    plt.grid(True, alpha=0.3)
+    plt.tight_layout()
+    
+    os.makedirs('results', exist_ok=True)
+    plt.savefig(f'results/{filename}.png', dpi=300)
+    plt.close()
+
+
 def print_state_detailed(state: List[List[str]], kapasitas: int, barang: Dict[str, int], title: str = "State"):
     """Cetak informasi state secara detail"""
     print(f"\n{'='*60}")
@@ -0,0 +1,290 @@
+import random
+from itertools import combinations
+from bisect import bisect_left
+from typing import Iterator, List, Optional, Sequence, Tuple
+from bin_packing import BinPacking
+from neighbor_sampler import NeighborSampler
+from persistent_state import thaw
+from anytime import ImprovementTrace
+from progress import ProgressObserver
+
+# Tangga neighborhood, dari yang paling murah ke yang paling mahal
+NEIGHBORHOODS = ('move', 'swap', 'swap_2_1', 'swap_2_2')
+
+
+# ----------------------------------------------------------------------
+# Neighborhood (generator lazy, hanya menghasilkan move yang feasible)
+# ----------------------------------------------------------------------
+
+def _move_neighborhood(sampler: NeighborSampler, order: Sequence[int]) -> Iterator[Tuple]:
+    """Pindahkan satu item ke kontainer lain yang masih muat"""
+    barang = sampler.bp.barang
+    for src in order:
+        for item in sampler.bins[src]:
+            index = sampler._residual_index
+            for pos in range(bisect_left(index, (barang[item], -1)), len(index)):
+                dest = index[pos][1]
+                if dest != src:
+                    yield ('move', item, src, dest)
+
+
+def _swap_neighborhood(sampler: NeighborSampler, order: Sequence[int]) -> Iterator[Tuple]:
+    """Tukar satu item dengan satu item di kontainer lain"""
+    barang = sampler.bp.barang
+    kapasitas = sampler.kapasitas
+    for i, bin1 in enumerate(order):
+        for bin2 in order[i + 1:]:
+            residual1 = kapasitas - sampler.loads[bin1]
+            residual2 = kapasitas - sampler.loads[bin2]
+            for item1 in sampler.bins[bin1]:
+                for item2 in sampler.bins[bin2]:
+                    diff = barang[item2] - barang[item1]
+                    if diff != 0 and diff <= residual1 and -diff <= residual2:
+                        yield ('swap', item1, bin1, item2, bin2)
+
+
+def _swap_2_1_neighborhood(sampler: NeighborSampler, order: Sequence[int]) -> Iterator[Tuple]:
+    """Tukar dua item di satu kontainer dengan satu item di kontainer lain"""
+    barang = sampler.bp.barang
+    kapasitas = sampler.kapasitas
+    for bin1 in order:
+        for pair in combinations(sampler.bins[bin1], 2):
+            pair_size = barang[pair[0]] + barang[pair[1]]
+            for bin2 in order:
+                if bin2 == bin1:
+                    continue
+                residual1 = kapasitas - sampler.loads[bin1]
+                residual2 = kapasitas - sampler.loads[bin2]
+                for item in sampler.bins[bin2]:
+                    diff = barang[item] - pair_size
+                    if diff != 0 and diff <= residual1 and -diff <= residual2:
+                        yield ('exchange', pair, bin1, (item,), bin2)
+
+
+def _swap_2_2_neighborhood(sampler: NeighborSampler, order: Sequence[int]) -> Iterator[Tuple]:
+    """Tukar dua item di satu kontainer dengan dua item di kontainer lain"""
+    barang = sampler.bp.barang
+    kapasitas = sampler.kapasitas
+    for i, bin1 in enumerate(order):
+        pairs1 = [(barang[a] + barang[b], (a, b)) for a, b in combinations(sampler.bins[bin1], 2)]
+        if not pairs1:
+            continue
+        for bin2 in order[i + 1:]:
+            residual1 = kapasitas - sampler.loads[bin1]
+            residual2 = kapasitas - sampler.loads[bin2]
+            for size2, pair2 in ((barang[a] + barang[b], (a, b)) for a, b in combinations(sampler.bins[bin2], 2)):
+                for size1, pair1 in pairs1:
+                    diff = size2 - size1
+                    if diff != 0 and diff <= residual1 and -diff <= residual2:
+                        yield ('exchange', pair1, bin1, pair2, bin2)
+
+
+_GENERATORS = {
+    'move': _move_neighborhood,
+    'swap': _swap_neighborhood,
+    'swap_2_1': _swap_2_1_neighborhood,
+    'swap_2_2': _swap_2_2_neighborhood,
+}
+
+
+# ----------------------------------------------------------------------
+# VND
+# ----------------------------------------------------------------------
+
+def _first_improvement(sampler: NeighborSampler, neighborhood: str, current_score: float,
+                       trace: Optional[ImprovementTrace]) -> Tuple[Optional[Tuple], int]:
+    """
+    Telusuri neighborhood secara lazy (urutan kontainer random) dan berhenti di
+    move pertama yang memperbaiki: objektif turun, atau objektif sama dan jumlah
+    kuadrat load naik (lihat NeighborSampler.balance_delta)
+
+    Returns:
+        move (None kalo neighborhood sudah habis), jumlah move yang dievaluasi
+    """
+    order = list(range(len(sampler.bins)))
+    random.shuffle(order)
+
+    evaluated = 0
+    for move in _GENERATORS[neighborhood](sampler, order):
+        evaluated += 1
+        if trace is not None:
+            trace.count()
+        score = sampler.evaluate(move)
+        if score < current_score or (score == current_score and sampler.balance_delta(move) > 0):
+            return move, evaluated
+    return None, evaluated
+
+
+def _descend(sampler: NeighborSampler, neighborhoods: Sequence[str],
+             trace: Optional[ImprovementTrace]) -> Tuple[int, int]:
+    """
+    VND pada state sampler: mulai dari neighborhood pertama, naik ke neighborhood
+    berikutnya hanya kalo yang sekarang tidak punya move perbaikan, dan kembali ke
+    neighborhood pertama setiap kali ada perbaikan
+
+    Returns:
+        jumlah move yang diterapkan, jumlah move yang dievaluasi
+    """
+    score = sampler.score()
+    applied = 0
+    evaluations = 0
+    k = 0
+    while k < len(neighborhoods):
+        move, evaluated = _first_improvement(sampler, neighborhoods[k], score, trace)
+        evaluations += evaluated
+        if move is None:
+            k += 1
+            continue
+
+        sampler.apply(move)
+        applied += 1
+        new_score = sampler.score()
+        if new_score < score and trace is not None:
+            trace.improve(new_score)
+        score = new_score
+        k = 0
+    return applied, evaluations
+
+
+def _balance(sampler: NeighborSampler) -> int:
+    return sum(load * load for load in sampler.loads)
+
+
+def variable_neighborhood_descent(
+    bp: BinPacking,
+    initial_state: List[List[str]],
+    max_iterations: Optional[int] = None,
+    neighborhoods: Sequence[str] = NEIGHBORHOODS,
+    trace: Optional[ImprovementTrace] = None,
+    observer: Optional[ProgressObserver] = None
+) -> Tuple[List[List[str]], float, List[float], int]:
+    """
+    Variable Neighborhood Descent
+
+    Local search dengan tangga neighborhood: move, swap, swap 2-1, swap 2-2.
+    Tiap neighborhood dibangkitkan lazy dan berhenti di perbaikan pertama, jadi
+    neighborhood yang mahal hanya disentuh kalo yang murah sudah habis. Hasilnya
+    optimum lokal terhadap semua neighborhood sekaligus (setara kualitas steepest
+    ascent atau lebih baik) dengan evaluasi jauh lebih sedikit.
+
+    Args:
+        bp: Instance BinPacking
+        initial_state: State awal (valid)
+        max_iterations: Batas jumlah move perbaikan (default sampai optimum lokal)
+        neighborhoods: Urutan neighborhood yang dipakai (subset NEIGHBORHOODS)
+        trace: ImprovementTrace opsional
+        observer: ProgressObserver opsional
+
+    Returns:
+        best_state, best_score, history, iterations (jumlah move perbaikan)
+    """
+    if bp.vector:
+        raise ValueError("VND/VNS hanya mendukung instance 1 dimensi")
+    sampler = NeighborSampler(bp, initial_state)
+    score = sampler.score()
+    if trace is not None:
+        trace.count()
+        trace.improve(score)
+    if observer is not None:
+        observer.start('vnd')
+
+    history = [score]
+    iteration = 0
+    k = 0
+    while k < len(neighborhoods) and (max_iterations is None or iteration < max_iterations):
+        move, evaluated = _first_improvement(sampler, neighborhoods[k], score, trace)
+        if move is None:
+            k += 1
+            continue
+
+        sampler.apply(move)
+        new_score = sampler.score()
+        if new_score < score and trace is not None:
+            trace.improve(new_score)
+        score = new_score
+        history.append(score)
+        iteration += 1
+        k = 0
+        if observer is not None:
+            observer.update(iteration, score, evaluated, current=score)
+
+    if observer is not None:
+        observer.finish(iteration, score)
+    return thaw(sampler.snapshot()), score, history, iteration
+
+
+def variable_neighborhood_search(
+    bp: BinPacking,
+    initial_state: List[List[str]],
+    max_iterations: int = 100,
+    k_max: int = 3,
+    neighborhoods: Sequence[str] = NEIGHBORHOODS,
+    trace: Optional[ImprovementTrace] = None,
+    observer: Optional[ProgressObserver] = None
+) -> Tuple[List[List[str]], float, List[float], int]:
+    """
+    General Variable Neighborhood Search
+
+    Setiap iterasi: shaking (k move feasible random dari state terbaik), lalu VND.
+    Kalo hasilnya lebih baik (objektif, lalu jumlah kuadrat load sebagai
+    tie-breaker) state diterima dan k kembali ke 1; kalo tidak, kembali ke state
+    terbaik dan shaking diperbesar (k = 1..k_max, berputar).
+
+    Args:
+        bp: Instance BinPacking
+        initial_state: State awal (valid)
+        max_iterations: Jumlah iterasi shaking + VND
+        k_max: Kekuatan shaking maksimum (jumlah move random)
+        neighborhoods: Urutan neighborhood VND (subset NEIGHBORHOODS)
+        trace: ImprovementTrace opsional
+        observer: ProgressObserver opsional
+
+    Returns:
+        best_state, best_score, history (skor terbaik per iterasi), iterations
+    """
+    if bp.vector:
+        raise ValueError("VND/VNS hanya mendukung instance 1 dimensi")
+    sampler = NeighborSampler(bp, initial_state)
+    if trace is not None:
+        trace.count()
+        trace.improve(sampler.score())
+    if observer is not None:
+        observer.start('vns')
+
+    _, evaluations = _descend(sampler, neighborhoods, trace)
+    best_state = sampler.snapshot()
+    best_score = sampler.score()
+    best_balance = _balance(sampler)
+
+    history = [best_score]
+    k = 1
+    iteration = 0
+    while iteration < max_iterations:
+        # shaking: k move random dari state terbaik
+        for _ in range(k):
+            move = sampler.sample()
+            if move is not None:
+                sampler.apply(move)
+        if trace is not None:
+            trace.count(k)
+
+        _, evaluations = _descend(sampler, neighborhoods, trace)
+        score = sampler.score()
+        balance = _balance(sampler)
+
+        accepted = score < best_score or (score == best_score and balance > best_balance)
+        if accepted:
+            best_state, best_score, best_balance = sampler.snapshot(), score, balance
+            k = 1
+        else:
+            sampler = NeighborSampler(bp, best_state)
+            k = k % k_max + 1
+
+        history.append(best_score)
+        iteration += 1
+        if observer is not None:
+            observer.update(iteration, best_score, evaluations + k, current=score, accepted=accepted)
+
+    if observer is not None:
+        observer.finish(iteration, best_score)
+    return thaw(best_state), best_score, history, iteration